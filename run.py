@@ -1,8 +1,22 @@
 import argparse
 import logging
+import sys
 from pathlib import Path
 
-from project_generator.main import generate_project
+from project_generator.ImportMapping import ModuleLayout
+from project_generator.main import (
+    diff_projects,
+    generate_project
+)
+from project_generator.Metrics import MetricsCollector
+from project_generator.ModelValidator import ModelValidator
+from project_generator.Profiler import Profiler
+from project_generator.ProjectSerializer import ProjectSerializer
+from project_generator.TemplateManager import (
+    Emitter,
+    PackageInit
+)
+from project_generator.TypeMapping import TypeMapping
 
 
 def validate_xmi_path(input: str) -> Path:
@@ -12,6 +26,17 @@ def validate_xmi_path(input: str) -> Path:
     return xmi_path
 
 
+def parse_emit_target(input: str) -> tuple[Emitter, Path]:
+    emitter, separator, target_dir = input.partition("=")
+    if not separator or not target_dir:
+        raise argparse.ArgumentTypeError(f"Emit target: {input} is not KIND=DIR!")
+    try:
+        return Emitter(emitter), Path(target_dir)
+    except ValueError:
+        kinds = ", ".join(emitter.value for emitter in Emitter)
+        raise argparse.ArgumentTypeError(f"Emit target: unknown kind {emitter}, expected one of {kinds}!")
+
+
 def validate_output_dir(input: str) -> Path:
     output_dir = Path(input)
     if output_dir.exists() and output_dir.is_file():
@@ -23,8 +48,205 @@ def validate_output_dir(input: str) -> Path:
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
 
+    if sys.argv[1:2] == ["diff"]:
+        diff_parser = argparse.ArgumentParser(
+            prog=f"{Path(sys.argv[0]).name} diff",
+            description="Report added, removed and modified model elements by id",
+        )
+        diff_parser.add_argument("old_path", type=validate_xmi_path, help="Old XMI file or serialized model")
+        diff_parser.add_argument("new_path", type=validate_xmi_path, help="New XMI file or serialized model")
+        diff_parser.add_argument(
+            "--affected-files",
+            action="store_true",
+            help="Also list generated class files whose content changes, relative to the output dir",
+        )
+        diff_parser.add_argument(
+            "--fragment-cache",
+            type=Path,
+            default=None,
+            metavar="DIR",
+            help="Directory of parsed caches of XMI documents referenced via href",
+        )
+        diff_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+        diff_parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Parse top-level packages of the XMI files in separate processes",
+        )
+        diff_parser.add_argument("--expat", action="store_true", help="Parse the XMI files with expat")
+        diff_parser.add_argument(
+            "--type-mapping",
+            type=Path,
+            default=None,
+            metavar="MAPPING_PATH",
+            help="JSON or TOML file with a \"types\" table mapping model types to Python annotations",
+        )
+        diff_parser.add_argument(
+            "--layout",
+            type=ModuleLayout,
+            choices=list(ModuleLayout),
+            default=ModuleLayout.CLASS,
+            metavar="{" + ",".join(layout.value for layout in ModuleLayout) + "}",
+            help="Module layout of the generated files listed with --affected-files",
+        )
+        diff_args = diff_parser.parse_args(sys.argv[2:])
+        changes, affected_files = diff_projects(
+            diff_args.old_path,
+            diff_args.new_path,
+            fragment_cache=diff_args.fragment_cache,
+            workers=diff_args.workers,
+            parallel=diff_args.parallel,
+            expat=diff_args.expat,
+            type_mapping=TypeMapping.load(diff_args.type_mapping) if diff_args.type_mapping else None,
+            layout=diff_args.layout,
+        )
+        for change in changes:
+            print(change)
+        if diff_args.affected_files:
+            for file_path in affected_files:
+                print(file_path)
+        sys.exit(1 if changes else 0)
+
     parser = argparse.ArgumentParser(description="Nice description")
-    parser.add_argument("xmi_path", type=validate_xmi_path, help="Path to XMI file")
-    parser.add_argument('output_dir', type=validate_output_dir, help='Output dir')
+    parser.add_argument("xmi_path", type=validate_xmi_path, help="Path to XMI file (plain, gzip, bz2, xz or zip) or serialized model")
+    parser.add_argument('output_dir', type=Path, nargs="?", default=None, help='Output dir (not used with --check)')
+    parser.add_argument(
+        "--model-cache",
+        type=Path,
+        default=None,
+        help="Path to serialized model cache, reused while the XMI file is unchanged",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="Read the input through a memory mapping shared by hashing and parsing",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="STATS_PATH",
+        help="Dump cProfile statistics to STATS_PATH and log the slowest classes and packages",
+    )
+    parser.add_argument("--profile-top", type=int, default=10, help="Number of slowest classes and packages to log")
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        metavar="REPORT_PATH",
+        help="Write run metrics as JSON (or OpenMetrics text for .prom/.om/.txt paths)",
+    )
+    parser.add_argument(
+        "--fragment-cache",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Directory of parsed caches of XMI documents referenced via href",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Parse top-level packages of the XMI file in separate processes",
+    )
+    parser.add_argument(
+        "--expat",
+        action="store_true",
+        help="Parse the XMI file straight into syntax objects with expat, without an element tree",
+    )
+    parser.add_argument(
+        "--type-mapping",
+        type=Path,
+        default=None,
+        metavar="MAPPING_PATH",
+        help="JSON or TOML file with a \"types\" table mapping model types to Python annotations",
+    )
+    parser.add_argument(
+        "--package-init",
+        type=PackageInit,
+        choices=list(PackageInit),
+        default=PackageInit.NONE,
+        metavar="{" + ",".join(style.value for style in PackageInit) + "}",
+        help="Generate package __init__.py files: empty, importing (eager) or lazily re-exporting (lazy) "
+        "classes and subpackages",
+    )
+    parser.add_argument(
+        "--emit",
+        type=parse_emit_target,
+        action="append",
+        default=[],
+        metavar="KIND=DIR",
+        help="Also generate " + ", ".join(emitter.value for emitter in Emitter if emitter != Emitter.PLAIN)
+        + " output into DIR in the same run, may be repeated",
+    )
+    parser.add_argument(
+        "--slots",
+        action="store_true",
+        help="Declare the fields of generated classes as __slots__ (slotted dataclass DTOs)",
+    )
+    parser.add_argument(
+        "--lazy-compositions",
+        action="store_true",
+        help="Create composed objects on first access instead of in the constructor of generated classes",
+    )
+    parser.add_argument(
+        "--layout",
+        type=ModuleLayout,
+        choices=list(ModuleLayout),
+        default=ModuleLayout.CLASS,
+        metavar="{" + ",".join(layout.value for layout in ModuleLayout) + "}",
+        help="Write one module per class (class) or all classes of a package into its __init__.py (package)",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Leave output files whose content did not change untouched, they keep their modification time",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only validate the XMI model and report problems, nothing is generated",
+    )
     args = parser.parse_args()
-    generate_project(xmi_path=args.xmi_path, output_dir=args.output_dir)
+    type_mapping = TypeMapping.load(args.type_mapping) if args.type_mapping else None
+
+    if args.check:
+        if ProjectSerializer.is_model_file(args.xmi_path):
+            parser.error("--check requires an XMI file, not a serialized model")
+        problems = ModelValidator.validate(args.xmi_path, type_mapping)
+        for problem in problems:
+            logging.error(problem)
+        logging.info(f"{len(problems)} problem(s) found in {args.xmi_path}")
+        sys.exit(1 if problems else 0)
+    if args.output_dir is None:
+        parser.error("the following arguments are required: output_dir")
+    try:
+        output_dir = validate_output_dir(str(args.output_dir))
+        targets = {emitter: validate_output_dir(str(target_dir)) for emitter, target_dir in args.emit}
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+
+    profiler = Profiler(cprofile=True) if args.profile else None
+    metrics = MetricsCollector(args.metrics) if args.metrics else None
+    generate_project(
+        xmi_path=args.xmi_path,
+        output_dir=output_dir,
+        model_cache=args.model_cache,
+        use_mmap=args.mmap,
+        profiler=profiler,
+        metrics=metrics,
+        fragment_cache=args.fragment_cache,
+        workers=args.workers,
+        parallel=args.parallel,
+        type_mapping=type_mapping,
+        package_init=args.package_init,
+        expat=args.expat,
+        targets=targets,
+        slots=args.slots,
+        lazy_compositions=args.lazy_compositions,
+        layout=args.layout,
+        skip_unchanged=args.skip_unchanged,
+    )
+    if profiler is not None:
+        profiler.dump_stats(args.profile)
+        logging.info(profiler.report(args.profile_top))
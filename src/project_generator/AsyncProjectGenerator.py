@@ -0,0 +1,194 @@
+import asyncio
+from concurrent.futures import Executor
+from pathlib import Path
+
+from project_generator.FileWriter import FileWriter
+from project_generator.ImportMapping import ModuleLayout
+from project_generator.Metrics import MetricsCollector
+from project_generator.ProjectGenerator import ProjectGenerator
+from project_generator.syntax import (
+    Package,
+    Project
+)
+from project_generator.TemplateManager import (
+    Emitter,
+    PackageInit,
+    TemplateManager
+)
+from project_generator.TypeMapping import TypeMapping
+
+
+class AsyncProjectGenerator:
+    """Module responsible for generating the project structure and files from asyncio code.
+
+    Generation runs as a pipeline of stages connected with bounded queues: packages are
+    queued for rendering, rendered files are queued for writing. Rendering and writing
+    run in the executor, so the event loop only schedules work, and a full queue
+    suspends the previous stage until the next one catches up. Many generations can
+    share one executor.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        root_dir: Path,
+        executor: Executor | None = None,
+        queue_size: int = 16,
+        render_tasks: int = 4,
+        metrics: MetricsCollector | None = None,
+        type_mapping: TypeMapping | None = None,
+        package_init: PackageInit = PackageInit.NONE,
+        targets: dict[Emitter, Path] | None = None,
+        slots: bool = False,
+        lazy_compositions: bool = False,
+        layout: ModuleLayout = ModuleLayout.CLASS,
+        skip_unchanged: bool = False,
+    ) -> None:
+        """
+        Args:
+            project: Project syntax object.
+            root_dir: Root directory where the project will be generated.
+            executor: Thread pool running blocking work, the loop default executor if None.
+            queue_size: Capacity of each queue between the stages.
+            render_tasks: Number of packages rendered concurrently.
+            metrics: Collector of written and skipped files and render cache statistics.
+            type_mapping: Mapping of model types to Python annotations.
+            package_init: Content of generated package __init__.py files.
+            targets: Root directories of additional outputs by emitter, rendered by the same stages.
+            slots: Whether classes declare their fields as __slots__ (slotted dataclass DTOs).
+            lazy_compositions: Whether compositions of classes are created on first access.
+            layout: Grouping of classes into modules.
+            skip_unchanged: Whether files already existing with the same content are left untouched.
+        """
+        self._project = project
+        self._root_dir = root_dir
+        self._executor = executor
+        self._queue_size = queue_size
+        self._render_tasks = render_tasks
+        self._type_mapping = type_mapping
+        self._metrics = metrics
+        self._package_init = package_init
+        self._slots = slots
+        self._lazy_compositions = lazy_compositions
+        self._layout = layout
+        self._targets = [(Emitter.PLAIN, root_dir)] + list((targets or {}).items())
+        self._writer = FileWriter(
+            on_file=metrics.record_file if metrics else None,
+            skip_unchanged=skip_unchanged,
+            on_skip=metrics.record_skipped_file if metrics else None,
+        )
+
+    async def generate(self) -> None:
+        """Generates the project, files are complete when the coroutine returns."""
+        loop = asyncio.get_running_loop()
+        template_managers = await loop.run_in_executor(
+            self._executor,
+            ProjectGenerator.create_template_managers,
+            self._project,
+            self._targets,
+            None,
+            self._type_mapping,
+            self._slots,
+            self._lazy_compositions,
+            self._layout,
+        )
+        relations_by_client = ProjectGenerator.index_relations(self._project)
+        layout = ProjectGenerator.package_layout(self._root_dir / self._project.name, self._project.packages)
+        for template_manager, (_, target_root) in zip(template_managers, self._targets):
+            target_layout = ProjectGenerator.package_layout(target_root / self._project.name, self._project.packages)
+            package_inits = await loop.run_in_executor(
+                self._executor,
+                ProjectGenerator.package_inits,
+                template_manager,
+                self._project,
+                target_root,
+                target_layout,
+                self._package_init,
+                self._layout,
+            )
+            await loop.run_in_executor(
+                self._executor,
+                self._writer.create_directories,
+                [package_path for package_path, _ in target_layout]
+                + [init_path.parent for init_path, _ in package_inits],
+            )
+            await loop.run_in_executor(self._executor, self._write_files, package_inits)
+
+        render_queue: asyncio.Queue[tuple[Path, Package] | None] = asyncio.Queue(self._queue_size)
+        write_queue: asyncio.Queue[list[tuple[Path, bytes]] | None] = asyncio.Queue(self._queue_size)
+
+        async def produce() -> None:
+            for item in layout:
+                await render_queue.put(item)
+            for _ in range(self._render_tasks):
+                await render_queue.put(None)
+
+        async def render() -> None:
+            while (item := await render_queue.get()) is not None:
+                files = await loop.run_in_executor(
+                    self._executor, self._render_package, template_managers, relations_by_client, *item
+                )
+                await write_queue.put(files)
+
+        async def write() -> None:
+            while (files := await write_queue.get()) is not None:
+                await loop.run_in_executor(self._executor, self._write_files, files)
+
+        async with asyncio.TaskGroup() as stages:
+            writer = stages.create_task(write())
+            async with asyncio.TaskGroup() as renderers:
+                renderers.create_task(produce())
+                for _ in range(self._render_tasks):
+                    renderers.create_task(render())
+            await write_queue.put(None)
+            await writer
+        if self._metrics is not None:
+            self._metrics.record_render_cache(
+                sum(template_manager.cache_hits for template_manager in template_managers),
+                sum(template_manager.cache_misses for template_manager in template_managers),
+            )
+
+    def _render_package(
+        self,
+        template_managers: list[TemplateManager],
+        relations_by_client: dict,
+        package_path: Path,
+        package: Package,
+    ) -> list[tuple[Path, bytes]]:
+        """Renders all classes or the module of a package for every target, runs in the executor.
+
+        Args:
+            template_managers: Template managers of the targets.
+            relations_by_client: Map of client class name to its relations.
+            package_path: Path to the package directory of the plain classes.
+            package: Package syntax object.
+        Returns:
+            List of (file path, content).
+        """
+        package_dir = package_path.relative_to(self._root_dir)
+        if self._layout == ModuleLayout.PACKAGE:
+            return [
+                (
+                    target_root / package_dir / f"__init__{template_manager.file_suffix}",
+                    template_manager.generate_module(package.classes, relations_by_client).encode(),
+                )
+                for template_manager, (_, target_root) in zip(template_managers, self._targets)
+                if package.classes
+            ]
+        return [
+            (
+                target_root / package_dir / f"{class_syntax.name}{template_manager.file_suffix}",
+                template_manager.generate_class(class_syntax, relations_by_client.get(class_syntax.name, [])).encode(),
+            )
+            for class_syntax in package.classes
+            for template_manager, (_, target_root) in zip(template_managers, self._targets)
+        ]
+
+    def _write_files(self, files: list[tuple[Path, bytes]]) -> None:
+        """Writes rendered files, runs in the executor.
+
+        Args:
+            files: List of (file path, content).
+        """
+        for file_path, content in files:
+            self._writer.write(file_path, content)
@@ -0,0 +1,532 @@
+from contextlib import nullcontext
+
+from project_generator.exceptions import NonMappedClass
+from project_generator.ImportMapping import (
+    ImportMapping,
+    ModuleLayout
+)
+from project_generator.ir import (
+    ClassIR,
+    FieldIR,
+    FieldKind,
+    MethodIR,
+    ParameterIR
+)
+from project_generator.Profiler import Profiler
+from project_generator.syntax import (
+    Class,
+    Operation,
+    Package,
+    ParameterDirection,
+    Project,
+    Relation,
+    RelationType,
+    Visibility
+)
+from project_generator.TypeMapping import TypeMapping
+
+
+class ClassIRBuilder:
+    """Module responsible for building the intermediate representation of generated classes.
+
+    All decisions about the generated code are made here: base classes, resolved Python
+    types, constructor parameter names and their deduplication, field initialization,
+    method signatures and imports. Emitters only format the resulting ClassIR objects,
+    one builder is shared by all emitters of a project.
+
+    With slots enabled a class declares its fields as __slots__, except fields already
+    slotted by its generalization or realization bases. Python rejects a class with more
+    than one base adding slots, so the secondary bases of classes with several bases and
+    all their ancestors keep a __dict__ only, like classes whose fields are named like
+    their methods.
+
+    With lazy compositions the composed instances are created on first access instead of
+    in the constructor, so constructing an object does not build its composition tree.
+
+    With the package module layout classes import nothing from their own module, which
+    defines them in module_order().
+    """
+
+    _field_kinds = {
+        RelationType.ASSOCIATION: FieldKind.ASSOCIATION,
+        RelationType.AGGREGATION: FieldKind.AGGREGATION,
+        RelationType.COMPOSITION: FieldKind.COMPOSITION,
+    }
+
+    def __init__(
+        self,
+        project: Project,
+        profiler: Profiler | None = None,
+        type_mapping: TypeMapping | None = None,
+        slots: bool = False,
+        lazy_compositions: bool = False,
+        layout: ModuleLayout = ModuleLayout.CLASS,
+    ) -> None:
+        """
+        Args:
+            project: Project syntax object.
+            profiler: Profiler measuring import mapping.
+            type_mapping: Mapping of model types to Python annotations, defaults from Config if None.
+            slots: Whether classes declare their fields as __slots__.
+            lazy_compositions: Whether compositions are created on first access.
+            layout: Grouping of classes into modules.
+        """
+        self._type_mapping = type_mapping or TypeMapping()
+        # Import paths are relative to the output root, so the IR can be rendered into any root
+        with profiler.phase("import_mapping") if profiler else nullcontext():
+            self._import_mapping = ImportMapping(project, None, layout)
+        self._package_layout = layout == ModuleLayout.PACKAGE
+        # Type references may be ids of type elements, resolved with the project table
+        self._type_names: dict[str, str] = dict(project.types)
+        self._slots = slots
+        self._composition_kind = FieldKind.LAZY_COMPOSITION if lazy_compositions else FieldKind.COMPOSITION
+        # Class name -> (class, relations where it is the client), needed to resolve slots of bases
+        self._classes: dict[str, tuple[Class, list[Relation]]] = {}
+        self._unslotted: set[str] = set()
+        self._inherited_slots: dict[str, frozenset[str]] = {}
+        if slots:
+            self._index_classes(project)
+
+    def build(self, class_syntax: Class, relations_for_class: list[Relation]) -> ClassIR:
+        """Builds the intermediate representation of a class.
+
+        Args:
+            class_syntax: Class syntax object.
+            relations_for_class: Relations where this class is the client.
+        Returns:
+            ClassIR of the class.
+        """
+        fields = self._get_fields(class_syntax, relations_for_class)
+        imports = self._get_imports(class_syntax, relations_for_class)
+        runtime_classes = self._get_runtime_classes(relations_for_class)
+        return ClassIR(
+            name=class_syntax.name,
+            bases=self._get_base_classes(relations_for_class),
+            imports=imports,
+            fields=fields,
+            methods=tuple(self._get_method(operation) for operation in class_syntax.operations),
+            slots=self._get_slots(class_syntax, fields),
+            type_checking_imports=tuple(
+                (import_path, class_name) for import_path, class_name in imports if class_name not in runtime_classes
+            ),
+        )
+
+    def build_project(self, project: Project, relations_by_client: dict[str, list[Relation]]) -> dict[str, ClassIR]:
+        """Builds the intermediate representation of all classes in one pass over the project.
+
+        Args:
+            project: Project syntax object.
+            relations_by_client: Map of client class name to its relations.
+        Returns:
+            Map of class id to its ClassIR, in model order.
+        """
+        classes: dict[str, ClassIR] = {}
+
+        def visit_package(package: Package) -> None:
+            for class_syntax in package.classes:
+                classes[class_syntax.id] = self.build(class_syntax, relations_by_client.get(class_syntax.name, []))
+            for subpackage in package.subpackages:
+                visit_package(subpackage)
+
+        for package in project.packages:
+            visit_package(package)
+        return classes
+
+    def shape(self, class_syntax: Class, relations_for_class: list[Relation]) -> tuple:
+        """Collects everything the ClassIR of a class depends on except its name.
+
+        Args:
+            class_syntax: Class syntax object.
+            relations_for_class: Relations where this class is the client.
+        Returns:
+            Hashable tuple identifying the shape of the class.
+        """
+        type_names = self._type_names
+        return (
+            tuple(
+                (prop.name, type_names.get(prop.type, prop.type), prop.visibility.value)
+                for prop in class_syntax.properties
+            ),
+            tuple(
+                (
+                    operation.name,
+                    operation.visibility.value,
+                    tuple(
+                        (parameter.name, type_names.get(parameter.type, parameter.type), parameter.direction.value)
+                        for parameter in operation.parameters
+                    ),
+                )
+                for operation in class_syntax.operations
+            ),
+            tuple(
+                (relation.type.value, type_names.get(relation.supplier, relation.supplier))
+                for relation in relations_for_class
+            ),
+            # Slots also depend on the bases and on the class being used as a secondary base
+            (
+                class_syntax.name not in self._unslotted,
+                tuple(sorted(self._get_inherited_slots(class_syntax.name))),
+            ) if self._slots else None,
+            # Imports from the own module are left out with the package layout
+            self._get_module(class_syntax.name) if self._package_layout else None,
+        )
+
+    def module_order(self, classes: list[Class], relations_by_client: dict[str, list[Relation]]) -> list[Class]:
+        """Orders classes of one module so that each class follows the classes it needs at definition time.
+
+        Bases and composed classes of the same module come first, other classes keep their
+        model order. Dependency cycles, possible only through compositions, are broken at the
+        class reached first.
+
+        Args:
+            classes: Class syntax objects of the module in model order.
+            relations_by_client: Map of client class name to its relations.
+        Returns:
+            Classes in definition order.
+        """
+        classes_by_name = {class_syntax.name: class_syntax for class_syntax in classes}
+        ordered: list[Class] = []
+        visited: set[str] = set()
+
+        def visit(class_syntax: Class) -> None:
+            visited.add(class_syntax.name)
+            for relation in relations_by_client.get(class_syntax.name, []):
+                if relation.type not in (
+                    RelationType.GENERALIZATION,
+                    RelationType.REALIZATION,
+                    RelationType.COMPOSITION,
+                ):
+                    continue
+                supplier = self._get_type_name(relation.supplier)
+                if supplier in classes_by_name and supplier not in visited:
+                    visit(classes_by_name[supplier])
+            ordered.append(class_syntax)
+
+        for class_syntax in classes:
+            if class_syntax.name not in visited:
+                visit(class_syntax)
+        return ordered
+
+    def _index_classes(self, project: Project) -> None:
+        """Indexes classes with their relations and collects classes which cannot declare slots.
+
+        Args:
+            project: Project syntax object.
+        """
+        relations_by_client: dict[str, list[Relation]] = {}
+
+        def visit_package(package: Package) -> None:
+            for class_syntax in package.classes:
+                relations_for_class = relations_by_client.setdefault(class_syntax.name, [])
+                self._classes[class_syntax.name] = (class_syntax, relations_for_class)
+            for relation in package.dependencies:
+                relations_by_client.setdefault(self._get_type_name(relation.client), []).append(relation)
+            for subpackage in package.subpackages:
+                visit_package(subpackage)
+
+        for package in project.packages:
+            visit_package(package)
+
+        # Only the first base of a class may add slots, the others and their ancestors keep a __dict__
+        pending = [
+            base
+            for _, relations_for_class in self._classes.values()
+            for base in self._get_base_classes(relations_for_class)[1:]
+        ]
+        while pending:
+            if (class_name := pending.pop()) in self._unslotted:
+                continue
+            self._unslotted.add(class_name)
+            if class_name in self._classes:
+                pending += self._get_base_classes(self._classes[class_name][1])
+
+    def _get_slots(self, class_syntax: Class, fields: tuple[FieldIR, ...]) -> tuple[str, ...] | None:
+        """Resolves the attribute names the class declares in __slots__.
+
+        Python rejects slots named like a class attribute, so a class whose field slots
+        clash with its methods or lazy composition properties keeps a __dict__ only.
+
+        Args:
+            class_syntax: Class syntax object.
+            fields: Fields of the class in constructor order.
+        Returns:
+            Names of the field slots not declared by the bases, None if the class declares no slots.
+        """
+        if not self._slots or class_syntax.name in self._unslotted:
+            return None
+        inherited_slots = self._get_inherited_slots(class_syntax.name)
+        slots = tuple(
+            slot
+            for slot in (
+                f"{field.name}_value" if field.kind == FieldKind.LAZY_COMPOSITION else field.name for field in fields
+            )
+            if slot not in inherited_slots
+        )
+        class_attributes = {
+            self._get_python_name(operation.name, operation.visibility) for operation in class_syntax.operations
+        } | {field.name for field in fields if field.kind == FieldKind.LAZY_COMPOSITION}
+        if class_attributes.intersection(slots):
+            return None
+        return slots
+
+    def _get_inherited_slots(self, class_name: str) -> frozenset[str]:
+        """Collects the slots declared by the bases of a class and their ancestors.
+
+        Args:
+            class_name: Name of the class.
+        Returns:
+            Set of inherited slot names, bases outside the model contribute none.
+        """
+        if (inherited_slots := self._inherited_slots.get(class_name)) is not None:
+            return inherited_slots
+        # Guards against generalization cycles in invalid models
+        self._inherited_slots[class_name] = frozenset()
+        names: set[str] = set()
+        if class_name in self._classes:
+            for base in self._get_base_classes(self._classes[class_name][1]):
+                if base not in self._classes:
+                    continue
+                base_syntax, base_relations = self._classes[base]
+                names.update(self._get_slots(base_syntax, self._get_fields(base_syntax, base_relations)) or ())
+                names |= self._get_inherited_slots(base)
+        self._inherited_slots[class_name] = frozenset(names)
+        return self._inherited_slots[class_name]
+
+    def _get_base_classes(self, relations_for_class: list[Relation]) -> tuple[str, ...]:
+        """Returns base class names for generalization/realization.
+
+        Args:
+            relations_for_class: Relations where this class is the client.
+        Returns:
+            Tuple of base class names.
+        """
+        bases: list[str] = []
+        for relation in relations_for_class:
+            if relation.type in (
+                RelationType.GENERALIZATION,
+                RelationType.REALIZATION,
+            ):
+                if (supplier := self._get_type_name(relation.supplier)) not in bases:
+                    bases.append(supplier)
+        return tuple(bases)
+
+    def _get_imports(self, class_syntax: Class, relations_for_class: list[Relation]) -> tuple[tuple[str, str], ...]:
+        """Resolves import paths of the classes used by the class.
+
+        Args:
+            class_syntax: Class syntax object.
+            relations_for_class: Relations where this class is the client.
+        Returns:
+            Sorted tuple of (import path relative to the output root, class name), classes
+            without import path are skipped.
+        """
+        used_classes: set[str] = set(self._get_used_classes(class_syntax))
+
+        # Process all relations - add imports for all types used in relations
+        for relation in relations_for_class:
+            if relation.type in (
+                RelationType.ASSOCIATION,
+                RelationType.AGGREGATION,
+                RelationType.COMPOSITION,
+                RelationType.GENERALIZATION,
+                RelationType.REALIZATION,
+            ):
+                used_classes.update(self._type_mapping.referenced_classes(self._get_type_name(relation.supplier)))
+            # Note: DEPENDENCY relations don't require imports in constructor,
+            # but if the type is used elsewhere, it will be caught by _get_used_classes
+
+        own_module = self._get_module(class_syntax.name) if self._package_layout else None
+        imports = []
+        for used_class in sorted(used_classes):
+            try:
+                import_path = self._import_mapping.get_import_path(used_class)
+            except NonMappedClass:
+                continue
+            if import_path != own_module:
+                imports.append((import_path, used_class))
+        return tuple(imports)
+
+    def _get_runtime_classes(self, relations_for_class: list[Relation]) -> set[str]:
+        """Collects the classes used when the class is defined or constructed.
+
+        Args:
+            relations_for_class: Relations where this class is the client.
+        Returns:
+            Names of the classes referenced by the bases and compositions, classes used only
+            in annotations are left out.
+        """
+        return {
+            class_name
+            for relation in relations_for_class
+            if relation.type in (
+                RelationType.GENERALIZATION,
+                RelationType.REALIZATION,
+                RelationType.COMPOSITION,
+            )
+            for class_name in self._type_mapping.referenced_classes(self._get_type_name(relation.supplier))
+        }
+
+    def _get_module(self, class_name: str) -> str | None:
+        """Gets the module defining a class.
+
+        Args:
+            class_name: Name of the class.
+        Returns:
+            Import path of the module relative to the output root, None for classes outside the model.
+        """
+        try:
+            return self._import_mapping.get_import_path(class_name)
+        except NonMappedClass:
+            return None
+
+    def _get_used_classes(self, class_syntax: Class) -> list[str]:
+        """Gets a list of class names used by the given class syntax.
+
+        Args:
+            class_syntax: Class syntax object.
+        Returns:
+            List of used class names.
+        """
+        return [
+            class_name
+            for typed_syntax in (
+                class_syntax.properties
+                + [
+                    parameter
+                    for operation in class_syntax.operations
+                    for parameter in operation.parameters
+                ]
+            )
+            if (type_name := self._get_type_name(typed_syntax.type))
+            and not type_name.startswith("uml:")  # Filter out meta-types
+            for class_name in self._type_mapping.referenced_classes(type_name)
+        ]
+
+    def _get_fields(self, class_syntax: Class, relations_for_class: list[Relation]) -> tuple[FieldIR, ...]:
+        """Resolves the attributes assigned in the constructor, ensuring unique parameter names.
+
+        - normal properties,
+        - association / aggregation parameters,
+        - composition created inside.
+
+        Args:
+            class_syntax: Class syntax object.
+            relations_for_class: Relations where this class is the client.
+        Returns:
+            Tuple of fields in constructor order.
+        """
+        fields: list[FieldIR] = []
+        used_param_names: set[str] = set()
+
+        for prop in class_syntax.properties:
+            # Default type to "Integer" if empty
+            prop_type = prop.type if prop.type else "Integer"
+            # Private: self._priv = priv, public: self.pub = pub
+            fields.append(
+                FieldIR(
+                    name=self._get_python_name(prop.name, prop.visibility),
+                    parameter=prop.name,
+                    type=self._get_type_string(prop_type),
+                    kind=FieldKind.PROPERTY,
+                )
+            )
+            used_param_names.add(prop.name)
+
+        # Every relation reserves a parameter name, even if it adds no field
+        for relation in relations_for_class:
+            supplier = self._get_type_name(relation.supplier) or "Ref"
+            base_param_name = supplier[0].lower() + supplier[1:] if supplier else "ref"
+            param_name = self._unique_name(base_param_name, used_param_names)
+
+            if (kind := self._field_kinds.get(relation.type)) is None:
+                continue
+            if kind == FieldKind.AGGREGATION:
+                param_name = self._unique_name(param_name + "s", used_param_names)
+            elif kind == FieldKind.COMPOSITION:
+                param_name = self._unique_name(param_name, used_param_names)
+                kind = self._composition_kind
+            fields.append(
+                FieldIR(
+                    name=f"_{param_name}",
+                    parameter="" if kind in (FieldKind.COMPOSITION, FieldKind.LAZY_COMPOSITION) else param_name,
+                    type=self._get_type_string(supplier),
+                    kind=kind,
+                )
+            )
+        return tuple(fields)
+
+    def _get_method(self, operation: Operation) -> MethodIR:
+        """Resolves the signature of a method.
+
+        Args:
+            operation: Operation syntax object.
+        Returns:
+            MethodIR with the in parameters and the type of the first return parameter.
+        """
+        return_types = [
+            parameter.type
+            for parameter in operation.parameters
+            if parameter.direction == ParameterDirection.RETURN
+        ]
+        return MethodIR(
+            name=self._get_python_name(operation.name, operation.visibility),
+            parameters=tuple(
+                ParameterIR(parameter.name, self._get_type_string(parameter.type))
+                for parameter in operation.parameters
+                if parameter.direction == ParameterDirection.IN
+            ),
+            return_type=self._get_type_string(return_types[0] if return_types else "None"),
+        )
+
+    @staticmethod
+    def _unique_name(name: str, used_names: set[str]) -> str:
+        """Adds a counter to a name already in use and reserves it.
+
+        Args:
+            name: Preferred name.
+            used_names: Names in use, the returned name is added.
+        Returns:
+            Unique name.
+        """
+        unique_name = name
+        counter = 1
+        while unique_name in used_names:
+            unique_name = f"{name}{counter}"
+            counter += 1
+        used_names.add(unique_name)
+        return unique_name
+
+    @staticmethod
+    def _get_python_name(name: str, visibility: Visibility) -> str:
+        """Gets the Python name with underscore prefix for private members.
+
+        Args:
+            name: Original name.
+            visibility: Visibility of the property or operation.
+        Returns:
+            Name with underscore prefix if private, otherwise original name.
+        """
+        if visibility == Visibility.PRIVATE:
+            # Add underscore prefix if not already present
+            return name if name.startswith("_") else f"_{name}"
+        return name
+
+    def _get_type_name(self, type_reference: str) -> str:
+        """Gets the model name of a type referenced by id or by name.
+
+        Args:
+            type_reference: Id or name of the type.
+        Returns:
+            Name of the type element, the reference itself if it is not an id.
+        """
+        return self._type_names.get(type_reference, type_reference)
+
+    def _get_type_string(self, type_reference: str) -> str:
+        """Gets the string representation of a data type.
+
+        Args:
+            type_reference: Id or name of the data type.
+        Returns:
+            String representation of the data type.
+        """
+        return self._type_mapping.python_type(self._get_type_name(type_reference))
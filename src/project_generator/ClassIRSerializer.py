@@ -0,0 +1,125 @@
+import marshal
+import struct
+from pathlib import Path
+
+from project_generator.exceptions import (
+    InvalidModelFile,
+    UnsupportedModelVersion
+)
+from project_generator.ir import (
+    ClassIR,
+    FieldIR,
+    FieldKind,
+    MethodIR,
+    ParameterIR
+)
+
+
+class ClassIRSerializer:
+    """Module responsible for storing intermediate representations of classes.
+
+    The file starts with magic bytes and the format version, followed by a marshal
+    payload of the classes by id as nested tuples, field kinds are stored by ordinal.
+    Version 2 added the slots of the classes, version 3 their type checking imports.
+    """
+
+    magic = b"PGCLSIR\x00"
+    version = 3
+
+    _header = struct.Struct(">H")
+    _field_kinds = list(FieldKind)
+
+    @classmethod
+    def dump(cls, classes: dict[str, ClassIR], ir_path: Path) -> None:
+        """Serializes classes into a file.
+
+        Args:
+            classes: Map of class id to its ClassIR.
+            ir_path: Path to the file to write.
+        """
+        ir_path.write_bytes(cls.dumps(classes))
+
+    @classmethod
+    def dumps(cls, classes: dict[str, ClassIR]) -> bytes:
+        """Serializes classes into bytes.
+
+        Args:
+            classes: Map of class id to its ClassIR.
+        Returns:
+            Serialized classes.
+        """
+        kinds = {kind: ordinal for ordinal, kind in enumerate(cls._field_kinds)}
+        return cls.magic + cls._header.pack(cls.version) + marshal.dumps([
+            (
+                class_id,
+                class_ir.name,
+                class_ir.bases,
+                class_ir.imports,
+                tuple((field.name, field.parameter, field.type, kinds[field.kind]) for field in class_ir.fields),
+                tuple(
+                    (
+                        method.name,
+                        tuple((parameter.name, parameter.type) for parameter in method.parameters),
+                        method.return_type,
+                    )
+                    for method in class_ir.methods
+                ),
+                class_ir.slots,
+                class_ir.type_checking_imports,
+            )
+            for class_id, class_ir in classes.items()
+        ])
+
+    @classmethod
+    def load(cls, ir_path: Path) -> dict[str, ClassIR]:
+        """Deserializes classes from a file.
+
+        Args:
+            ir_path: Path to the file.
+        Returns:
+            Map of class id to its ClassIR.
+        """
+        return cls.loads(ir_path.read_bytes())
+
+    @classmethod
+    def loads(cls, data: bytes) -> dict[str, ClassIR]:
+        """Deserializes classes from bytes.
+
+        Args:
+            data: Serialized classes.
+        Returns:
+            Map of class id to its ClassIR.
+        """
+        if data[:len(cls.magic)] != cls.magic or len(data) < len(cls.magic) + cls._header.size:
+            raise InvalidModelFile("File is not a serialized class representation.")
+        (version,) = cls._header.unpack_from(data, len(cls.magic))
+        if version != cls.version:
+            raise UnsupportedModelVersion(
+                f"Class representation format version {version} is not supported (expected {cls.version})."
+            )
+        try:
+            encoded = marshal.loads(memoryview(data)[len(cls.magic) + cls._header.size:])
+            return {
+                class_id: ClassIR(
+                    name,
+                    bases,
+                    imports,
+                    tuple(
+                        FieldIR(field_name, parameter, type_name, cls._field_kinds[kind])
+                        for field_name, parameter, type_name, kind in fields
+                    ),
+                    tuple(
+                        MethodIR(
+                            method_name,
+                            tuple(ParameterIR(*parameter) for parameter in parameters),
+                            return_type,
+                        )
+                        for method_name, parameters, return_type in methods
+                    ),
+                    slots,
+                    type_checking_imports,
+                )
+                for class_id, name, bases, imports, fields, methods, slots, type_checking_imports in encoded
+            }
+        except (EOFError, ValueError, TypeError, IndexError) as error:
+            raise InvalidModelFile(f"Class representation payload is corrupted: {error}.") from error
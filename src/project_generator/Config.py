@@ -6,4 +6,10 @@ class Config:
         "String": "str",
         "Integer": "int",
         "Float": "float",
+        "Boolean": "bool",
+        "Real": "float",
+        "UnlimitedNatural": "int",
+        "List<T>": "list[T]",
+        "Set<T>": "set[T]",
+        "Map<K, V>": "dict[K, V]",
     }
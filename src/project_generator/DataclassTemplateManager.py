@@ -0,0 +1,74 @@
+from project_generator.ir import (
+    ClassIR,
+    FieldIR,
+    FieldKind
+)
+from project_generator.TemplateManager import TemplateManager
+
+
+class DataclassTemplateManager(TemplateManager):
+    """Module responsible for generating dataclass DTOs of the classes.
+
+    Every class becomes a keyword-only dataclass with one field per constructor
+    parameter of the plain class, named like the parameter, so a DTO accepts the same
+    keyword arguments. Compositions become fields with a default factory. Keyword-only
+    fields let subclasses add required fields after defaulted fields of their bases.
+    Operations are not part of DTOs. Classes with slots in their ClassIR are slotted
+    dataclasses, which leave out the slots of their bases themselves. DTOs hold plain
+    data, so lazy compositions are created by their default factory like compositions.
+    """
+
+    _field_declarations = {
+        FieldKind.PROPERTY: "{name}: {type}",
+        FieldKind.ASSOCIATION: "{name}: {type} | None = None",
+        FieldKind.AGGREGATION: "{name}: list[{type}] = dataclasses.field(default_factory=list)",
+        FieldKind.COMPOSITION: "{name}: {type} = dataclasses.field(default_factory={type})",
+        FieldKind.LAZY_COMPOSITION: "{name}: {type} = dataclasses.field(default_factory={type})",
+    }
+
+    @staticmethod
+    def _get_module_imports(class_ir: ClassIR) -> tuple[str, ...]:
+        """Gets the dataclasses import.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            Tuple of import statements.
+        """
+        return ("import dataclasses",)
+
+    def _generate_decorators(self, class_ir: ClassIR) -> str:
+        """Generates the dataclass decorator.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            String containing the decorator.
+        """
+        if class_ir.slots is None:
+            return "@dataclasses.dataclass(kw_only=True)"
+        return "@dataclasses.dataclass(kw_only=True, slots=True)"
+
+    def _generate_members(self, class_ir: ClassIR) -> list[str]:
+        """Generates the dataclass fields.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            List with the block of fields, empty if the class has no fields.
+        """
+        if not class_ir.fields:
+            return []
+        return ["\n".join(self._format_field(field) for field in class_ir.fields)]
+
+    def _format_field(self, field: FieldIR) -> str:
+        """Formats a dataclass field.
+
+        Args:
+            field: Field of the class.
+        Returns:
+            Field declaration with its default.
+        """
+        # Compositions have no parameter, their attribute name is private
+        name = field.parameter or field.name.lstrip("_")
+        return self._field_declarations[field.kind].format(name=name, type=field.type)
@@ -0,0 +1,102 @@
+from project_generator.syntax import (
+    Class,
+    Package,
+    Project,
+    Reference,
+    Relation
+)
+from project_generator.TypeMapping import TypeMapping
+
+
+class DependencyIndex:
+    """Module responsible for finding the classes that depend on a type.
+
+    It is the inverse of the relations by client of ProjectGenerator and of the used
+    classes of TemplateManager: a class depends on a type when it is the client of a
+    relation with the type as supplier (it subclasses, composes or references it), or
+    when its properties or operation parameters use the type. Types are model names,
+    resolved from ids with the project type table and split into referenced classes
+    by the type mapping, the same way the generated imports are.
+
+    The index is built once per project, a change of the name or location of a type
+    affects the generated files of its direct dependents.
+    """
+
+    def __init__(self, project: Project, type_mapping: TypeMapping | None = None) -> None:
+        """
+        Args:
+            project: Project syntax object.
+            type_mapping: Mapping of model types to Python annotations, defaults from Config if None.
+        """
+        self._type_mapping = type_mapping or TypeMapping()
+        self._type_names = project.types
+        self._classes: dict[str, Class] = {}
+        self._classes_by_name: dict[str, list[Class]] = {}
+        # Type name -> ids of dependent classes, in model order
+        self._dependents: dict[str, dict[str, None]] = {}
+        relations: list[Relation] = []
+        for package in project.packages:
+            self._index_package(package, relations)
+        # Clients may be defined in later packages, so relations are indexed last
+        for relation in relations:
+            client = self._type_names.get(relation.client, relation.client)
+            self._add(relation.supplier, [class_syntax.id for class_syntax in self._classes_by_name.get(client, [])])
+
+    def dependents(self, type_name: str, transitive: bool = False) -> list[Class]:
+        """Gets the classes depending on a type.
+
+        Args:
+            type_name: Model name of the type.
+            transitive: Also include classes depending on the dependents.
+        Returns:
+            Dependent classes in order of discovery, without the type itself.
+        """
+        found = dict.fromkeys(self._dependents.get(type_name, ()))
+        if transitive:
+            pending = list(found)
+            while pending:
+                for dependent_id in self._dependents.get(self._classes[pending.pop()].name, ()):
+                    if dependent_id not in found:
+                        found[dependent_id] = None
+                        pending.append(dependent_id)
+        return [
+            self._classes[class_id]
+            for class_id in found
+            if self._classes[class_id].name != type_name
+        ]
+
+    def _index_package(self, package: Package | Reference, relations: list[Relation]) -> None:
+        """Adds the classes of a package and its subpackages to the index.
+
+        Args:
+            package: Package syntax object.
+            relations: List the relations of the packages are appended to.
+        """
+        if isinstance(package, Reference):
+            return
+        for class_syntax in package.classes:
+            if isinstance(class_syntax, Reference):
+                continue
+            self._classes[class_syntax.id] = class_syntax
+            self._classes_by_name.setdefault(class_syntax.name, []).append(class_syntax)
+            for typed_syntax in class_syntax.properties + [
+                parameter for operation in class_syntax.operations for parameter in operation.parameters
+            ]:
+                if not isinstance(typed_syntax, Reference):
+                    self._add(typed_syntax.type, [class_syntax.id])
+        relations += [relation for relation in package.dependencies if not isinstance(relation, Reference)]
+        for subpackage in package.subpackages:
+            self._index_package(subpackage, relations)
+
+    def _add(self, type_reference: str, class_ids: list[str]) -> None:
+        """Records classes as dependents of the classes referenced by a type.
+
+        Args:
+            type_reference: Id or name of the type.
+            class_ids: Ids of the dependent classes.
+        """
+        type_name = self._type_names.get(type_reference, type_reference)
+        if not type_name or type_name.startswith("uml:"):
+            return
+        for class_name in self._type_mapping.referenced_classes(type_name):
+            self._dependents.setdefault(class_name, {}).update(dict.fromkeys(class_ids))
@@ -0,0 +1,405 @@
+import mmap
+from pathlib import Path
+from typing import BinaryIO
+from xml.parsers import expat
+
+from project_generator.Config import Config
+from project_generator.exceptions import (
+    NoAttribute,
+    NoElement
+)
+from project_generator.syntax import (
+    Class,
+    DataType,
+    Operation,
+    Package,
+    Parameter,
+    ParameterDirection,
+    Project,
+    Property,
+    Reference,
+    Relation,
+    RelationType,
+    Visibility
+)
+from project_generator.XmiParser import XmiParser
+from project_generator.XmiSource import XmiSource
+
+# Kinds of elements on the parser stack
+_IGNORED = 0
+_ROOT = 1
+_MODEL = 2
+_PACKAGE = 3
+_CLASS = 4
+_OPERATION = 5
+_PROPERTY = 6
+_PARAMETER = 7
+
+
+class _PackageState:
+    """Package (or Model) being parsed, relations are kept per type until the package ends."""
+
+    __slots__ = ("package", "relations", "types")
+
+    def __init__(self, package: Package) -> None:
+        self.package = package
+        self.relations: dict[str, list] = {relation_type: [] for relation_type in ExpatXmiParser.relation_types}
+        # Type tables of a Model by namespace priority of the packagedElement tags
+        self.types: list[dict[str, str]] = [{}, {}, {}]
+
+
+class _TypedState:
+    """Property or parameter being parsed, its type is known once the element ends."""
+
+    __slots__ = ("syntax", "attributes", "type_elements")
+
+    def __init__(self, syntax: Property | Parameter, attributes: dict[str, str]) -> None:
+        self.syntax = syntax
+        self.attributes = attributes
+        # Attributes of the first nested <type> element by namespace priority
+        self.type_elements: list[dict[str, str] | None] = [None, None, None]
+
+
+class ExpatXmiParser:
+    """Module responsible for parsing XMI files straight into project syntax objects.
+
+    Expat start and end callbacks drive a small state machine with a stack of the open
+    elements, syntax objects are created as soon as their start tag is read. No element
+    tree and no XmiElement wrappers are built. The result is equal to XmiParser.parse(),
+    including the order of the lists and the raised exceptions for invalid documents.
+    """
+
+    relation_types = [
+        "uml:Association",
+        "uml:Dependency",
+        "uml:Aggregation",
+        "uml:Composition",
+        "uml:Realization",
+        "uml:Generalization",
+    ]
+
+    # Namespace priorities as XmiElement tries them, namespaces as reported by expat ("namespace}name")
+    _namespaces = {"": 0, Config.uml_namespace[1:-1]: 1, Config.xmi_namespace[1:-1]: 2}
+    # Attribute key -> namespaced keys as reported by expat
+    _qualified_keys: dict[str, tuple[str, str]] = {}
+
+    @classmethod
+    def parse(cls, xmi_path: Path | BinaryIO | mmap.mmap | bytes) -> Project:
+        """Parses an XMI file into a Project syntax object.
+
+        Args:
+            xmi_path: XMI input accepted by XmiParser.parse().
+        Returns:
+            Parsed Project syntax object.
+        """
+        type_element_types = set(XmiParser.type_element_types)
+        relation_types = {f"uml:{relation_type.value.capitalize()}": relation_type for relation_type in RelationType}
+        visibilities = {visibility.value: visibility for visibility in Visibility}
+        find = cls._find
+        get = cls._get
+        signature = cls._signature
+        tags: dict[str, tuple[str, int | None]] = {}
+        # (kind, state) of open elements
+        stack: list[tuple[int, object]] = []
+        push = stack.append
+        ignored = (_IGNORED, None)
+        models: list[tuple[int, _PackageState]] = []
+        model_state: _PackageState | None = None
+        root_tag = ""
+
+        def split_tag(tag: str) -> tuple[str, int | None]:
+            namespace, _, local_name = tag.rpartition("}")
+            tags[tag] = split = (local_name, cls._namespaces.get(namespace))
+            return split
+
+        def visibility(attributes: dict[str, str], tag: str) -> Visibility:
+            value = get(attributes, "visibility", tag)
+            return visibilities.get(value) or Visibility(value)
+
+        def start_element(tag: str, attributes: dict[str, str]) -> None:
+            nonlocal model_state, root_tag
+            local_name, priority = tags.get(tag) or split_tag(tag)
+            if not stack:
+                root_tag = tag
+                push((_ROOT, None))
+                return
+            kind, state = stack[-1]
+
+            element_type = None
+            if model_state is not None and local_name == "packagedElement" and priority is not None:
+                # Type table of the Model, parse_types() looks at any depth and tag namespace
+                element_type = get(attributes, "type", tag, True)
+                if element_type in type_element_types and (type_id := find(attributes, "id", True)) is not None:
+                    if (type_name := find(attributes, "name")) is not None:
+                        model_state.types[priority][type_id] = type_name
+
+            if kind == _IGNORED:
+                push(ignored)
+            elif kind == _CLASS:
+                if tag == "ownedAttribute" and get(attributes, "type", tag, True) == "uml:Property":
+                    if (href := find(attributes, "href")) is not None:
+                        state.properties.append(cls._reference(href))
+                        push(ignored)
+                        return
+                    property_syntax = Property(*signature(attributes, tag), "", visibility(attributes, tag))
+                    state.properties.append(property_syntax)
+                    push((_PROPERTY, _TypedState(property_syntax, attributes)))
+                elif tag == "ownedOperation" and get(attributes, "type", tag, True) == "uml:Operation":
+                    if (href := find(attributes, "href")) is not None:
+                        state.operations.append(cls._reference(href))
+                        push(ignored)
+                        return
+                    operation = Operation(*signature(attributes, tag), [], visibility(attributes, tag))
+                    state.operations.append(operation)
+                    push((_OPERATION, operation))
+                else:
+                    push(ignored)
+            elif kind == _OPERATION:
+                if tag == "ownedParameter" and get(attributes, "type", tag, True) == "uml:Parameter":
+                    if (href := find(attributes, "href")) is not None:
+                        state.parameters.append(cls._reference(href))
+                        push(ignored)
+                        return
+                    direction = ParameterDirection(get(attributes, "direction", tag))
+                    parameter = Parameter(
+                        get(attributes, "id", tag),
+                        "" if direction == ParameterDirection.RETURN else get(attributes, "name", tag),
+                        "",
+                        direction,
+                    )
+                    state.parameters.append(parameter)
+                    push((_PARAMETER, _TypedState(parameter, attributes)))
+                else:
+                    push(ignored)
+            elif kind == _PACKAGE or kind == _MODEL:
+                if tag != "packagedElement":
+                    push(ignored)
+                    return
+                package = state.package
+                if element_type is None:
+                    element_type = get(attributes, "type", tag, True)
+                if element_type == "uml:Package":
+                    if (href := find(attributes, "href")) is not None:
+                        package.subpackages.append(cls._reference(href))
+                        push(ignored)
+                        return
+                    subpackage = Package(*signature(attributes, tag), [], [], [], [])
+                    package.subpackages.append(subpackage)
+                    push((_PACKAGE, _PackageState(subpackage)))
+                    return
+                if kind == _MODEL:
+                    push(ignored)
+                    return
+                href = find(attributes, "href")
+                if element_type == "uml:Class":
+                    if href is not None:
+                        package.classes.append(cls._reference(href))
+                        push(ignored)
+                        return
+                    class_syntax = Class(*signature(attributes, tag), [], [])
+                    package.classes.append(class_syntax)
+                    push((_CLASS, class_syntax))
+                    return
+                if element_type in relation_types:
+                    state.relations[element_type].append(
+                        cls._reference(href) if href is not None else Relation(
+                            *signature(attributes, tag),
+                            relation_types[element_type],
+                            get(attributes, "client", tag),
+                            get(attributes, "supplier", tag),
+                        )
+                    )
+                elif element_type == "uml:DataType":
+                    package.data_types.append(
+                        cls._reference(href) if href is not None else DataType(*signature(attributes, tag))
+                    )
+                push(ignored)
+            elif kind == _PROPERTY or kind == _PARAMETER:
+                if local_name == "type" and priority is not None and state.type_elements[priority] is None:
+                    state.type_elements[priority] = attributes
+                push(ignored)
+            elif kind == _ROOT and local_name == "Model" and priority is not None:
+                model = Package(*signature(attributes, tag), [], [], [], [])
+                model_state = _PackageState(model)
+                models.append((priority, model_state))
+                push((_MODEL, model_state))
+            else:
+                push(ignored)
+
+        def end_element(tag: str) -> None:
+            nonlocal model_state
+            kind, state = stack.pop()
+            if kind == _IGNORED:
+                return
+            if kind == _PROPERTY:
+                state.syntax.type = cls._property_type(state)
+                state.syntax.type_document = cls._type_document(state)
+            elif kind == _PARAMETER:
+                state.syntax.type = cls._parameter_type(state, tag)
+                state.syntax.type_document = cls._type_document(state)
+            elif kind == _PACKAGE:
+                state.package.dependencies = [
+                    relation for relations in state.relations.values() for relation in relations
+                ]
+            elif kind == _MODEL:
+                model_state = None
+
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        if isinstance(xmi_path, (mmap.mmap, bytes)) and XmiSource.compression(xmi_path[:8]) is None:
+            parser.Parse(xmi_path, True)
+        else:
+            with XmiSource.open(xmi_path) as stream:
+                parser.ParseFile(stream)
+
+        if not models:
+            raise NoElement(f"Element Model not found in element {cls._tree_tag(root_tag)}.")
+        # find("Model") prefers the namespace tried first, then document order
+        _, model_state = min(models, key=lambda model: model[0])
+        model = model_state.package
+        types: dict[str, str] = {}
+        for namespace_types in model_state.types:
+            types.update(namespace_types)
+        return Project(model.id, model.name, model.subpackages, types)
+
+    @classmethod
+    def _property_type(cls, state: _TypedState) -> str:
+        """Resolves the type of a property the same way as XmiParser._parse_property().
+
+        Args:
+            state: State of the parsed property.
+        Returns:
+            Type name or id, empty if it is not given.
+        """
+        if (type_attribute := state.attributes.get("type")) is not None:
+            type_attribute = type_attribute.strip()
+            return "" if type_attribute.startswith("uml:") else type_attribute
+        return cls._nested_type(state) or ""
+
+    @classmethod
+    def _parameter_type(cls, state: _TypedState, tag: str) -> str:
+        """Resolves the type of a parameter the same way as XmiParser._parse_parameter().
+
+        Args:
+            state: State of the parsed parameter.
+            tag: Tag of the parameter element.
+        Returns:
+            Type name or id.
+        """
+        if state.attributes.get("type") is None and (type_reference := cls._nested_type(state)) is not None:
+            return type_reference
+        return cls._get(state.attributes, "type", tag)
+
+    @classmethod
+    def _nested_type(cls, state: _TypedState) -> str | None:
+        """Gets the type id from the nested <type> element of a property or parameter.
+
+        Args:
+            state: State of the parsed property or parameter.
+        Returns:
+            Id of the referenced type or None if there is no nested type element.
+        """
+        type_attributes = next((attributes for attributes in state.type_elements if attributes is not None), None)
+        if type_attributes is None:
+            return None
+        if (href := cls._find(type_attributes, "href")) is not None:
+            return href.rpartition("#")[2]
+        return cls._get(type_attributes, "idref", "type", True)
+
+    @classmethod
+    def _type_document(cls, state: _TypedState) -> str:
+        """Gets the document of the nested <type href="document#id"/> element of a property or parameter.
+
+        Args:
+            state: State of the parsed property or parameter.
+        Returns:
+            Document defining the type, empty if the type is not referenced by href.
+        """
+        if state.attributes.get("type") is not None:
+            return ""
+        type_attributes = next((attributes for attributes in state.type_elements if attributes is not None), None)
+        if type_attributes is None or (href := cls._find(type_attributes, "href")) is None:
+            return ""
+        return href.rpartition("#")[0]
+
+    @staticmethod
+    def _reference(href: str) -> Reference:
+        """Creates a Reference placeholder for an element defined in another document.
+
+        Args:
+            href: Value of the href attribute.
+        Returns:
+            Reference syntax object.
+        """
+        document, _, element_id = href.rpartition("#")
+        return Reference(element_id, "", document)
+
+    @classmethod
+    def _signature(cls, attributes: dict[str, str], tag: str) -> tuple[str, str]:
+        """Gets the (id, name) signature of an element, as XmiElement.syganture.
+
+        Args:
+            attributes: Attributes of the element.
+            tag: Tag of the element used in error messages.
+        Returns:
+            Tuple of (id, name).
+        """
+        return cls._get(attributes, "id", tag), cls._get(attributes, "name", tag)
+
+    @classmethod
+    def _get(cls, attributes: dict[str, str], key: str, tag: str, force_namespace: bool = False) -> str:
+        """Gets an attribute the same way as XmiElement.get.
+
+        Args:
+            attributes: Attributes of the element.
+            key: Key of the attribute.
+            tag: Tag of the element used in error messages.
+            force_namespace: Force searching with namespaces.
+        Returns:
+            Attribute value.
+        """
+        if (value := cls._find(attributes, key, force_namespace)) is None:
+            raise NoAttribute(f"Attribute {key} not found in element {cls._tree_tag(tag)}.")
+        return value
+
+    @classmethod
+    def _find(cls, attributes: dict[str, str], key: str, force_namespace: bool = False) -> str | None:
+        """Gets an attribute the same way as XmiElement.get, but without raising.
+
+        Args:
+            attributes: Attributes of the element.
+            key: Key of the attribute.
+            force_namespace: Force searching with namespaces.
+        Returns:
+            Attribute value or None if it is missing.
+        """
+        if not force_namespace and (value := attributes.get(key)) is not None:
+            return value
+        uml_key, xmi_key = cls._qualified_keys.get(key) or cls._qualify(key)
+        if (value := attributes.get(uml_key)) is not None:
+            return value
+        return attributes.get(xmi_key)
+
+    @classmethod
+    def _qualify(cls, key: str) -> tuple[str, str]:
+        """Builds and remembers the namespaced variants of an attribute key.
+
+        Args:
+            key: Key of the attribute.
+        Returns:
+            Tuple of (UML namespaced key, XMI namespaced key).
+        """
+        cls._qualified_keys[key] = qualified = (f"{Config.uml_namespace[1:]}{key}", f"{Config.xmi_namespace[1:]}{key}")
+        return qualified
+
+    @staticmethod
+    def _tree_tag(tag: str) -> str:
+        """Formats an expat tag as ElementTree does ("{namespace}name").
+
+        Args:
+            tag: Tag as reported by expat.
+        Returns:
+            Tag in ElementTree notation.
+        """
+        return f"{{{tag}" if "}" in tag else tag
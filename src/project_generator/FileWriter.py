@@ -0,0 +1,118 @@
+import os
+from pathlib import Path
+from typing import Callable
+
+FileWrittenCallback = Callable[[int], None]
+
+
+class FileWriter:
+    """Module responsible for writing generated files safely and with few filesystem calls.
+
+    The directory tree is created once from the full package layout, with one mkdir per
+    new directory. Every file is written to a temporary file in its target directory and
+    renamed over the target, so an interrupted run never leaves a partially written file
+    behind. Files are written with raw descriptors: one open, write and close, plus the
+    rename, no file object probing the descriptor. With skip_unchanged, files whose content did not change are
+    not touched and keep their modification time, at the cost of reading them back.
+    """
+
+    temp_suffix = ".pgtmp"
+
+    def __init__(
+        self,
+        on_file: FileWrittenCallback | None = None,
+        skip_unchanged: bool = False,
+        on_skip: FileWrittenCallback | None = None,
+    ) -> None:
+        """
+        Args:
+            on_file: Callback receiving the size of every written file.
+            skip_unchanged: Whether files already existing with the same content are left untouched.
+            on_skip: Callback receiving the size of every file skipped as unchanged.
+        """
+        self._on_file = on_file
+        self._skip_unchanged = skip_unchanged
+        self._on_skip = on_skip
+        self._created: set[Path] = set()
+
+    def create_directories(self, directories: list[Path]) -> None:
+        """Creates directories, parents are created only once for all of them.
+
+        Args:
+            directories: Paths of the directories.
+        """
+        missing: set[Path] = set()
+        for directory in directories:
+            while directory not in self._created and directory not in missing:
+                if directory.is_dir():
+                    # Only the topmost ancestor of a new branch is checked on disk
+                    self._created.add(directory)
+                    break
+                missing.add(directory)
+                directory = directory.parent
+        # Parents sort before their children
+        for directory in sorted(missing, key=lambda path: len(path.parts)):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                if not directory.is_dir():
+                    raise
+        self._created |= missing
+
+    def write(self, file_path: Path, content: bytes) -> None:
+        """Writes a file, its directory must be created beforehand.
+
+        Args:
+            file_path: Path to the file.
+            content: Content of the file.
+        """
+        if self._skip_unchanged and self._is_unchanged(file_path, content):
+            if self._on_skip is not None:
+                self._on_skip(len(content))
+            return
+        self._replace(file_path, content)
+        if self._on_file is not None:
+            self._on_file(len(content))
+
+    @classmethod
+    def _replace(cls, file_path: Path, content: bytes) -> None:
+        """Writes content into a temporary file and renames it over the target file.
+
+        Args:
+            file_path: Path to the file.
+            content: Content of the file.
+        """
+        temp_path = f"{file_path}.{os.getpid()}{cls.temp_suffix}"
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            try:
+                view = memoryview(content)
+                while view:
+                    view = view[os.write(descriptor, view):]
+            finally:
+                os.close(descriptor)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    @staticmethod
+    def _is_unchanged(file_path: Path, content: bytes) -> bool:
+        """Checks whether the file already exists with the given content.
+
+        Args:
+            file_path: Path to the generated file.
+            content: Content to be written.
+        Returns:
+            True if writing the file can be skipped.
+        """
+        try:
+            if os.stat(file_path).st_size != len(content):
+                return False
+            with open(file_path, "rb") as file:
+                return file.read() == content
+        except FileNotFoundError:
+            return False
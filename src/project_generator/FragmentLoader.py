@@ -0,0 +1,293 @@
+import hashlib
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait
+)
+from pathlib import Path
+
+from project_generator.exceptions import (
+    SerializerException,
+    UnresolvedReference
+)
+from project_generator.ProjectSerializer import ProjectSerializer
+from project_generator.syntax import (
+    AbstractSyntax,
+    Class,
+    Operation,
+    Package,
+    Parameter,
+    Project,
+    Property,
+    Reference
+)
+from project_generator.XmiParser import XmiParser
+
+
+class FragmentLoader:
+    """Module responsible for resolving references between documents of a multi-file XMI model.
+
+    Elements pointing to another document (href="fragment.xmi#id") are parsed into Reference
+    placeholders. The loader parses every referenced document (transitively) in a process
+    pool, indexes all their elements by id and replaces the placeholders with the elements.
+    Properties, operations and parameters of classes may be placeholders as well.
+    Documents holding only the types of properties and parameters (<type href="..."/>) are
+    loaded too. Type resolution tables of the documents are merged into the project.
+    Each fragment is cached independently, so only edited fragments are parsed again.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, workers: int | None = None) -> None:
+        """
+        Args:
+            cache_dir: Directory of parsed fragment caches, no caching if None.
+            workers: Number of worker processes, parsing runs in the current process if 1.
+        """
+        self._cache_dir = cache_dir
+        self._workers = workers
+        self.index: dict[str, AbstractSyntax] = {}
+
+    def resolve(self, project: Project, base_dir: Path) -> Project:
+        """Loads documents referenced by the project and replaces its Reference placeholders.
+
+        Args:
+            project: Project syntax object, possibly with Reference placeholders.
+            base_dir: Directory the document hrefs of the project are relative to.
+        Returns:
+            The same Project syntax object with all placeholders resolved.
+        """
+        root = Package("", project.name, project.packages, [], [], [])
+        if not self._has_references(root):
+            return project
+
+        fragments = self._load_fragments(root, base_dir)
+        packages = [root, *(fragment.packages[0] for fragment in fragments.values())]
+        for package in packages:
+            self._index_package(package)
+        visited: set[int] = set()
+        for package in packages:
+            self._replace_references(package, visited)
+        for fragment in fragments.values():
+            for type_id, type_name in fragment.types.items():
+                project.types.setdefault(type_id, type_name)
+        return project
+
+    def _load_fragments(self, root: Package, base_dir: Path) -> dict[Path, Project]:
+        """Parses all documents referenced from the root package, transitively.
+
+        Args:
+            root: Package holding the root document content.
+            base_dir: Directory the document hrefs of the root package are relative to.
+        Returns:
+            Map of document path to project holding the document content.
+        """
+        fragments: dict[Path, Project] = {}
+        pending = self._references(root, base_dir)
+        if self._workers == 1:
+            while pending:
+                fragment_path = pending.pop()
+                fragments[fragment_path] = ProjectSerializer.loads(
+                    self.load_fragment(fragment_path, self._cache_path(fragment_path))
+                )
+                pending |= (
+                    self._references(fragments[fragment_path].packages[0], fragment_path.parent) - fragments.keys()
+                )
+            return fragments
+
+        with ProcessPoolExecutor(self._workers) as pool:
+            futures: dict[Future, Path] = {}
+            submitted: set[Path] = set()
+            while pending or futures:
+                for fragment_path in pending - submitted:
+                    submitted.add(fragment_path)
+                    future = pool.submit(self.load_fragment, fragment_path, self._cache_path(fragment_path))
+                    futures[future] = fragment_path
+                pending = set()
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fragment_path = futures.pop(future)
+                    fragments[fragment_path] = ProjectSerializer.loads(future.result())
+                    pending |= self._references(fragments[fragment_path].packages[0], fragment_path.parent)
+        return fragments
+
+    @staticmethod
+    def load_fragment(fragment_path: Path, cache_path: Path | None) -> bytes:
+        """Parses a fragment document, reusing its cache if the document did not change.
+
+        Runs in worker processes, the result is returned serialized since it is cheaper
+        to transfer and load than a pickled syntax tree.
+
+        Args:
+            fragment_path: Path to the fragment document.
+            cache_path: Path to the fragment cache, no caching if None.
+        Returns:
+            Serialized project with a single package holding the fragment content and
+            the fragment type resolution table.
+        """
+        stat = fragment_path.stat()
+        source_key = f"{stat.st_size}:{stat.st_mtime_ns}"
+        if cache_path is not None and cache_path.is_file():
+            try:
+                if ProjectSerializer.read_source_key(cache_path) == source_key:
+                    return cache_path.read_bytes()
+            except SerializerException:
+                pass
+
+        data = ProjectSerializer.dumps(XmiParser.parse_fragment(fragment_path), source_key)
+        if cache_path is not None:
+            cache_path.write_bytes(data)
+        return data
+
+    def _cache_path(self, fragment_path: Path) -> Path | None:
+        """Gets the cache file path of a fragment document.
+
+        Args:
+            fragment_path: Path to the fragment document.
+        Returns:
+            Path to the cache file or None if caching is disabled.
+        """
+        if self._cache_dir is None:
+            return None
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha1(str(fragment_path).encode()).hexdigest()
+        return self._cache_dir / f"{fragment_path.name}.{digest[:16]}.pgm"
+
+    @classmethod
+    def _has_references(cls, package: Package) -> bool:
+        """Checks whether the package contains Reference placeholders or type hrefs (recursively).
+
+        Args:
+            package: Package syntax object.
+        Returns:
+            True if any placeholder was found.
+        """
+        for element in cls._members(package):
+            if isinstance(element, Package):
+                if cls._has_references(element):
+                    return True
+                continue
+            for member in [element, *(cls._class_members(element) if isinstance(element, Class) else [])]:
+                if cls._referenced_document(member) is not None:
+                    return True
+        return False
+
+    @classmethod
+    def _references(cls, package: Package, base_dir: Path) -> set[Path]:
+        """Collects paths of documents referenced from the package.
+
+        Args:
+            package: Package syntax object.
+            base_dir: Directory the document hrefs are relative to.
+        Returns:
+            Set of resolved document paths.
+        """
+        documents: set[Path] = set()
+        for element in cls._members(package):
+            if isinstance(element, Package):
+                documents |= cls._references(element, base_dir)
+                continue
+            for member in [element, *(cls._class_members(element) if isinstance(element, Class) else [])]:
+                if document := cls._referenced_document(member):
+                    documents.add((base_dir / document).resolve())
+        return documents
+
+    def _index_package(self, package: Package) -> None:
+        """Adds the package and its elements (recursively) to the shared id index.
+
+        Args:
+            package: Package syntax object.
+        """
+        if package.id:
+            self.index[package.id] = package
+        for element in self._members(package):
+            if isinstance(element, Package):
+                self._index_package(element)
+            elif not isinstance(element, Reference):
+                self.index[element.id] = element
+                if isinstance(element, Class):
+                    for member in self._class_members(element):
+                        if not isinstance(member, Reference):
+                            self.index[member.id] = member
+
+    def _replace_references(self, package: Package, visited: set[int]) -> None:
+        """Replaces Reference placeholders of the package (recursively) with indexed elements.
+
+        Args:
+            package: Package syntax object.
+            visited: Ids of already processed package objects.
+        """
+        if id(package) in visited:
+            return
+        visited.add(id(package))
+        for members in [package.subpackages, package.classes, package.dependencies, package.data_types]:
+            self._replace_members(members)
+            for element in members:
+                if isinstance(element, Package):
+                    self._replace_references(element, visited)
+                elif isinstance(element, Class):
+                    self._replace_members(element.properties)
+                    self._replace_members(element.operations)
+                    for operation in element.operations:
+                        self._replace_members(operation.parameters)
+
+    def _replace_members(self, members: list) -> None:
+        """Replaces Reference placeholders of a list of elements with indexed elements.
+
+        Args:
+            members: List of elements, changed in place.
+        """
+        for position, element in enumerate(members):
+            if isinstance(element, Reference):
+                if element.id not in self.index:
+                    raise UnresolvedReference(
+                        f"Element {element.id} referenced from {element.document or 'the same document'} "
+                        "was not found."
+                    )
+                members[position] = self.index[element.id]
+
+    @staticmethod
+    def _members(package: Package) -> list:
+        """Gets all packaged elements of the package.
+
+        Args:
+            package: Package syntax object.
+        Returns:
+            List of subpackages, classes, relations and data types.
+        """
+        return [*package.subpackages, *package.classes, *package.dependencies, *package.data_types]
+
+    @staticmethod
+    def _class_members(class_syntax: Class) -> list:
+        """Gets all members of the class.
+
+        Args:
+            class_syntax: Class syntax object.
+        Returns:
+            List of properties, operations and parameters of the operations.
+        """
+        return [
+            *class_syntax.properties,
+            *class_syntax.operations,
+            *(
+                parameter
+                for operation in class_syntax.operations
+                if isinstance(operation, Operation)
+                for parameter in operation.parameters
+            ),
+        ]
+
+    @staticmethod
+    def _referenced_document(element: AbstractSyntax) -> str | None:
+        """Gets the document an element points to.
+
+        Args:
+            element: Syntax object or Reference placeholder.
+        Returns:
+            Document of a placeholder (empty for the same document) or of the type of a
+            property or parameter, None if the element points to no other element.
+        """
+        if isinstance(element, Reference):
+            return element.document
+        if isinstance(element, (Property, Parameter)) and element.type_document:
+            return element.type_document
+        return None
@@ -1,3 +1,4 @@
+from enum import Enum
 from pathlib import Path
 
 from project_generator.exceptions import NonMappedClass
@@ -7,18 +8,29 @@ from project_generator.syntax import (
 )
 
 
+class ModuleLayout(Enum):
+    """Enum representing how generated classes are grouped into modules."""
+
+    CLASS = "class"  # One module per class, named like the class
+    PACKAGE = "package"  # One module per package, its __init__, holding all classes of the package
+
+
 class ImportMapping:
     """Module responsible for mapping class names to their import paths."""
 
-    def __init__(self, project: Project, root_dir: Path) -> None:
+    def __init__(self, project: Project, root_dir: Path | None, layout: ModuleLayout = ModuleLayout.CLASS) -> None:
         """
         Args:
             project: Project syntax object.
-            root_dir: Path to the root directory of the project.
+            root_dir: Path to the root directory of the project, import paths are relative to it if None.
+            layout: Grouping of classes into modules, import paths end with the package name
+                for ModuleLayout.PACKAGE.
         """
+        self._layout = layout
         self._mapping: dict[str, str] = {}
+        project_path = f"{root_dir.name}.{project.name}" if root_dir is not None else project.name
         for package in project.packages:
-            self._map_package(f"{root_dir.name}.{project.name}", package)
+            self._map_package(project_path, package)
 
     def get_import_path(self, class_name: str) -> str:
         """Gets the import path for a given class name.
@@ -43,4 +55,7 @@ class ImportMapping:
         for subpackage in package.subpackages:
             self._map_package(actual_import_path, subpackage)
         for class_syntax in package.classes:
-            self._mapping[class_syntax.name] = f"{actual_import_path}.{class_syntax.name}"
+            if self._layout == ModuleLayout.PACKAGE:
+                self._mapping[class_syntax.name] = actual_import_path
+            else:
+                self._mapping[class_syntax.name] = f"{actual_import_path}.{class_syntax.name}"
@@ -0,0 +1,94 @@
+from functools import wraps
+from typing import (
+    Callable,
+    Iterable
+)
+
+
+def _materializing(method: Callable) -> Callable:
+    """Wraps a list method so that the list (and lazy list arguments) are loaded first.
+
+    Args:
+        method: Unbound list method.
+    Returns:
+        Wrapped method.
+    """
+    @wraps(method)
+    def wrapper(self: "LazyList", *args, **kwargs):
+        self.materialize()
+        for argument in args:
+            if isinstance(argument, LazyList):
+                argument.materialize()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class LazyList(list):
+    """List whose items are produced by a loader on the first access.
+
+    It is a real list, so syntax objects holding it compare, iterate and serialize the
+    same way as with eagerly parsed items. Copies and pickles are plain lists. Like a
+    list it can be built from an iterable, so helpers rebuilding containers with
+    type(items)(iterable), such as dataclasses.asdict(), get a loaded lazy list.
+    """
+
+    __slots__ = ("_loader",)
+
+    def __init__(self, iterable: Iterable = (), loader: Callable[[], Iterable] | None = None) -> None:
+        """
+        Args:
+            iterable: Items of the list, extended by the items of the loader.
+            loader: Callable returning the items, called at most once, None if the list is loaded.
+        """
+        super().__init__(iterable)
+        self._loader: Callable[[], Iterable] | None = loader
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the items were already produced by the loader."""
+        return self._loader is None
+
+    def materialize(self) -> None:
+        """Loads the items if they were not loaded yet."""
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            list.extend(self, loader())
+
+    def __radd__(self, other: list) -> list:
+        self.materialize()
+        return other + list(self)
+
+    def __reduce_ex__(self, protocol):
+        self.materialize()
+        return list, (list(self),)
+
+    __getitem__ = _materializing(list.__getitem__)
+    __setitem__ = _materializing(list.__setitem__)
+    __delitem__ = _materializing(list.__delitem__)
+    __iter__ = _materializing(list.__iter__)
+    __reversed__ = _materializing(list.__reversed__)
+    __len__ = _materializing(list.__len__)
+    __contains__ = _materializing(list.__contains__)
+    __eq__ = _materializing(list.__eq__)
+    __ne__ = _materializing(list.__ne__)
+    __lt__ = _materializing(list.__lt__)
+    __le__ = _materializing(list.__le__)
+    __gt__ = _materializing(list.__gt__)
+    __ge__ = _materializing(list.__ge__)
+    __add__ = _materializing(list.__add__)
+    __iadd__ = _materializing(list.__iadd__)
+    __mul__ = _materializing(list.__mul__)
+    __rmul__ = _materializing(list.__rmul__)
+    __imul__ = _materializing(list.__imul__)
+    __repr__ = _materializing(list.__repr__)
+    append = _materializing(list.append)
+    extend = _materializing(list.extend)
+    insert = _materializing(list.insert)
+    remove = _materializing(list.remove)
+    pop = _materializing(list.pop)
+    clear = _materializing(list.clear)
+    index = _materializing(list.index)
+    count = _materializing(list.count)
+    sort = _materializing(list.sort)
+    reverse = _materializing(list.reverse)
+    copy = _materializing(list.copy)
@@ -0,0 +1,49 @@
+from functools import partial
+from typing import Callable
+
+from project_generator.LazyList import LazyList
+from project_generator.syntax import Relation
+from project_generator.XmiElement import XmiElement
+from project_generator.XmiParser import XmiParser
+
+
+class LazyXmiParser(XmiParser):
+    """XMI parser module building syntax objects on access.
+
+    Only the element tree is built upfront. Lists of packages, classes, relations, data
+    types, properties, operations and parameters are LazyList objects converting their
+    XMI elements into syntax objects on the first access, so code touching a part of the
+    model pays only for that part. The element tree is kept alive as long as any list is
+    not loaded, and errors in the XMI are raised when the affected list is accessed.
+    """
+
+    @classmethod
+    def _parse_all(
+        cls,
+        parent: XmiElement,
+        element_name: str,
+        uml_type: str,
+        parser: Callable[[XmiElement], XmiParser.T]
+    ) -> list[XmiParser.T]:
+        """Defers XmiParser._parse_all until the list is accessed.
+
+        Args:
+            parent: Parent XmiElement to search within.
+            element_name: Name of the child elements to find.
+            uml_type: UML type to filter by.
+            parser: Parser function to convert XmiElement to the desired syntax object.
+        Returns:
+            LazyList of parsed syntax objects.
+        """
+        return LazyList(loader=partial(super()._parse_all, parent, element_name, uml_type, parser))
+
+    @classmethod
+    def _parse_relations(cls, package_element: XmiElement) -> list[Relation]:
+        """Defers XmiParser._parse_relations until the list is accessed.
+
+        Args:
+            package_element: XMI element representing the package.
+        Returns:
+            LazyList of Relation syntax objects.
+        """
+        return LazyList(loader=partial(super()._parse_relations, package_element))
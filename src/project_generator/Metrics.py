@@ -0,0 +1,181 @@
+import json
+import sys
+from pathlib import Path
+
+from project_generator.syntax import (
+    Package,
+    Project
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore
+
+
+class MetricsCollector:
+    """Module responsible for collecting machine-readable statistics of a generation run.
+
+    The report is written as JSON, or as OpenMetrics text when the report path has
+    one of the openmetrics_suffixes.
+    """
+
+    openmetrics_suffixes = [".prom", ".om", ".txt"]
+    openmetrics_prefix = "project_generator"
+
+    def __init__(self, report_path: Path | None = None) -> None:
+        """
+        Args:
+            report_path: Path where write_report() stores the report.
+        """
+        self.report_path = report_path
+        self.counts: dict[str, int] = {
+            "packages": 0,
+            "classes": 0,
+            "relations": 0,
+            "properties": 0,
+            "operations": 0,
+            "classes_rendered": 0,
+        }
+        self.phase_seconds: dict[str, float] = {}
+        self.files_written = 0
+        self.files_skipped = 0
+        self.bytes_written = 0
+        self.render_cache_hits = 0
+        self.render_cache_misses = 0
+
+    def count_project(self, project: Project) -> None:
+        """Counts elements of the parsed project.
+
+        Args:
+            project: Project syntax object.
+        """
+        def visit_package(package: Package) -> None:
+            self.counts["packages"] += 1
+            self.counts["classes"] += len(package.classes)
+            self.counts["relations"] += len(package.dependencies)
+            for class_syntax in package.classes:
+                self.counts["properties"] += len(class_syntax.properties)
+                self.counts["operations"] += len(class_syntax.operations)
+            for subpackage in package.subpackages:
+                visit_package(subpackage)
+
+        for package in project.packages:
+            visit_package(package)
+
+    def record_measurement(self, kind: str, name: str, duration: float) -> None:
+        """Profiler hook collecting phase durations and rendered classes.
+
+        Args:
+            kind: Kind of the measurement.
+            name: Name of the measured item.
+            duration: Duration in seconds.
+        """
+        if kind == "phase":
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + duration
+        elif kind == "render":
+            self.counts["classes_rendered"] += 1
+
+    def record_file(self, size: int) -> None:
+        """Records a written file.
+
+        Args:
+            size: Size of the file content in bytes.
+        """
+        self.files_written += 1
+        self.bytes_written += size
+
+    def record_skipped_file(self, size: int) -> None:
+        """Records a file left untouched because its content did not change.
+
+        Args:
+            size: Size of the file content in bytes.
+        """
+        self.files_skipped += 1
+
+    def record_render_cache(self, hits: int, misses: int) -> None:
+        """Records statistics of the class render cache.
+
+        Args:
+            hits: Number of classes rendered from the cache.
+            misses: Number of classes rendered from scratch.
+        """
+        self.render_cache_hits += hits
+        self.render_cache_misses += misses
+
+    def as_dict(self) -> dict:
+        """Gets collected metrics.
+
+        Returns:
+            Dictionary with counts, phase durations, file and render cache statistics and peak RSS.
+        """
+        return {
+            "counts": dict(self.counts),
+            "phase_seconds": dict(self.phase_seconds),
+            "files": {
+                "written": self.files_written,
+                "skipped": self.files_skipped,
+                "bytes_written": self.bytes_written,
+            },
+            "render_cache": {
+                "hits": self.render_cache_hits,
+                "misses": self.render_cache_misses,
+            },
+            "peak_rss_bytes": self._peak_rss(),
+        }
+
+    def write_report(self, report_path: Path | None = None) -> None:
+        """Writes collected metrics as JSON or OpenMetrics text.
+
+        Args:
+            report_path: Path of the report, defaults to the one given to the constructor.
+        """
+        report_path = report_path or self.report_path
+        if report_path is None:
+            return
+        if report_path.suffix in self.openmetrics_suffixes:
+            report_path.write_text(self.to_openmetrics())
+        else:
+            report_path.write_text(json.dumps(self.as_dict(), indent=2) + "\n")
+
+    def to_openmetrics(self) -> str:
+        """Formats collected metrics in the OpenMetrics text format.
+
+        Returns:
+            OpenMetrics exposition text.
+        """
+        metrics = self.as_dict()
+        prefix = self.openmetrics_prefix
+        lines = [f"# TYPE {prefix}_elements gauge"]
+        lines += [f'{prefix}_elements{{kind="{kind}"}} {count}' for kind, count in metrics["counts"].items()]
+        lines.append(f"# TYPE {prefix}_phase_seconds gauge")
+        lines += [
+            f'{prefix}_phase_seconds{{phase="{phase}"}} {seconds}'
+            for phase, seconds in metrics["phase_seconds"].items()
+        ]
+        lines.append(f"# TYPE {prefix}_files gauge")
+        lines.append(f'{prefix}_files{{state="written"}} {self.files_written}')
+        lines.append(f'{prefix}_files{{state="skipped"}} {self.files_skipped}')
+        lines.append(f"# TYPE {prefix}_written_bytes gauge")
+        lines.append(f"{prefix}_written_bytes {self.bytes_written}")
+        lines.append(f"# TYPE {prefix}_render_cache gauge")
+        lines.append(f'{prefix}_render_cache{{result="hit"}} {self.render_cache_hits}')
+        lines.append(f'{prefix}_render_cache{{result="miss"}} {self.render_cache_misses}')
+        if metrics["peak_rss_bytes"] is not None:
+            lines.append(f"# TYPE {prefix}_peak_rss_bytes gauge")
+            lines.append(f"{prefix}_peak_rss_bytes {metrics['peak_rss_bytes']}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _peak_rss() -> int | None:
+        """Gets the peak resident set size of the process.
+
+        Returns:
+            Peak RSS in bytes or None if it cannot be measured on this platform.
+        """
+        if resource is None:
+            return None
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes.
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -0,0 +1,292 @@
+import keyword
+import mmap
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import BinaryIO
+from xml.parsers import expat
+
+from project_generator.Config import Config
+from project_generator.syntax import (
+    ParameterDirection,
+    RelationType,
+    Visibility
+)
+from project_generator.TypeMapping import TypeMapping
+from project_generator.XmiParser import XmiParser
+from project_generator.XmiSource import XmiSource
+
+
+@dataclass
+class ValidationProblem:
+    """Problem found in a model, identified by the id of the offending element."""
+    element_id: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.element_id}: {self.message}"
+
+
+@dataclass
+class _TypedElement:
+    """Property or parameter whose type is checked after the whole document was read."""
+    id: str
+    kind: str
+    type: str
+
+
+class ModelValidator:
+    """Module responsible for checking an XMI model before generation.
+
+    The document is read in a single streaming pass of the expat parser, without building
+    an element tree or syntax objects. References (relation ends and
+    property and parameter types) are checked at the end against all classes and data
+    types of the document. The following problems are reported:
+        - missing or invalid attributes the parser requires,
+        - relation clients and suppliers which are not type elements (classes, data types,
+          primitive types, enumerations or interfaces),
+        - property and parameter types which are not type elements or mapped types,
+        - duplicate class names in one package,
+        - package, class, property, operation and parameter names which are not valid
+          Python identifiers.
+    Types referenced from other documents (href) are not checked.
+    """
+
+    # Namespaces as reported by expat ("namespace}name")
+    _namespaces = ["", Config.uml_namespace[1:], Config.xmi_namespace[1:]]
+    _relation_types = {f"uml:{relation_type.value.capitalize()}" for relation_type in RelationType}
+    _visibilities = {visibility.value for visibility in Visibility}
+    _directions = {direction.value for direction in ParameterDirection}
+
+    @classmethod
+    def validate(
+        cls,
+        source: Path | BinaryIO | mmap.mmap | bytes,
+        type_mapping: TypeMapping | None = None,
+    ) -> list[ValidationProblem]:
+        """Checks an XMI model.
+
+        Args:
+            source: XMI input accepted by XmiSource.open().
+            type_mapping: Mapping of model types to Python annotations, defaults from Config if None.
+        Returns:
+            List of found problems in document order, references are reported last.
+        """
+        type_mapping = type_mapping or TypeMapping()
+        problems: list[ValidationProblem] = []
+        known_ids: set[str] = set()
+        known_names: set[str] = set()
+        relations: list[tuple[str, str, str]] = []
+        typed_elements: list[_TypedElement] = []
+        # Class names of enclosing packages, None for elements which are not packages
+        package_classes: list[dict[str, str] | None] = []
+        typed_element: _TypedElement | None = None
+
+        def start_element(tag: str, attributes: dict[str, str]) -> None:
+            nonlocal typed_element
+            tag = cls._local_name(tag)
+            if tag == "Model":
+                package_classes.append({})
+                return
+            if tag == "type":
+                # A plain type attribute of the typed element takes precedence, as in XmiParser
+                if typed_element is not None and not typed_element.type and (
+                    idref := cls._attribute(attributes, "idref", True)
+                ):
+                    typed_element.type = idref
+                return
+
+            uml_type = cls._attribute(attributes, "type", True)
+            if tag == "packagedElement":
+                package_classes.append({} if uml_type == "uml:Package" else None)
+            if (href := cls._attribute(attributes, "href")) is not None:
+                known_ids.add(href.rpartition("#")[2])
+                return
+
+            if tag == "packagedElement":
+                if uml_type == "uml:Package":
+                    cls._check_signature(attributes, "Package", problems, identifier=True)
+                elif uml_type == "uml:Class":
+                    class_id, name = cls._check_signature(attributes, "Class", problems, identifier=True)
+                    known_ids.add(class_id)
+                    known_names.add(name)
+                    enclosing = next(
+                        (classes for classes in reversed(package_classes[:-1]) if classes is not None), None
+                    )
+                    if enclosing is not None and name:
+                        if name in enclosing:
+                            problems.append(ValidationProblem(
+                                class_id, f"Duplicate class name {name}, also used by {enclosing[name]}."
+                            ))
+                        else:
+                            enclosing[name] = class_id
+                elif uml_type in XmiParser.type_element_types:
+                    data_type_id, name = cls._check_signature(attributes, uml_type[len("uml:"):], problems)
+                    known_ids.add(data_type_id)
+                    known_names.add(name)
+                elif uml_type in cls._relation_types:
+                    relation_id, _ = cls._check_signature(attributes, "Relation", problems)
+                    for end in ["client", "supplier"]:
+                        if (value := cls._attribute(attributes, end)) is None:
+                            problems.append(ValidationProblem(relation_id, f"Relation has no {end}."))
+                        else:
+                            relations.append((relation_id, end, value))
+            elif tag == "ownedAttribute" and uml_type == "uml:Property":
+                property_id, _ = cls._check_signature(attributes, "Property", problems, identifier=True)
+                cls._check_choice(attributes, "visibility", cls._visibilities, property_id, problems)
+                typed_element = _TypedElement(property_id, "Property", attributes.get("type", ""))
+                typed_elements.append(typed_element)
+            elif tag == "ownedOperation" and uml_type == "uml:Operation":
+                operation_id, _ = cls._check_signature(attributes, "Operation", problems, identifier=True)
+                cls._check_choice(attributes, "visibility", cls._visibilities, operation_id, problems)
+            elif tag == "ownedParameter" and uml_type == "uml:Parameter":
+                direction = cls._attribute(attributes, "direction")
+                parameter_id, _ = cls._check_signature(
+                    attributes, "Parameter", problems, identifier=direction != "return", named=direction != "return"
+                )
+                cls._check_choice(attributes, "direction", cls._directions, parameter_id, problems)
+                typed_element = _TypedElement(parameter_id, "Parameter", attributes.get("type", ""))
+                typed_elements.append(typed_element)
+
+        def end_element(tag: str) -> None:
+            nonlocal typed_element
+            tag = cls._local_name(tag)
+            if tag in ["packagedElement", "Model"]:
+                package_classes.pop()
+            elif tag in ["ownedAttribute", "ownedParameter"]:
+                typed_element = None
+
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        if isinstance(source, (mmap.mmap, bytes)) and XmiSource.compression(source[:8]) is None:
+            parser.Parse(source, True)
+        else:
+            with XmiSource.open(source) as stream:
+                parser.ParseFile(stream)
+
+        for relation_id, end, value in relations:
+            if value not in known_ids and value not in known_names:
+                problems.append(ValidationProblem(relation_id, f"Relation {end} {value} does not exist."))
+        for typed in typed_elements:
+            if typed.type and not cls._is_resolved_type(typed.type, type_mapping, known_ids, known_names):
+                problems.append(ValidationProblem(typed.id, f"{typed.kind} type {typed.type} cannot be resolved."))
+        return problems
+
+    @classmethod
+    def _check_signature(
+        cls,
+        attributes: dict[str, str],
+        kind: str,
+        problems: list[ValidationProblem],
+        identifier: bool = False,
+        named: bool = True,
+    ) -> tuple[str, str]:
+        """Checks id and name of an element.
+
+        Args:
+            attributes: Attributes of the XMI element.
+            kind: Kind of the element used in messages.
+            problems: List the problems are appended to.
+            identifier: Check that the name is a valid Python identifier.
+            named: Check that the element has a name.
+        Returns:
+            Tuple of (id, name), empty strings for missing attributes.
+        """
+        element_id = cls._attribute(attributes, "id")
+        name = cls._attribute(attributes, "name")
+        if element_id is None:
+            problems.append(ValidationProblem(f"<{name or '?'}>", f"{kind} has no id."))
+        elif named and name is None:
+            problems.append(ValidationProblem(element_id, f"{kind} has no name."))
+        elif identifier and name is not None and (not name.isidentifier() or keyword.iskeyword(name)):
+            problems.append(ValidationProblem(element_id, f"{kind} name {name!r} is not a valid Python identifier."))
+        return element_id or "", name or ""
+
+    @classmethod
+    def _check_choice(
+        cls,
+        attributes: dict[str, str],
+        key: str,
+        allowed: set[str],
+        element_id: str,
+        problems: list[ValidationProblem],
+    ) -> None:
+        """Checks that an enumerated attribute is present and has an allowed value.
+
+        Args:
+            attributes: Attributes of the XMI element.
+            key: Key of the attribute.
+            allowed: Allowed values.
+            element_id: Id of the element used in messages.
+            problems: List the problems are appended to.
+        """
+        value = cls._attribute(attributes, key)
+        if value is None:
+            problems.append(ValidationProblem(element_id, f"Attribute {key} is missing."))
+        elif value not in allowed:
+            problems.append(ValidationProblem(element_id, f"Invalid {key} {value!r}."))
+
+    @classmethod
+    def _is_resolved_type(
+        cls,
+        type_name: str,
+        type_mapping: TypeMapping,
+        known_ids: set[str],
+        known_names: set[str],
+    ) -> bool:
+        """Checks whether a property or parameter type refers to something that exists.
+
+        Args:
+            type_name: Type name or id, possibly generic.
+            type_mapping: Mapping of model types to Python annotations.
+            known_ids: Ids of type elements.
+            known_names: Names of type elements.
+        Returns:
+            True if the type and all its generic arguments can be resolved.
+        """
+        return type_name.startswith("uml:") or type_name in known_ids or all(
+            class_name in known_ids or class_name in known_names
+            for class_name in type_mapping.referenced_classes(type_name)
+        )
+
+    @classmethod
+    def _attribute(cls, attributes: dict[str, str], key: str, force_namespace: bool = False) -> str | None:
+        """Gets an attribute the same way as XmiElement.get, but without raising.
+
+        Args:
+            attributes: Attributes of the XMI element.
+            key: Key of the attribute.
+            force_namespace: Force searching with namespaces.
+        Returns:
+            Attribute value or None if it is missing.
+        """
+        for qualified_key in cls._qualified_keys(key, force_namespace):
+            if (value := attributes.get(qualified_key)) is not None:
+                return value
+        return None
+
+    @classmethod
+    @cache
+    def _qualified_keys(cls, key: str, force_namespace: bool) -> tuple[str, ...]:
+        """Gets attribute keys in the order XmiElement.get tries them.
+
+        Args:
+            key: Key of the attribute.
+            force_namespace: Force searching with namespaces.
+        Returns:
+            Tuple of namespaced keys.
+        """
+        return tuple(f"{namespace}{key}" for namespace in (cls._namespaces[1:] if force_namespace else cls._namespaces))
+
+    @staticmethod
+    @cache
+    def _local_name(tag: str) -> str:
+        """Strips the namespace from a tag.
+
+        Args:
+            tag: Tag in "{namespace}name" notation.
+        Returns:
+            Tag name without the namespace.
+        """
+        return tag.rpartition("}")[2]
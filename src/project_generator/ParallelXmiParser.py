@@ -0,0 +1,135 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from project_generator.Config import Config
+from project_generator.ProjectSerializer import ProjectSerializer
+from project_generator.syntax import Project
+from project_generator.XmiParser import XmiParser
+from project_generator.XmiScanner import (
+    ElementSpan,
+    XmiScanner
+)
+from project_generator.XmiSource import XmiSource
+
+
+class ParallelXmiParser:
+    """Module responsible for parsing top-level packages of an XMI file in separate processes.
+
+    A pre-scan locates byte ranges of packages directly under the Model element. Every
+    range is wrapped with the start tags of its ancestors, parsed in a worker process and
+    the packages are put back into the project in document order.
+    """
+
+    min_packages = 2
+    batches_per_worker = 4
+
+    _model_tags = [f"{namespace}Model" for namespace in ["", Config.uml_namespace, Config.xmi_namespace]]
+    _packaged_element_tags = [
+        f"{namespace}packagedElement" for namespace in ["", Config.uml_namespace, Config.xmi_namespace]
+    ]
+
+    @classmethod
+    def parse(cls, xmi_path: Path, workers: int | None = None, mapping: mmap.mmap | None = None) -> Project:
+        """Parses an XMI file, splitting it at top-level package boundaries.
+
+        Compressed files and models with less than min_packages top-level packages are
+        parsed serially.
+
+        Args:
+            xmi_path: Path to the XMI file.
+            workers: Number of worker processes.
+            mapping: Existing memory mapping of the file, mapped here if None.
+        Returns:
+            Parsed Project syntax object, equal to the result of XmiParser.parse.
+        """
+        if mapping is None:
+            with XmiSource.map(xmi_path) as mapping:
+                return cls.parse(xmi_path, workers, mapping)  # type: ignore
+
+        if XmiSource.compression(mapping[:8]) is not None:
+            return XmiParser.parse(mapping)
+        spans = XmiScanner.scan(mapping, max_depth=2)
+        model_index = next((index for index, span in enumerate(spans) if span.tag in cls._model_tags), None)
+        if model_index is None:
+            return XmiParser.parse(mapping)
+        children = [span for span in spans if span.parent == model_index]
+        if sum(map(cls._is_package, children)) < cls.min_packages:
+            return XmiParser.parse(mapping)
+        # Other Model children are parsed with the packages, so that their types are collected
+        child_ranges = [(span.start, span.end) for span in children]
+
+        first_child = next(index for index, span in enumerate(spans) if span.parent == model_index)
+        header, footer = XmiScanner.enclosing(mapping, spans, first_child)
+
+        project = XmiParser.parse(header + footer)
+        with ProcessPoolExecutor(workers) as pool:
+            results = pool.map(
+                cls.parse_range,
+                repeat(xmi_path),
+                repeat(header),
+                cls._batch(child_ranges, (workers or os.cpu_count() or 1) * cls.batches_per_worker),
+                repeat(footer),
+            )
+            for data in results:
+                range_project = ProjectSerializer.loads(data)
+                project.packages.extend(range_project.packages)
+                project.types.update(range_project.types)
+        return project
+
+    @staticmethod
+    def parse_range(xmi_path: Path, header: bytes, byte_range: tuple[int, int], footer: bytes) -> bytes:
+        """Parses top-level packages and type elements located in a byte range of the XMI file.
+
+        Runs in worker processes.
+
+        Elements other than packages and types in the range are skipped, as in the full document.
+
+        Args:
+            xmi_path: Path to the XMI file.
+            header: Document start up to the Model start tag.
+            byte_range: Start and end offset of the Model children.
+            footer: Closing tags of the Model and root elements.
+        Returns:
+            Serialized project with the parsed packages.
+        """
+        start, end = byte_range
+        with XmiSource.map(xmi_path) as mapping:
+            document = b"".join([header, mapping[start:end], footer])
+        return ProjectSerializer.dumps(XmiParser.parse(document))
+
+    @staticmethod
+    def _batch(ranges: list[tuple[int, int]], batches: int) -> list[tuple[int, int]]:
+        """Merges consecutive element ranges into batches of similar size.
+
+        Args:
+            ranges: Sorted byte ranges of Model children.
+            batches: Desired number of batches.
+        Returns:
+            Byte ranges of batches, each spanning one or more consecutive elements.
+        """
+        target_size = (ranges[-1][1] - ranges[0][0]) / batches
+        merged: list[tuple[int, int]] = []
+        batch_start = ranges[0][0]
+        for index, (_, end) in enumerate(ranges):
+            if end - batch_start >= target_size or index == len(ranges) - 1:
+                merged.append((batch_start, end))
+                if index + 1 < len(ranges):
+                    batch_start = ranges[index + 1][0]
+        return merged
+
+    @classmethod
+    def _is_package(cls, span: ElementSpan) -> bool:
+        """Checks whether the span is a packagedElement of type uml:Package.
+
+        Args:
+            span: Span of the element.
+        Returns:
+            True if the element is a package.
+        """
+        return (
+            span.tag in cls._packaged_element_tags
+            and span.attributes.get(f"{Config.xmi_namespace}type") == "uml:Package"
+        )
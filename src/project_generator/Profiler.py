@@ -0,0 +1,138 @@
+import cProfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterator
+)
+
+ProfilerHook = Callable[[str, str, float], None]
+
+
+class Profiler:
+    """Module responsible for timing stages of the generation pipeline.
+
+    Measurements are grouped by kind:
+        - "phase": whole pipeline stages ("parse", "import_mapping", "generate"),
+        - "render": TemplateManager.generate_class per class name,
+        - "class": ProjectGenerator._generate_class (render and write) per dotted class path.
+    Every measurement is also passed to registered hooks as (kind, name, seconds).
+    """
+
+    def __init__(self, cprofile: bool = False) -> None:
+        """
+        Args:
+            cprofile: Collect cProfile statistics while profile() is active.
+        """
+        self.durations: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._hooks: list[ProfilerHook] = []
+        self._cprofile = cProfile.Profile() if cprofile else None
+
+    def add_hook(self, hook: ProfilerHook) -> None:
+        """Registers a callback called after every measurement.
+
+        Args:
+            hook: Callable receiving the measurement kind, name and duration in seconds.
+        """
+        self._hooks.append(hook)
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """Collects cProfile statistics (if enabled) for the duration of the block."""
+        if self._cprofile is None:
+            yield
+            return
+        self._cprofile.enable()
+        try:
+            yield
+        finally:
+            self._cprofile.disable()
+
+    @contextmanager
+    def measure(self, kind: str, name: str) -> Iterator[None]:
+        """Measures the duration of the block.
+
+        Args:
+            kind: Kind of the measurement.
+            name: Name of the measured item.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.durations[kind][name] += duration
+            for hook in self._hooks:
+                hook(kind, name, duration)
+
+    def phase(self, name: str):
+        """Measures the duration of a pipeline phase.
+
+        Args:
+            name: Name of the phase.
+        Returns:
+            Context manager measuring the block.
+        """
+        return self.measure("phase", name)
+
+    def slowest_classes(self, top_n: int) -> list[tuple[str, float]]:
+        """Gets the classes with the longest generation time.
+
+        Args:
+            top_n: Number of classes to return.
+        Returns:
+            List of (dotted class path, seconds) sorted from the slowest.
+        """
+        return self._top(self.durations["class"], top_n)
+
+    def slowest_packages(self, top_n: int) -> list[tuple[str, float]]:
+        """Gets the packages with the longest total generation time of their own classes.
+
+        Args:
+            top_n: Number of packages to return.
+        Returns:
+            List of (dotted package path, seconds) sorted from the slowest.
+        """
+        packages: dict[str, float] = defaultdict(float)
+        for class_path, duration in self.durations["class"].items():
+            packages[class_path.rpartition(".")[0]] += duration
+        return self._top(packages, top_n)
+
+    def dump_stats(self, stats_path: Path) -> None:
+        """Writes collected cProfile statistics, loadable with pstats.
+
+        Args:
+            stats_path: Path to the statistics file.
+        """
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(stats_path)
+
+    def report(self, top_n: int = 10) -> str:
+        """Formats phase durations and the slowest classes and packages.
+
+        Args:
+            top_n: Number of classes and packages to list.
+        Returns:
+            Human readable report.
+        """
+        lines = ["Phases:"]
+        lines += [f"  {name}: {duration:.3f}s" for name, duration in self.durations["phase"].items()]
+        lines.append(f"Slowest {top_n} classes:")
+        lines += [f"  {name}: {duration * 1000:.2f}ms" for name, duration in self.slowest_classes(top_n)]
+        lines.append(f"Slowest {top_n} packages:")
+        lines += [f"  {name}: {duration * 1000:.2f}ms" for name, duration in self.slowest_packages(top_n)]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _top(durations: dict[str, float], top_n: int) -> list[tuple[str, float]]:
+        """Sorts durations from the longest and cuts them to top_n entries.
+
+        Args:
+            durations: Map of name to duration.
+            top_n: Number of entries to return.
+        Returns:
+            List of (name, seconds).
+        """
+        return sorted(durations.items(), key=lambda item: item[1], reverse=True)[:top_n]
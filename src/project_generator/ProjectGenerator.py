@@ -1,77 +1,391 @@
+from contextlib import nullcontext
 from pathlib import Path
 
+from project_generator.ClassIRBuilder import ClassIRBuilder
+from project_generator.DataclassTemplateManager import DataclassTemplateManager
+from project_generator.DependencyIndex import DependencyIndex
+from project_generator.FileWriter import FileWriter
+from project_generator.ImportMapping import ModuleLayout
+from project_generator.Metrics import MetricsCollector
+from project_generator.Profiler import Profiler
+from project_generator.StructuralHasher import StructuralChange
+from project_generator.StubTemplateManager import StubTemplateManager
 from project_generator.syntax import (
     Class,
     Package,
     Project,
+    Reference,
     Relation
 )
-from project_generator.TemplateManager import TemplateManager
+from project_generator.TemplateManager import (
+    Emitter,
+    PackageInit,
+    TemplateManager
+)
+from project_generator.TypeMapping import TypeMapping
 
 
 class ProjectGenerator:
-    """Module responsible for generating the project structure and files."""
+    """Module responsible for generating the project structure and files.
+
+    Besides the plain classes in root_dir, further output targets (type stubs, dataclass
+    DTOs) can be generated in the same run into their own root directories. All targets
+    share the parsed project, the relation index and the ClassIRBuilder, every class is
+    rendered for all targets in one pass over the package layout.
+
+    With ModuleLayout.PACKAGE the classes of a package are written into its __init__
+    module instead of one file per class, package __init__ files are then only generated
+    for packages without classes.
+    """
 
-    def __init__(self, project: Project, root_dir: Path) -> None:
+    template_managers: dict[Emitter, type[TemplateManager]] = {
+        Emitter.PLAIN: TemplateManager,
+        Emitter.STUB: StubTemplateManager,
+        Emitter.DATACLASS: DataclassTemplateManager,
+    }
+
+    def __init__(
+        self,
+        project: Project,
+        root_dir: Path,
+        profiler: Profiler | None = None,
+        metrics: MetricsCollector | None = None,
+        type_mapping: TypeMapping | None = None,
+        package_init: PackageInit = PackageInit.NONE,
+        targets: dict[Emitter, Path] | None = None,
+        slots: bool = False,
+        lazy_compositions: bool = False,
+        layout: ModuleLayout = ModuleLayout.CLASS,
+        skip_unchanged: bool = False,
+    ) -> None:
         """
         Args:
             project: Project syntax object.
             root_dir: Root directory where the project will be generated.
+            profiler: Profiler measuring generation of the project and each class.
+            metrics: Collector of written and skipped files and render cache statistics.
+            type_mapping: Mapping of model types to Python annotations.
+            package_init: Content of generated package __init__.py files.
+            targets: Root directories of additional outputs by emitter.
+            slots: Whether classes declare their fields as __slots__ (slotted dataclass DTOs).
+            lazy_compositions: Whether compositions of classes are created on first access.
+            layout: Grouping of classes into modules.
+            skip_unchanged: Whether files already existing with the same content are left untouched.
+        """
+        self._profiler = profiler
+        self._metrics = metrics
+        self._layout = layout
+        target_list = [(Emitter.PLAIN, root_dir)] + list((targets or {}).items())
+        self._template_managers = self.create_template_managers(
+            project, target_list, profiler, type_mapping, slots, lazy_compositions, layout
+        )
+        self._relations_by_client = self.index_relations(project)
+
+        self._root_dir = root_dir
+        self._target_roots = [target_root for _, target_root in target_list]
+        self._project_root = root_dir / project.name
+        self._writer = FileWriter(
+            on_file=metrics.record_file if metrics else None,
+            skip_unchanged=skip_unchanged,
+            on_skip=metrics.record_skipped_file if metrics else None,
+        )
+        with profiler.phase("generate") if profiler else nullcontext():
+            layout = self.package_layout(self._project_root, project.packages)
+            for template_manager, target_root in zip(self._template_managers, self._target_roots):
+                target_layout = self.package_layout(target_root / project.name, project.packages)
+                package_inits = self.package_inits(
+                    template_manager, project, target_root, target_layout, package_init, self._layout
+                )
+                self._writer.create_directories(
+                    [package_path for package_path, _ in target_layout]
+                    + [init_path.parent for init_path, _ in package_inits]
+                )
+                for init_path, content in package_inits:
+                    self._writer.write(init_path, content)
+            for package_path, package in layout:
+                self._generate_package(package_path, package)
+        if metrics is not None:
+            metrics.record_render_cache(
+                sum(template_manager.cache_hits for template_manager in self._template_managers),
+                sum(template_manager.cache_misses for template_manager in self._template_managers),
+            )
+
+    @classmethod
+    def create_template_managers(
+        cls,
+        project: Project,
+        targets: list[tuple[Emitter, Path]],
+        profiler: Profiler | None = None,
+        type_mapping: TypeMapping | None = None,
+        slots: bool = False,
+        lazy_compositions: bool = False,
+        layout: ModuleLayout = ModuleLayout.CLASS,
+    ) -> list[TemplateManager]:
+        """Creates the template managers of output targets sharing one ClassIRBuilder.
+
+        Args:
+            project: Project syntax object.
+            targets: List of (emitter, root directory) of the outputs.
+            profiler: Profiler measuring import mapping and class rendering.
+            type_mapping: Mapping of model types to Python annotations.
+            slots: Whether classes declare their fields as __slots__.
+            lazy_compositions: Whether compositions are created on first access.
+            layout: Grouping of classes into modules.
+        Returns:
+            Template managers in the order of the targets.
         """
-        self._template_manager = TemplateManager(project, root_dir)
-        self._relations_by_client: dict[str, list[Relation]] = {}
-        self._index_relations(project)
+        class_ir_builder = ClassIRBuilder(project, profiler, type_mapping, slots, lazy_compositions, layout)
+        return [
+            cls.template_managers[emitter](project, target_root, profiler, class_ir_builder=class_ir_builder)
+            for emitter, target_root in targets
+        ]
 
+    @classmethod
+    def package_layout(cls, parent: Path, packages: list[Package]) -> list[tuple[Path, Package]]:
+        """Computes directories of the packages and their subpackages.
+
+        Args:
+            parent: Path to the parent directory.
+            packages: Package syntax objects.
+        Returns:
+            List of (package directory path, package), parents before their subpackages.
+        """
+        layout: list[tuple[Path, Package]] = []
+        for package in packages:
+            package_path = parent / package.name
+            layout.append((package_path, package))
+            layout += cls.package_layout(package_path, package.subpackages)
+        return layout
+
+    @staticmethod
+    def package_inits(
+        template_manager: TemplateManager,
+        project: Project,
+        root_dir: Path,
+        layout: list[tuple[Path, Package]],
+        package_init: PackageInit,
+        module_layout: ModuleLayout = ModuleLayout.CLASS,
+    ) -> list[tuple[Path, bytes]]:
+        """Renders __init__ files of the project directory and all package directories.
+
+        Args:
+            template_manager: Template manager of the project.
+            project: Project syntax object.
+            root_dir: Root directory where the project is generated.
+            layout: Package layout from package_layout().
+            package_init: Content of the files.
+            module_layout: Grouping of classes into modules, packages with classes have
+                their module as __init__ file with ModuleLayout.PACKAGE.
+        Returns:
+            List of (file path, content), empty for PackageInit.NONE.
+        """
+        if package_init == PackageInit.NONE:
+            return []
         project_root = root_dir / project.name
-        for package in project.packages:
-            self._generate_package(project_root, package)
+        return [
+            (
+                project_root / f"__init__{template_manager.file_suffix}",
+                template_manager.generate_package_init(project.packages, [], package_init).encode(),
+            )
+        ] + [
+            (
+                package_path / f"__init__{template_manager.file_suffix}",
+                template_manager.generate_package_init(package.subpackages, package.classes, package_init).encode(),
+            )
+            for package_path, package in layout
+            if module_layout == ModuleLayout.CLASS or not package.classes
+        ]
+
+    @classmethod
+    def affected_files(
+        cls,
+        old_project: Project,
+        new_project: Project,
+        changes: list[StructuralChange],
+        root_dir: Path,
+        type_mapping: TypeMapping | None = None,
+        layout: ModuleLayout = ModuleLayout.CLASS,
+    ) -> list[Path]:
+        """Finds class files whose generated content is changed by structural changes.
+
+        Files are looked up in both versions, so removed and renamed classes list their
+        old file as well. Changed members affect the file of their class, changed
+        relations the file of their client class and changed packages all class files
+        below them. Added, removed, renamed or moved classes and data types also affect
+        the files of their dependents from the DependencyIndex, which import them or
+        name them in annotations and parameters. Changes of members only do not.
+
+        Args:
+            old_project: Old version of the project.
+            new_project: New version of the project.
+            changes: Changes from StructuralHasher.diff().
+            root_dir: Root directory where the project is generated.
+            type_mapping: Mapping of model types to Python annotations.
+            layout: Grouping of classes into modules, a class file is the module of its
+                package with ModuleLayout.PACKAGE.
+        Returns:
+            Sorted list of class file paths.
+        """
+        files: set[Path] = set()
+        indexes = []
+        for project in (old_project, new_project):
+            files_by_id: dict[str, list[Path]] = {}
+            files_by_name: dict[str, list[Path]] = {}
+            # Element id -> ids of the types defined by the element and its children
+            type_ids: dict[str, list[str]] = {}
+            # Type id -> name and package path of the type
+            types: dict[str, tuple[str, Path]] = {}
+            relations: dict[str, Relation] = {}
+            for package_path, package in reversed(cls.package_layout(root_dir / project.name, project.packages)):
+                package_files = [
+                    file_path for subpackage in package.subpackages for file_path in files_by_id.get(subpackage.id, [])
+                ]
+                package_types = [
+                    type_id for subpackage in package.subpackages for type_id in type_ids.get(subpackage.id, [])
+                ]
+                for class_syntax in package.classes:
+                    if isinstance(class_syntax, Reference):
+                        continue
+                    if layout == ModuleLayout.PACKAGE:
+                        class_file = package_path / "__init__.py"
+                    else:
+                        class_file = package_path / f"{class_syntax.name}.py"
+                    package_files.append(class_file)
+                    files_by_name.setdefault(class_syntax.name, []).append(class_file)
+                    for member in [class_syntax, *class_syntax.properties, *class_syntax.operations]:
+                        files_by_id[member.id] = [class_file]
+                    type_ids[class_syntax.id] = [class_syntax.id]
+                    types[class_syntax.id] = (class_syntax.name, package_path)
+                    package_types.append(class_syntax.id)
+                for data_type in package.data_types:
+                    type_ids[data_type.id] = [data_type.id]
+                    types[data_type.id] = (data_type.name, package_path)
+                    package_types.append(data_type.id)
+                files_by_id[package.id] = package_files
+                type_ids[package.id] = package_types
+                relations.update((relation.id, relation) for relation in package.dependencies)
+
+            for change in changes:
+                if change.kind == "relation" and change.id in relations:
+                    client = relations[change.id].client
+                    files.update(files_by_name.get(project.types.get(client, client), []))
+                else:
+                    files.update(files_by_id.get(change.id, []))
+            indexes.append((project, files_by_id, type_ids, types))
 
-    def _index_relations(self, project: Project) -> None:
+        # Only types that were added, removed, renamed or moved change the code of their dependents
+        (_, _, old_type_ids, old_types), (_, _, new_type_ids, new_types) = indexes
+        changed_types = {
+            type_id
+            for change in changes
+            if change.kind in ("package", "class", "data_type")
+            for type_id in old_type_ids.get(change.id, []) + new_type_ids.get(change.id, [])
+            if old_types.get(type_id) != new_types.get(type_id)
+        }
+        if changed_types:
+            for project, files_by_id, _, types in indexes:
+                dependency_index = DependencyIndex(project, type_mapping)
+                for type_id in changed_types & types.keys():
+                    for dependent in dependency_index.dependents(types[type_id][0]):
+                        files.update(files_by_id.get(dependent.id, []))
+        return sorted(files)
+
+    @staticmethod
+    def index_relations(project: Project) -> dict[str, list[Relation]]:
         """Builds map: class name -> list of relations where it is the client.
 
+        Clients given by id are resolved to class names with the project type table.
+
         Args:
             project: Project syntax object.
+        Returns:
+            Map of client class name to its relations.
         """
+        relations_by_client: dict[str, list[Relation]] = {}
 
         def visit_package(pkg: Package) -> None:
             for relation in pkg.dependencies:
-                self._relations_by_client.setdefault(
-                    relation.client, []
+                relations_by_client.setdefault(
+                    project.types.get(relation.client, relation.client), []
                 ).append(relation)
             for sub in pkg.subpackages:
                 visit_package(sub)
 
         for pkg in project.packages:
             visit_package(pkg)
+        return relations_by_client
 
-    def _generate_package(self, parent: Path, package: Package) -> None:
-        """Generates a package directory and its contents.
+    def _generate_package(self, package_path: Path, package: Package) -> None:
+        """Generates class files of a package directory in all targets.
 
         Args:
-            parent: Path to the parent directory.
+            package_path: Path to the package directory.
             package: Package syntax object.
         """
-        package_path = parent / package.name
-        package_path.mkdir(parents=True, exist_ok=True)
+        # Package directories of the other targets mirror the layout of the plain classes
+        package_dir = package_path.relative_to(self._root_dir)
+        package_paths = [target_root / package_dir for target_root in self._target_roots]
+        if self._layout == ModuleLayout.PACKAGE:
+            if package.classes:
+                self._generate_module(package_paths, package)
+            return
         for class_syntax in package.classes:
-            self._generate_class(package_path, class_syntax)
-        for subpackage in package.subpackages:
-            self._generate_package(package_path, subpackage)
+            self._generate_class(package_paths, class_syntax)
 
-    def _generate_class(self, package_path: Path, class_syntax: Class) -> None:
-        """Generates a class file from its syntax object.
+    def _generate_module(self, package_paths: list[Path], package: Package) -> None:
+        """Generates the module files of a package holding all its classes.
 
         Args:
-            package_path: Path to the package directory.
+            package_paths: Paths to the package directory in each target.
+            package: Package syntax object.
+        """
+        if self._profiler is None:
+            self._write_module(package_paths, package)
+            return
+        module_path = ".".join(package_paths[0].relative_to(self._project_root).parts + ("__init__",))
+        with self._profiler.measure("class", module_path):
+            self._write_module(package_paths, package)
+
+    def _write_module(self, package_paths: list[Path], package: Package) -> None:
+        """Renders the module of a package for every target and queues the files for writing.
+
+        Args:
+            package_paths: Paths to the package directory in each target.
+            package: Package syntax object.
+        """
+        for template_manager, package_path in zip(self._template_managers, package_paths):
+            module = template_manager.generate_module(package.classes, self._relations_by_client)
+            self._writer.write(package_path / f"__init__{template_manager.file_suffix}", module.encode())
+
+    def _generate_class(self, package_paths: list[Path], class_syntax: Class) -> None:
+        """Generates the files of a class from its syntax object.
+
+        Args:
+            package_paths: Paths to the package directory in each target.
+            class_syntax: Class syntax object.
+        """
+        if self._profiler is None:
+            self._write_class(package_paths, class_syntax)
+            return
+        class_path = ".".join(package_paths[0].relative_to(self._project_root).parts + (class_syntax.name,))
+        with self._profiler.measure("class", class_path):
+            self._write_class(package_paths, class_syntax)
+
+    def _write_class(self, package_paths: list[Path], class_syntax: Class) -> None:
+        """Renders a class for every target and queues the files for writing.
+
+        Args:
+            package_paths: Paths to the package directory in each target.
             class_syntax: Class syntax object.
         """
         relations_for_class = self._relations_by_client.get(
             class_syntax.name, []
         )
-        class_template = self._template_manager.generate_class(
-            class_syntax,
-            relations_for_class,
-        )
-        class_path = package_path / f"{class_syntax.name}.py"
-        with open(class_path, "w") as f:
-            f.write(class_template)
+        for template_manager, package_path in zip(self._template_managers, package_paths):
+            class_template = template_manager.generate_class(
+                class_syntax,
+                relations_for_class,
+            )
+            self._writer.write(
+                package_path / f"{class_syntax.name}{template_manager.file_suffix}", class_template.encode()
+            )
@@ -0,0 +1,425 @@
+import marshal
+import struct
+from pathlib import Path
+
+from project_generator.exceptions import (
+    InvalidModelFile,
+    UnsupportedModelVersion
+)
+from project_generator.syntax import (
+    Class,
+    DataType,
+    Operation,
+    Package,
+    Parameter,
+    ParameterDirection,
+    Project,
+    Property,
+    Reference,
+    Relation,
+    RelationType,
+    Visibility
+)
+
+
+class ProjectSerializer:
+    """Module responsible for storing parsed projects in a compact binary format.
+
+    The file starts with a fixed header (magic bytes, format version and the key of the
+    source the model was parsed from) followed by a marshal payload. Every string is stored
+    once in a string table and referenced by index, enums are stored by ordinal.
+    Unresolved Reference placeholders are kept, so models of multi-document XMI can be cached.
+    The type resolution table of the project is stored with it, version 4 added the
+    documents of types referenced by href.
+    """
+
+    magic = b"PGMODEL\x00"
+    version = 4
+
+    _header = struct.Struct(">HI")
+    _visibilities = list(Visibility)
+    _directions = list(ParameterDirection)
+    _relation_types = list(RelationType)
+
+    @classmethod
+    def dump(cls, project: Project, model_path: Path, source_key: str = "") -> None:
+        """Serializes a project into a model file.
+
+        Args:
+            project: Project syntax object.
+            model_path: Path to the model file to write.
+            source_key: Key identifying the source the project was parsed from.
+        """
+        model_path.write_bytes(cls.dumps(project, source_key))
+
+    @classmethod
+    def dumps(cls, project: Project, source_key: str = "") -> bytes:
+        """Serializes a project into bytes.
+
+        Args:
+            project: Project syntax object.
+            source_key: Key identifying the source the project was parsed from.
+        Returns:
+            Serialized project.
+        """
+        strings: dict[str, int] = {}
+        tree = _Encoder(strings).project(project)
+        encoded_key = source_key.encode()
+        return b"".join([
+            cls.magic,
+            cls._header.pack(cls.version, len(encoded_key)),
+            encoded_key,
+            marshal.dumps((list(strings), tree)),
+        ])
+
+    @classmethod
+    def load(cls, model_path: Path) -> Project:
+        """Deserializes a project from a model file.
+
+        Args:
+            model_path: Path to the model file.
+        Returns:
+            Deserialized Project syntax object.
+        """
+        return cls.loads(model_path.read_bytes())
+
+    @classmethod
+    def loads(cls, data: bytes) -> Project:
+        """Deserializes a project from bytes.
+
+        Args:
+            data: Serialized project.
+        Returns:
+            Deserialized Project syntax object.
+        """
+        _, key_length = cls._unpack_header(data)
+        payload_offset = len(cls.magic) + cls._header.size + key_length
+        try:
+            strings, tree = marshal.loads(memoryview(data)[payload_offset:])
+        except (EOFError, ValueError, TypeError) as error:
+            raise InvalidModelFile(f"Model payload is corrupted: {error}.") from error
+        return _Decoder(strings).project(tree)
+
+    @classmethod
+    def is_model_file(cls, path: Path) -> bool:
+        """Checks whether the given file is a serialized model.
+
+        Args:
+            path: Path to the file to check.
+        Returns:
+            True if the file starts with the model magic bytes.
+        """
+        with open(path, "rb") as f:
+            return f.read(len(cls.magic)) == cls.magic
+
+    @classmethod
+    def read_source_key(cls, model_path: Path) -> str:
+        """Reads the source key stored in the model file header.
+
+        Args:
+            model_path: Path to the model file.
+        Returns:
+            Source key the model was serialized with.
+        """
+        with open(model_path, "rb") as f:
+            head = f.read(len(cls.magic) + cls._header.size)
+            _, key_length = cls._unpack_header(head)
+            return f.read(key_length).decode()
+
+    @classmethod
+    def _unpack_header(cls, data: bytes) -> tuple[int, int]:
+        """Validates magic bytes and format version.
+
+        Args:
+            data: Bytes starting with the model header.
+        Returns:
+            Tuple of (format version, source key length).
+        """
+        if data[:len(cls.magic)] != cls.magic or len(data) < len(cls.magic) + cls._header.size:
+            raise InvalidModelFile("File is not a serialized project model.")
+        version, key_length = cls._header.unpack_from(data, len(cls.magic))
+        if version != cls.version:
+            raise UnsupportedModelVersion(
+                f"Model format version {version} is not supported (expected {cls.version})."
+            )
+        return version, key_length
+
+
+# First item of encoded Reference placeholders, string indices are never negative.
+_reference_marker = -1
+
+
+class _Encoder:
+    """Converts syntax objects into nested tuples of string table indices."""
+
+    _visibility_ordinals = {visibility: index for index, visibility in enumerate(Visibility)}
+    _direction_ordinals = {direction: index for index, direction in enumerate(ParameterDirection)}
+    _relation_type_ordinals = {relation_type: index for index, relation_type in enumerate(RelationType)}
+
+    def __init__(self, strings: dict[str, int]) -> None:
+        """
+        Args:
+            strings: String table being built, maps each string to its index.
+        """
+        self._strings = strings
+
+    def string(self, value: str) -> int:
+        """Adds a string to the string table.
+
+        Args:
+            value: String to store.
+        Returns:
+            Index of the string in the table.
+        """
+        if (index := self._strings.get(value)) is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def project(self, project: Project) -> tuple:
+        """Encodes a project with its packages and type resolution table.
+
+        Args:
+            project: Project syntax object.
+        Returns:
+            Tuple of (id, name, packages, type table pairs).
+        """
+        return (
+            self.string(project.id),
+            self.string(project.name),
+            [self.package(package) for package in project.packages],
+            [(self.string(type_id), self.string(type_name)) for type_id, type_name in project.types.items()],
+        )
+
+    def package(self, package: Package) -> tuple:
+        """Encodes a package with its subpackages, classes, relations and data types.
+
+        Args:
+            package: Package syntax object.
+        Returns:
+            Tuple of (id, name, subpackages, classes, relations, data types).
+        """
+        return (
+            self.string(package.id),
+            self.string(package.name),
+            [self.member(subpackage, self.package) for subpackage in package.subpackages],
+            [self.member(class_syntax, self.class_) for class_syntax in package.classes],
+            [self.member(relation, self.relation) for relation in package.dependencies],
+            [self.member(data_type, self.data_type) for data_type in package.data_types],
+        )
+
+    def member(self, element, encode) -> tuple:
+        """Encodes a packaged element or its Reference placeholder.
+
+        Args:
+            element: Syntax object or Reference placeholder.
+            encode: Method encoding the syntax object.
+        Returns:
+            Encoded element, placeholders start with the reference marker.
+        """
+        if isinstance(element, Reference):
+            return (_reference_marker, self.string(element.id), self.string(element.document))
+        return encode(element)
+
+    def data_type(self, data_type: DataType) -> tuple:
+        """Encodes a data type.
+
+        Args:
+            data_type: Data type syntax object.
+        Returns:
+            Tuple of (id, name).
+        """
+        return (self.string(data_type.id), self.string(data_type.name))
+
+    def class_(self, class_syntax: Class) -> tuple:
+        """Encodes a class with its properties and operations.
+
+        Args:
+            class_syntax: Class syntax object.
+        Returns:
+            Tuple of (id, name, properties, operations).
+        """
+        return (
+            self.string(class_syntax.id),
+            self.string(class_syntax.name),
+            [
+                (
+                    self.string(prop.id),
+                    self.string(prop.name),
+                    self.string(prop.type),
+                    self._visibility_ordinals[prop.visibility],
+                    self.string(prop.type_document),
+                )
+                for prop in class_syntax.properties
+            ],
+            [self.operation(operation) for operation in class_syntax.operations],
+        )
+
+    def operation(self, operation: Operation) -> tuple:
+        """Encodes an operation with its parameters.
+
+        Args:
+            operation: Operation syntax object.
+        Returns:
+            Tuple of (id, name, parameters, visibility ordinal).
+        """
+        return (
+            self.string(operation.id),
+            self.string(operation.name),
+            [
+                (
+                    self.string(parameter.id),
+                    self.string(parameter.name),
+                    self.string(parameter.type),
+                    self._direction_ordinals[parameter.direction],
+                    self.string(parameter.type_document),
+                )
+                for parameter in operation.parameters
+            ],
+            self._visibility_ordinals[operation.visibility],
+        )
+
+    def relation(self, relation: Relation) -> tuple:
+        """Encodes a relation.
+
+        Args:
+            relation: Relation syntax object.
+        Returns:
+            Tuple of (id, name, relation type ordinal, client, supplier).
+        """
+        return (
+            self.string(relation.id),
+            self.string(relation.name),
+            self._relation_type_ordinals[relation.type],
+            self.string(relation.client),
+            self.string(relation.supplier),
+        )
+
+
+class _Decoder:
+    """Rebuilds syntax objects from nested tuples of string table indices."""
+
+    def __init__(self, strings: list[str]) -> None:
+        """
+        Args:
+            strings: String table of the serialized project.
+        """
+        self._strings = strings
+
+    def project(self, data: tuple) -> Project:
+        """Decodes a project with its packages and type resolution table.
+
+        Args:
+            data: Tuple built by _Encoder.project().
+        Returns:
+            Project syntax object.
+        """
+        s = self._strings
+        id_, name, packages, types = data
+        return Project(
+            s[id_],
+            s[name],
+            [self.package(package) for package in packages],
+            {s[type_id]: s[type_name] for type_id, type_name in types},
+        )
+
+    def package(self, data: tuple) -> Package:
+        """Decodes a package with its subpackages, classes, relations and data types.
+
+        Args:
+            data: Tuple built by _Encoder.package().
+        Returns:
+            Package syntax object.
+        """
+        s = self._strings
+        id_, name, subpackages, classes, relations, data_types = data
+        return Package(
+            s[id_],
+            s[name],
+            [self.member(subpackage, self.package) for subpackage in subpackages],
+            [self.member(class_data, self.class_) for class_data in classes],
+            [self.member(relation, self.relation) for relation in relations],
+            [self.member(data_type, self.data_type) for data_type in data_types],
+        )
+
+    def member(self, data: tuple, decode):
+        """Decodes a packaged element or its Reference placeholder.
+
+        Args:
+            data: Tuple built by _Encoder.member().
+            decode: Method decoding the syntax object.
+        Returns:
+            Syntax object or Reference placeholder.
+        """
+        if data[0] == _reference_marker:
+            return Reference(self._strings[data[1]], "", self._strings[data[2]])
+        return decode(data)
+
+    def data_type(self, data: tuple) -> DataType:
+        """Decodes a data type.
+
+        Args:
+            data: Tuple built by _Encoder.data_type().
+        Returns:
+            Data type syntax object.
+        """
+        return DataType(self._strings[data[0]], self._strings[data[1]])
+
+    def class_(self, data: tuple) -> Class:
+        """Decodes a class with its properties and operations.
+
+        Args:
+            data: Tuple built by _Encoder.class_().
+        Returns:
+            Class syntax object.
+        """
+        s = self._strings
+        visibilities = ProjectSerializer._visibilities
+        id_, name, properties, operations = data
+        return Class(
+            s[id_],
+            s[name],
+            [
+                Property(s[prop_id], s[prop_name], s[prop_type], visibilities[visibility], s[type_document])
+                for prop_id, prop_name, prop_type, visibility, type_document in properties
+            ],
+            [self.operation(operation) for operation in operations],
+        )
+
+    def operation(self, data: tuple) -> Operation:
+        """Decodes an operation with its parameters.
+
+        Args:
+            data: Tuple built by _Encoder.operation().
+        Returns:
+            Operation syntax object.
+        """
+        s = self._strings
+        directions = ProjectSerializer._directions
+        id_, name, parameters, visibility = data
+        return Operation(
+            s[id_],
+            s[name],
+            [
+                Parameter(s[param_id], s[param_name], s[param_type], directions[direction], s[type_document])
+                for param_id, param_name, param_type, direction, type_document in parameters
+            ],
+            ProjectSerializer._visibilities[visibility],
+        )
+
+    def relation(self, data: tuple) -> Relation:
+        """Decodes a relation.
+
+        Args:
+            data: Tuple built by _Encoder.relation().
+        Returns:
+            Relation syntax object.
+        """
+        s = self._strings
+        id_, name, relation_type, client, supplier = data
+        return Relation(
+            s[id_],
+            s[name],
+            ProjectSerializer._relation_types[relation_type],
+            s[client],
+            s[supplier],
+        )
@@ -0,0 +1,268 @@
+from dataclasses import dataclass
+from hashlib import blake2b
+
+from project_generator.syntax import (
+    Class,
+    DataType,
+    Operation,
+    Package,
+    Project,
+    Property,
+    Reference,
+    Relation
+)
+
+
+@dataclass
+class HashNode:
+    """Structural hash of a syntax element and the hashes of its children."""
+    kind: str
+    id: str
+    name: str
+    # Hash of the element's own fields, without its children
+    own: bytes
+    # Hash of the own fields and all children, equal digests mean equal subtrees
+    digest: bytes
+    children: dict[tuple[str, str], "HashNode"]
+
+
+@dataclass
+class StructuralChange:
+    """Added, removed or modified element found by comparing two hash trees."""
+    change: str
+    kind: str
+    id: str
+    name: str
+    # Names of the enclosing elements, starting with the project
+    path: tuple[str, ...]
+
+    def __str__(self) -> str:
+        return f"{self.change} {self.kind} {self.id} ({'.'.join(self.path + (self.name,))})"
+
+
+class StructuralHasher:
+    """Module responsible for Merkle-style hashing of parsed projects.
+
+    Every element gets a hash of its own fields and a digest combining it with the
+    digests of its children, computed bottom-up in one pass. The hashes are built from
+    syntax objects, so attribute order and formatting of the XMI do not matter. Order
+    does matter where it changes the generated code: member order is part of the own
+    hash of a class and relation order part of the own hash of a package. Children are
+    otherwise combined in sorted order.
+
+    Two hash trees are compared by descending only into children whose digests differ.
+    """
+
+    _separator = "\x1f"
+    digest_size = 16
+
+    @classmethod
+    def hash_project(cls, project: Project) -> HashNode:
+        """Hashes a project with all its packages.
+
+        Args:
+            project: Project syntax object.
+        Returns:
+            Hash tree of the project.
+        """
+        return cls._node(
+            "project",
+            project.id,
+            project.name,
+            [item for type_id in sorted(project.types) for item in (type_id, project.types[type_id])],
+            [cls.hash_package(package) for package in project.packages],
+        )
+
+    @classmethod
+    def hash_package(cls, package: Package | Reference) -> HashNode:
+        """Hashes a package with its subpackages, classes, relations and data types.
+
+        Args:
+            package: Package syntax object.
+        Returns:
+            Hash tree of the package.
+        """
+        if isinstance(package, Reference):
+            return cls._hash_reference(package)
+        return cls._node(
+            "package",
+            package.id,
+            package.name,
+            [relation.id for relation in package.dependencies],
+            [cls.hash_package(subpackage) for subpackage in package.subpackages]
+            + [cls.hash_class(class_syntax) for class_syntax in package.classes]
+            + [cls._hash_relation(relation) for relation in package.dependencies]
+            + [cls._hash_data_type(data_type) for data_type in package.data_types],
+        )
+
+    @classmethod
+    def hash_class(cls, class_syntax: Class | Reference) -> HashNode:
+        """Hashes a class with its properties and operations.
+
+        Args:
+            class_syntax: Class syntax object.
+        Returns:
+            Hash tree of the class.
+        """
+        if isinstance(class_syntax, Reference):
+            return cls._hash_reference(class_syntax)
+        return cls._node(
+            "class",
+            class_syntax.id,
+            class_syntax.name,
+            [member.id for member in class_syntax.properties] + [member.id for member in class_syntax.operations],
+            [cls._hash_property(prop) for prop in class_syntax.properties]
+            + [cls._hash_operation(operation) for operation in class_syntax.operations],
+        )
+
+    @classmethod
+    def diff(cls, old: HashNode, new: HashNode) -> list[StructuralChange]:
+        """Compares two hash trees, subtrees with equal digests are skipped.
+
+        Args:
+            old: Hash tree of the old version.
+            new: Hash tree of the new version.
+        Returns:
+            Changes in depth-first order, children of added and removed elements are not listed.
+        """
+        changes: list[StructuralChange] = []
+        cls._diff(old, new, (), changes)
+        return changes
+
+    @classmethod
+    def _diff(cls, old: HashNode, new: HashNode, path: tuple[str, ...], changes: list[StructuralChange]) -> None:
+        """Compares two versions of an element.
+
+        Args:
+            old: Hash tree of the old version.
+            new: Hash tree of the new version.
+            path: Names of the enclosing elements.
+            changes: List the changes are appended to.
+        """
+        if old.digest == new.digest:
+            return
+        if old.own != new.own:
+            changes.append(StructuralChange("modified", new.kind, new.id, new.name, path))
+        child_path = path + (new.name,)
+        for key, old_child in old.children.items():
+            if (new_child := new.children.get(key)) is None:
+                changes.append(StructuralChange("removed", old_child.kind, old_child.id, old_child.name, child_path))
+            else:
+                cls._diff(old_child, new_child, child_path, changes)
+        for key, new_child in new.children.items():
+            if key not in old.children:
+                changes.append(StructuralChange("added", new_child.kind, new_child.id, new_child.name, child_path))
+
+    @classmethod
+    def _hash_property(cls, prop: Property | Reference) -> HashNode:
+        """Hashes a property by its name, type and visibility.
+
+        Args:
+            prop: Property syntax object.
+        Returns:
+            Hash node of the property.
+        """
+        if isinstance(prop, Reference):
+            return cls._hash_reference(prop)
+        return cls._node("property", prop.id, prop.name, [prop.type, prop.visibility._value_])
+
+    @classmethod
+    def _hash_operation(cls, operation: Operation | Reference) -> HashNode:
+        """Hashes an operation, its parameters are part of its own fields.
+
+        Args:
+            operation: Operation syntax object.
+        Returns:
+            Hash node of the operation.
+        """
+        if isinstance(operation, Reference):
+            return cls._hash_reference(operation)
+        return cls._node(
+            "operation",
+            operation.id,
+            operation.name,
+            [operation.visibility._value_] + [
+                item
+                for parameter in operation.parameters
+                for item in (
+                    (parameter.id, parameter.document) if isinstance(parameter, Reference)
+                    else (parameter.id, parameter.name, parameter.type, parameter.direction._value_)
+                )
+            ],
+        )
+
+    @classmethod
+    def _hash_relation(cls, relation: Relation | Reference) -> HashNode:
+        """Hashes a relation by its name, type, client and supplier.
+
+        Args:
+            relation: Relation syntax object.
+        Returns:
+            Hash node of the relation.
+        """
+        if isinstance(relation, Reference):
+            return cls._hash_reference(relation)
+        return cls._node(
+            "relation", relation.id, relation.name, [relation.type._value_, relation.client, relation.supplier]
+        )
+
+    @classmethod
+    def _hash_data_type(cls, data_type: DataType | Reference) -> HashNode:
+        """Hashes a data type by its name.
+
+        Args:
+            data_type: Data type syntax object.
+        Returns:
+            Hash node of the data type.
+        """
+        if isinstance(data_type, Reference):
+            return cls._hash_reference(data_type)
+        return cls._node("data_type", data_type.id, data_type.name, [])
+
+    @classmethod
+    def _hash_reference(cls, reference: Reference) -> HashNode:
+        """Hashes an unresolved reference by its name and referenced document.
+
+        Args:
+            reference: Reference syntax object.
+        Returns:
+            Hash node of the reference.
+        """
+        return cls._node("reference", reference.id, reference.name, [reference.document])
+
+    @classmethod
+    def _node(
+        cls,
+        kind: str,
+        element_id: str,
+        name: str,
+        fields: list[str],
+        children: list[HashNode] | None = None,
+    ) -> HashNode:
+        """Builds the hash node of an element.
+
+        Args:
+            kind: Kind of the element.
+            element_id: Id of the element.
+            name: Name of the element.
+            fields: Other fields of the element as strings.
+            children: Hash nodes of the child elements.
+        Returns:
+            Hash node of the element.
+        """
+        own = blake2b(
+            cls._separator.join([kind, element_id, name, *fields]).encode(), digest_size=cls.digest_size
+        ).digest()
+        if not children:
+            return HashNode(kind, element_id, name, own, own, {})
+        digest = blake2b(own, digest_size=cls.digest_size)
+        for child_digest in sorted(child.digest for child in children):
+            digest.update(child_digest)
+        return HashNode(
+            kind,
+            element_id,
+            name,
+            own,
+            digest.digest(),
+            {(child.kind, child.id): child for child in children},
+        )
@@ -0,0 +1,116 @@
+from project_generator.ir import (
+    ClassIR,
+    FieldIR,
+    FieldKind
+)
+from project_generator.syntax import (
+    Class,
+    Package
+)
+from project_generator.TemplateManager import (
+    PackageInit,
+    TemplateManager
+)
+
+
+class StubTemplateManager(TemplateManager):
+    """Module responsible for generating .pyi type stubs of the classes.
+
+    Stubs declare the annotated attributes assigned by the constructor, the constructor
+    and the method signatures. Package stubs re-export their classes and subpackages,
+    lazy package initialization is declared like eager imports.
+    """
+
+    file_suffix: str = ".pyi"
+
+    constructor_body_header: str = "def __init__({args}) -> None: ..."
+
+    method_body: str = """
+def {method_name}({args}) -> {return_type}: ...
+"""
+
+    _annotations = {
+        FieldKind.PROPERTY: "{type}",
+        FieldKind.ASSOCIATION: "{type} | None",
+        FieldKind.AGGREGATION: "list[{type}]",
+        FieldKind.COMPOSITION: "{type}",
+        FieldKind.LAZY_COMPOSITION: "{type}",
+    }
+
+    @staticmethod
+    def _get_module_imports(class_ir: ClassIR) -> tuple[str, ...]:
+        """Gets imports of standard library modules, stubs declare lazy compositions as attributes.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            Empty tuple.
+        """
+        return ()
+
+    def generate_package_init(
+        self,
+        subpackages: list[Package],
+        classes: list[Class],
+        style: PackageInit,
+    ) -> str:
+        """Generates the __init__.pyi stub of a package re-exporting its classes and subpackages.
+
+        Args:
+            subpackages: Subpackage syntax objects of the package.
+            classes: Class syntax objects of the package.
+            style: Content of the file, must not be PackageInit.NONE.
+        Returns:
+            String containing the __init__.pyi code.
+        """
+        return super().generate_package_init(
+            subpackages, classes, PackageInit.EAGER if style == PackageInit.LAZY else style
+        )
+
+    def _generate_members(self, class_ir: ClassIR) -> list[str]:
+        """Generates the slots, attribute annotations, constructor and method signatures.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            List of member blocks, empty if the class has no members.
+        """
+        members = super()._generate_members(class_ir)
+        if class_ir.fields:
+            # Annotations follow the __slots__ declaration
+            members.insert(0 if class_ir.slots is None else 1, self._generate_attributes(class_ir.fields))
+        return members
+
+    def _generate_attributes(self, fields: tuple[FieldIR, ...]) -> str:
+        """Generates annotations of the attributes assigned by the constructor.
+
+        Args:
+            fields: Fields of the class in constructor order.
+        Returns:
+            String containing one annotation per line.
+        """
+        return "\n".join(
+            f"{field.name}: {self._annotations[field.kind].format(type=field.type)}" for field in fields
+        )
+
+    def _generate_lazy_properties(self, class_ir: ClassIR) -> str:
+        """Generates no properties, lazy compositions are annotated like attributes.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            Empty string.
+        """
+        return ""
+
+    def _generate_constructor(self, fields: tuple[FieldIR, ...]) -> str:
+        """Generates the constructor signature.
+
+        Args:
+            fields: Fields of the class in constructor order.
+        Returns:
+            String containing the constructor signature.
+        """
+        if not fields:
+            return ""
+        return self.constructor_body_header.format(args=self._format_constructor_args(fields))
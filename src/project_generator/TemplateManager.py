@@ -1,23 +1,64 @@
+from collections import OrderedDict
+from enum import Enum
 from pathlib import Path
-
-from project_generator.Config import Config
-from project_generator.ImportMapping import ImportMapping
+from threading import Lock
+
+from project_generator.ClassIRBuilder import ClassIRBuilder
+from project_generator.ImportMapping import ModuleLayout
+from project_generator.ir import (
+    ClassIR,
+    FieldIR,
+    FieldKind,
+    MethodIR,
+    ParameterIR
+)
+from project_generator.Profiler import Profiler
 from project_generator.syntax import (
     Class,
-    Operation,
-    ParameterDirection,
+    Package,
     Project,
-    Relation,
-    RelationType,
-    Visibility
+    Relation
 )
+from project_generator.TypeMapping import TypeMapping
+
+
+class PackageInit(Enum):
+    """Enum representing the content of generated package __init__.py files."""
+
+    NONE = "none"  # No __init__.py, packages are namespace packages
+    EMPTY = "empty"
+    EAGER = "eager"  # Classes and subpackages imported and listed in __all__
+    LAZY = "lazy"  # Classes and subpackages listed in __all__, imported on first access
+
+
+class Emitter(Enum):
+    """Enum representing the kind of code generated for classes."""
+
+    PLAIN = "plain"  # Classes with constructors and method bodies
+    STUB = "stub"  # Type stubs in .pyi files
+    DATACLASS = "dataclass"  # Keyword-only dataclass DTOs with fields only
 
 
 class TemplateManager:
-    """Module responsible for managing templates for code generation."""
+    """Module responsible for managing templates for code generation.
+
+    Classes are rendered from their ClassIR, built by the ClassIRBuilder of the project,
+    so rendering only formats resolved names and types. Rendered class bodies are cached
+    by the structure of the class: its properties, operations and relations with resolved
+    type names, which also determine its imports.
+    Classes of the same shape differ only by name, so the cached imports, base classes
+    and members are reused and only the class line is formatted. The cache keeps the
+    most recently used render_cache_size shapes.
+    Package modules of the package layout merge the imports of their classes, postponed
+    evaluation of annotations lets classes name classes defined later in the module.
+    Classes used only in annotations are imported under TYPE_CHECKING there, so packages
+    whose classes refer to each other do not import each other at runtime.
+    """
+
+    file_suffix: str = ".py"
 
     class_body: str = """
-{imports}class {class_name}{base_classes}:
+{imports}{decorators}class {class_name}{base_classes}:
 {members}
 """
 
@@ -28,13 +69,105 @@ def {method_name}({args}) -> {return_type}:
     pass
 """
 
-    def __init__(self, project: Project, root_dir: Path) -> None:
+    cached_property_body: str = """
+@functools.cached_property
+def {name}(self) -> {type}:
+    return {type}()
+"""
+
+    slot_property_body: str = """
+@property
+def {name}(self) -> {type}:
+    try:
+        return self.{name}_value
+    except AttributeError:
+        self.{name}_value = {type}()
+        return self.{name}_value
+"""
+
+    module_body: str = """
+from __future__ import annotations
+{imports}
+
+{classes}
+"""
+
+    eager_init_body: str = """
+{imports}
+
+__all__ = [{names}]
+"""
+
+    lazy_init_body: str = """
+import sys
+from importlib import import_module
+from types import ModuleType
+
+__all__ = [{names}]
+
+_classes = {classes}
+
+
+class _Package(ModuleType):
+    \"\"\"Keeps classes instead of their same-named modules as attributes of the package.\"\"\"
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in _classes and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    module = import_module(f".{{name}}", __name__)
+    value = getattr(module, name) if name in _classes else module
+    globals()[name] = value
+    return value
+
+
+sys.modules[__name__].__class__ = _Package
+"""
+
+    def __init__(
+        self,
+        project: Project,
+        root_dir: Path,
+        profiler: Profiler | None = None,
+        type_mapping: TypeMapping | None = None,
+        render_cache_size: int = 1024,
+        class_ir_builder: ClassIRBuilder | None = None,
+        slots: bool = False,
+        lazy_compositions: bool = False,
+        layout: ModuleLayout = ModuleLayout.CLASS,
+    ) -> None:
         """
         Args:
             project: Project syntax object.
             root_dir: Root directory where the project will be generated.
+            profiler: Profiler measuring import mapping and class rendering.
+            type_mapping: Mapping of model types to Python annotations, defaults from Config if None,
+                ignored if class_ir_builder is given.
+            render_cache_size: Maximum number of cached class shapes, 0 disables the cache.
+            class_ir_builder: Builder shared with the template managers of other output targets.
+            slots: Whether classes declare their fields as __slots__, ignored if class_ir_builder is given.
+            lazy_compositions: Whether compositions are created on first access, ignored if class_ir_builder
+                is given.
+            layout: Grouping of classes into modules, ignored if class_ir_builder is given.
         """
-        self._import_mapping = ImportMapping(project, root_dir)
+        self._profiler = profiler
+        self._builder = class_ir_builder or ClassIRBuilder(
+            project, profiler, type_mapping, slots, lazy_compositions, layout
+        )
+        # Import paths of the IR are relative to the output root
+        self._import_root = root_dir.name
+        self._render_cache_size = render_cache_size
+        # Class shape -> (ClassIR of the first class of the shape, (imports, decorators, base classes, members))
+        self._render_cache: OrderedDict[tuple, tuple[ClassIR, tuple[str, str, str, str]]] = OrderedDict()
+        # Classes may be rendered from several threads
+        self._render_cache_lock = Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def generate_class(self, class_syntax: Class, relations_for_class: list[Relation]) -> str:
         """Generates the class code from its syntax object.
@@ -45,269 +178,372 @@ def {method_name}({args}) -> {return_type}:
         Returns:
             String containing the generated class code.
         """
-        base_classes = self._get_base_classes(relations_for_class)
-        base_classes_str = f"({', '.join(base_classes)})" if base_classes else ""
+        if self._profiler is None:
+            return self._render_class(class_syntax, relations_for_class)
+        with self._profiler.measure("render", class_syntax.name):
+            return self._render_class(class_syntax, relations_for_class)
 
-        imports = self._generate_imports(class_syntax, relations_for_class)
+    def generate_module(self, classes: list[Class], relations_by_client: dict[str, list[Relation]]) -> str:
+        """Generates a module defining the classes of a package.
 
-        members_parts: list[str] = []
+        Args:
+            classes: Class syntax objects of the package.
+            relations_by_client: Map of client class name to its relations.
+        Returns:
+            String containing the generated module code with the classes in definition order.
+        """
+        module_imports: set[str] = set()
+        class_imports: set[tuple[str, str]] = set()
+        # Imports needed at runtime by any class of the module
+        runtime_imports: set[tuple[str, str]] = set()
+        class_codes: list[str] = []
+        for class_syntax in self._builder.module_order(classes, relations_by_client):
+            relations_for_class = relations_by_client.get(class_syntax.name, [])
+            if self._profiler is None:
+                class_ir, parts = self._get_rendered(class_syntax, relations_for_class)
+            else:
+                with self._profiler.measure("render", class_syntax.name):
+                    class_ir, parts = self._get_rendered(class_syntax, relations_for_class)
+            module_imports.update(self._get_module_imports(class_ir))
+            class_imports.update(class_ir.imports)
+            runtime_imports.update(set(class_ir.imports) - set(class_ir.type_checking_imports))
+            class_codes.append(self._format_class(class_syntax.name, ("",) + parts[1:]))
+        if type_checking_imports := class_imports - runtime_imports:
+            module_imports.add("from typing import TYPE_CHECKING")
+        imports = self._format_imports(
+            # Plain imports before from-imports, like isort
+            tuple(sorted(module_imports, key=lambda statement: (statement.startswith("from "), statement))),
+            tuple(sorted(runtime_imports)),
+            tuple(sorted(type_checking_imports)),
+        )
+        return self.module_body.strip().format(
+            imports=f"\n{imports}\n" if imports else "",
+            classes="\n\n".join(class_codes),
+        )
 
-        ctor_code = self._generate_constructor(
-            class_syntax, relations_for_class)
-        if ctor_code:
-            members_parts.append(ctor_code)
+    def render_class(self, class_ir: ClassIR) -> str:
+        """Renders the class code from its intermediate representation.
 
-        methods_code = self._generate_methods(class_syntax.operations)
-        if methods_code:
-            members_parts.append(methods_code)
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            String containing the generated class code.
+        """
+        return self._format_class(class_ir.name, self._render_parts(class_ir))
 
-        members_block = "\n\n".join(members_parts) if members_parts else "pass"
+    def generate_package_init(
+        self,
+        subpackages: list[Package],
+        classes: list[Class],
+        style: PackageInit,
+    ) -> str:
+        """Generates the __init__.py code of a package re-exporting its classes and subpackages.
 
-        return self.class_body.strip().format(
-            imports=(imports + "\n\n\n") if imports else "",
-            class_name=class_syntax.name,
-            base_classes=base_classes_str,
-            members=self._indent_block(members_block, indent=4),
+        Args:
+            subpackages: Subpackage syntax objects of the package.
+            classes: Class syntax objects of the package.
+            style: Content of the file, must not be PackageInit.NONE.
+        Returns:
+            String containing the __init__.py code.
+        """
+        class_names = {class_syntax.name for class_syntax in classes}
+        names = sorted({subpackage.name for subpackage in subpackages} | class_names)
+        if style == PackageInit.EMPTY or not names:
+            return ""
+        quoted_names = ", ".join(f'"{name}"' for name in names)
+        if style == PackageInit.EAGER:
+            return self.eager_init_body.strip().format(
+                imports="\n".join(
+                    f"from .{name} import {name}" if name in class_names else f"from . import {name}"
+                    for name in names
+                ),
+                names=quoted_names,
+            ) + "\n"
+        return self.lazy_init_body.strip().format(
+            names=quoted_names,
+            classes="{" + ", ".join(f'"{name}"' for name in sorted(class_names)) + "}" if class_names else "set()",
         ) + "\n"
 
-    def _get_base_classes(self, relations_for_class: list[Relation]) -> list[str]:
-        """Returns list of base class names for generalization/realization.
+    def cache_stats(self) -> dict[str, int]:
+        """Gets statistics of the render cache.
+
+        Returns:
+            Dictionary with hits, misses and the number of cached class shapes.
+        """
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._render_cache)}
+
+    def _render_class(self, class_syntax: Class, relations_for_class: list[Relation]) -> str:
+        """Renders the class code from its syntax object, reusing bodies of same-shaped classes.
 
         Args:
+            class_syntax: Class syntax object.
             relations_for_class: Relations where this class is the client.
         Returns:
-            List of base class names.
+            String containing the generated class code.
         """
-        bases: list[str] = []
-        for relation in relations_for_class:
-            if relation.type in (
-                RelationType.GENERALIZATION,
-                RelationType.REALIZATION,
-            ):
-                if relation.supplier not in bases:
-                    bases.append(relation.supplier)
-        return bases
-
-    def _generate_imports(self, class_syntax: Class, relations_for_class: list[Relation]) -> str:
-        """Generates import statements for the class based on its used types.
+        return self._format_class(class_syntax.name, self._get_rendered(class_syntax, relations_for_class)[1])
+
+    def _get_rendered(
+        self,
+        class_syntax: Class,
+        relations_for_class: list[Relation],
+    ) -> tuple[ClassIR, tuple[str, str, str, str]]:
+        """Gets the ClassIR and the rendered parts of a class, reusing those of same-shaped classes.
 
         Args:
             class_syntax: Class syntax object.
             relations_for_class: Relations where this class is the client.
         Returns:
-            String containing import statements.
+            Tuple of (ClassIR, parts from _render_parts()), the ClassIR of a reused shape
+            may have the name of another class.
         """
-        used_classes: set[str] = set(self._get_used_classes(class_syntax))
-
-        # Process all relations - add imports for all types used in relations
-        for relation in relations_for_class:
-            if relation.type in (
-                RelationType.ASSOCIATION,
-                RelationType.AGGREGATION,
-                RelationType.COMPOSITION,
-            ):
-                type_name = self._relation_type_for_imports(relation)
-                if type_name not in Config.standard_data_types:
-                    used_classes.add(type_name)
-            elif relation.type in (
-                RelationType.GENERALIZATION,
-                RelationType.REALIZATION,
-            ):
-                if relation.supplier not in Config.standard_data_types:
-                    used_classes.add(relation.supplier)
-            # Note: DEPENDENCY relations don't require imports in constructor,
-            # but if the type is used elsewhere, it will be caught by _get_used_classes
-
-        import_lines = []
-        for used_class in sorted(used_classes):
-            try:
-                import_path = self._import_mapping.get_import_path(used_class)
-                import_lines.append(f"from {import_path} import {used_class}")
-            except Exception:
-                pass
-        return "\n".join(import_lines)
-
-    def _relation_type_for_imports(self, relation: Relation) -> str:
-        """Type name used for import resolution (always supplier).
+        if self._render_cache_size <= 0:
+            class_ir = self._builder.build(class_syntax, relations_for_class)
+            return class_ir, self._render_parts(class_ir)
+        key = self._builder.shape(class_syntax, relations_for_class)
+        with self._render_cache_lock:
+            rendered = self._render_cache.get(key)
+            if rendered is not None:
+                self._render_cache.move_to_end(key)
+                self.cache_hits += 1
+        if rendered is None:
+            class_ir = self._builder.build(class_syntax, relations_for_class)
+            rendered = (class_ir, self._render_parts(class_ir))
+            with self._render_cache_lock:
+                self.cache_misses += 1
+                self._render_cache[key] = rendered
+                if len(self._render_cache) > self._render_cache_size:
+                    self._render_cache.popitem(last=False)
+        return rendered
+
+    def _format_class(self, class_name: str, parts: tuple[str, str, str, str]) -> str:
+        """Formats the class code from its name and rendered parts.
 
         Args:
-            relation: Relation syntax object.
+            class_name: Name of the class.
+            parts: Tuple of (imports block, decorators block, base classes, indented members block).
         Returns:
-            Type name used for import resolution.
+            String containing the generated class code.
         """
-        return relation.supplier
+        imports, decorators, base_classes, members = parts
+        return self.class_body.strip().format(
+            imports=imports,
+            decorators=decorators,
+            class_name=class_name,
+            base_classes=base_classes,
+            members=members,
+        ) + "\n"
 
-    def _get_used_classes(self, class_syntax: Class) -> list[str]:
-        """Gets a list of class names used by the given class syntax.
+    def _render_parts(self, class_ir: ClassIR) -> tuple[str, str, str, str]:
+        """Renders the parts of the class code which do not depend on the class name.
 
         Args:
-            class_syntax: Class syntax object.
+            class_ir: ClassIR of the class.
         Returns:
-            List of used class names.
+            Tuple of (imports block, decorators block, base classes, indented members block).
+        """
+        base_classes_str = f"({', '.join(class_ir.bases)})" if class_ir.bases else ""
+
+        imports = self._generate_imports(class_ir)
+
+        members_block = "\n\n".join(self._generate_members(class_ir)) or "pass"
+
+        decorators = self._generate_decorators(class_ir)
+
+        return (
+            (imports + "\n\n\n") if imports else "",
+            (decorators + "\n") if decorators else "",
+            base_classes_str,
+            self._indent_block(members_block, indent=4),
+        )
+
+    def _generate_decorators(self, class_ir: ClassIR) -> str:
+        """Generates the decorators of the class.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            String containing one decorator per line, empty for plain classes.
+        """
+        return ""
+
+    def _generate_members(self, class_ir: ClassIR) -> list[str]:
+        """Generates the member definitions of the class.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            List of member blocks, empty if the class has no members.
         """
         return [
-            typed_syntax.type
-            for typed_syntax in (
-                class_syntax.properties
-                + [
-                    parameter
-                    for operation in class_syntax.operations
-                    for parameter in operation.parameters
-                ]
+            code
+            for code in (
+                self._generate_slots(class_ir.slots),
+                self._generate_constructor(class_ir.fields),
+                self._generate_lazy_properties(class_ir),
+                self._generate_methods(class_ir.methods),
             )
-            if typed_syntax.type
-            and typed_syntax.type not in Config.standard_data_types
-            and not typed_syntax.type.startswith("uml:")  # Filter out meta-types
+            if code
         ]
 
-    def _generate_constructor(self, class_syntax: Class, relations_for_class: list[Relation]) -> str:
-        """Generates constructor with parameters based on properties and relations.
-
-        - normal properties,
-        - association / aggregation parameters,
-        - composition created inside.
+    @staticmethod
+    def _generate_slots(slots: tuple[str, ...] | None) -> str:
+        """Generates the __slots__ declaration.
 
         Args:
-            class_syntax: Class syntax object.
-            relations_for_class: Relations where this class is the client.
+            slots: Slot names of the class, None if it declares no slots.
         Returns:
-            String containing the constructor code.
+            String containing the declaration, empty if the class declares no slots.
         """
-        parameter_parts: list[str] = []
-        body_lines: list[str] = []
-        used_param_names: set[str] = set()
-
-        for prop in class_syntax.properties:
-            # Use property name directly (no underscore prefix in parameter)
-            prop_name = prop.name
-            # Default type to "Integer" if empty
-            prop_type = prop.type if prop.type else "Integer"
-            parameter_parts.append(
-                f"{prop_name}: {self._get_type_string(prop_type)}"
-            )
-            # Generate assignment based on visibility
-            if prop.visibility == Visibility.PRIVATE:
-                # Private: self._priv = priv
-                field_name = self._get_python_name(prop.name, prop.visibility)
-                body_lines.append(f"self.{field_name} = {prop_name}")
-            else:
-                # Public: self.pub = pub
-                body_lines.append(f"self.{prop_name} = {prop_name}")
-            used_param_names.add(prop_name)
-
-        # Process all relations, ensuring unique parameter names
-        for relation in relations_for_class:
-            supplier = relation.supplier or "Ref"
-            base_param_name = supplier[0].lower() + supplier[1:] if supplier else "ref"
-            type_name = self._get_type_string(supplier)
-
-            # Generate unique parameter name
-            param_name = base_param_name
-            counter = 1
-            while param_name in used_param_names:
-                param_name = f"{base_param_name}{counter}"
-                counter += 1
-            used_param_names.add(param_name)
-
-            if relation.type == RelationType.ASSOCIATION:
-                param = f"{param_name}: {type_name} | None = None"
-                parameter_parts.append(param)
-                body_lines.append(f"self._{param_name} = {param_name}")
-
-            elif relation.type == RelationType.AGGREGATION:
-                list_name = param_name + "s"
-                # Ensure list name is also unique
-                original_list_name = list_name
-                counter = 1
-                while list_name in used_param_names:
-                    list_name = f"{original_list_name}{counter}"
-                    counter += 1
-                used_param_names.add(list_name)
-
-                param = f"{list_name}: list[{type_name}] | None = None"
-                parameter_parts.append(param)
-                body_lines.append(
-                    f"self._{list_name} = {list_name} or []"
-                )
-
-            elif relation.type == RelationType.COMPOSITION:
-                field_name = param_name
-                # Ensure field name is unique for composition
-                original_field_name = field_name
-                counter = 1
-                while field_name in used_param_names:
-                    field_name = f"{original_field_name}{counter}"
-                    counter += 1
-                used_param_names.add(field_name)
-
-                body_lines.append(
-                    f"self._{field_name} = {type_name}()"
-                )
-
-        if not parameter_parts and not body_lines:
+        if slots is None:
             return ""
+        names = ", ".join(f'"{name}"' for name in slots)
+        return f"__slots__ = ({names},)" if len(slots) == 1 else f"__slots__ = ({names})"
 
-        if parameter_parts:
-            args = "self, " + ", ".join(parameter_parts)
-        else:
-            args = "self"
+    def _generate_constructor(self, fields: tuple[FieldIR, ...]) -> str:
+        """Generates constructor with parameters and assignments of the fields.
 
-        header = self.constructor_body_header.format(args=args)
-        if not body_lines:
-            body_lines = ["pass"]
+        Args:
+            fields: Fields of the class in constructor order.
+        Returns:
+            String containing the constructor code.
+        """
+        if not fields:
+            return ""
 
+        body_lines: list[str] = []
+        for field in fields:
+            if field.kind in (FieldKind.PROPERTY, FieldKind.ASSOCIATION):
+                body_lines.append(f"self.{field.name} = {field.parameter}")
+            elif field.kind == FieldKind.AGGREGATION:
+                body_lines.append(f"self.{field.name} = {field.parameter} or []")
+            elif field.kind == FieldKind.COMPOSITION:
+                body_lines.append(f"self.{field.name} = {field.type}()")
+        # Classes with lazy compositions only keep their own constructor signature
+        body_lines = body_lines or ["pass"]
+
+        header = self.constructor_body_header.format(args=self._format_constructor_args(fields))
         lines = [header] + [f"    {line}" for line in body_lines]
         return "\n".join(lines)
 
-    def _generate_methods(self, operations: list[Operation]) -> str:
+    @staticmethod
+    def _format_constructor_args(fields: tuple[FieldIR, ...]) -> str:
+        """Formats constructor arguments string from the fields assigned by parameters.
+
+        Args:
+            fields: Fields of the class in constructor order.
+        Returns:
+            Formatted arguments string (e.g., "self, name: str, items: list[Item] | None = None").
+        """
+        parameter_parts: list[str] = []
+        for field in fields:
+            if field.kind == FieldKind.PROPERTY:
+                parameter_parts.append(f"{field.parameter}: {field.type}")
+            elif field.kind == FieldKind.ASSOCIATION:
+                parameter_parts.append(f"{field.parameter}: {field.type} | None = None")
+            elif field.kind == FieldKind.AGGREGATION:
+                parameter_parts.append(f"{field.parameter}: list[{field.type}] | None = None")
+        return "self, " + ", ".join(parameter_parts) if parameter_parts else "self"
+
+    def _generate_lazy_properties(self, class_ir: ClassIR) -> str:
+        """Generates properties creating the lazy compositions on first access.
+
+        Classes without slots cache the instance in their __dict__, slotted classes in the
+        "<name>_value" slot.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            String containing property definitions.
+        """
+        property_body = self.cached_property_body if class_ir.slots is None else self.slot_property_body
+        return "\n\n".join(
+            property_body.strip().format(name=field.name, type=field.type)
+            for field in class_ir.fields
+            if field.kind == FieldKind.LAZY_COMPOSITION
+        )
+
+    def _generate_imports(self, class_ir: ClassIR) -> str:
+        """Generates import statements of the modules and classes used by the class.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            String containing module imports, then class imports.
+        """
+        return self._format_imports(self._get_module_imports(class_ir), class_ir.imports)
+
+    def _format_imports(
+        self,
+        module_imports: tuple[str, ...],
+        class_imports: tuple[tuple[str, str], ...],
+        type_checking_imports: tuple[tuple[str, str], ...] = (),
+    ) -> str:
+        """Formats import statements of modules and classes.
+
+        Args:
+            module_imports: Import statements of standard library modules.
+            class_imports: Sorted (import path relative to the output root, class name) pairs.
+            type_checking_imports: Sorted pairs like class_imports, imported under TYPE_CHECKING.
+        Returns:
+            String containing module imports, then class imports, then the TYPE_CHECKING block.
+        """
+        module_block = "\n".join(module_imports)
+        class_block = "\n".join(
+            f"from {self._import_root}.{import_path} import {class_name}" for import_path, class_name in class_imports
+        )
+        type_checking_block = "\n".join(
+            ["if TYPE_CHECKING:"] + [
+                f"    from {self._import_root}.{import_path} import {class_name}"
+                for import_path, class_name in type_checking_imports
+            ]
+        ) if type_checking_imports else ""
+        return "\n\n".join(block for block in (module_block, class_block, type_checking_block) if block)
+
+    @staticmethod
+    def _get_module_imports(class_ir: ClassIR) -> tuple[str, ...]:
+        """Gets imports of standard library modules used by the class.
+
+        Args:
+            class_ir: ClassIR of the class.
+        Returns:
+            Tuple of import statements.
+        """
+        if class_ir.slots is None and any(field.kind == FieldKind.LAZY_COMPOSITION for field in class_ir.fields):
+            return ("import functools",)
+        return ()
+
+    def _generate_methods(self, methods: tuple[MethodIR, ...]) -> str:
         """Generates method definitions for the class.
 
         Args:
-            operations: List of operation syntax objects.
+            methods: Methods of the class.
         Returns:
             String containing method definitions.
         """
-        if not operations:
+        if not methods:
             return ""
         return "\n\n".join(
             self.method_body.strip().format(
-                method_name=self._get_python_name(operation.name, operation.visibility),
-                args=self._format_method_args(
-                    parameter
-                    for parameter in operation.parameters
-                    if parameter.direction == ParameterDirection.IN
-                ),
-                return_type=self._get_type_string(
-                    return_types[0]
-                    if (
-                        return_types := [
-                            parameter.type
-                            for parameter in operation.parameters
-                            if parameter.direction == ParameterDirection.RETURN
-                        ]
-                    )
-                    else "None"
-                ),
+                method_name=method.name,
+                args=self._format_method_args(method.parameters),
+                return_type=method.return_type,
             )
-            for operation in operations
+            for method in methods
         )
 
-    def _format_method_args(self, parameters) -> str:
+    @staticmethod
+    def _format_method_args(parameters: tuple[ParameterIR, ...]) -> str:
         """Formats method arguments string.
 
         Args:
-            parameters: Iterable of Parameter objects.
+            parameters: Parameters of the method.
         Returns:
             Formatted arguments string (e.g., "self, arg1: int" or just "self").
         """
-        param_list = list(parameters)
-        if not param_list:
+        if not parameters:
             return "self"
-        param_strs = [
-            f"{parameter.name}: {self._get_type_string(parameter.type)}"
-            for parameter in param_list
-        ]
-        return "self, " + ", ".join(param_strs)
+        return "self, " + ", ".join(f"{parameter.name}: {parameter.type}" for parameter in parameters)
 
     @staticmethod
     def _indent_block(block: str, indent: int) -> str:
@@ -325,29 +561,3 @@ def {method_name}({args}) -> {return_type}:
             (" " * indent + line) if line != "" else line
             for line in block.split("\n")
         )
-
-    @staticmethod
-    def _get_python_name(name: str, visibility: Visibility) -> str:
-        """Gets the Python name with underscore prefix for private members.
-
-        Args:
-            name: Original name.
-            visibility: Visibility of the property or operation.
-        Returns:
-            Name with underscore prefix if private, otherwise original name.
-        """
-        if visibility == Visibility.PRIVATE:
-            # Add underscore prefix if not already present
-            return name if name.startswith("_") else f"_{name}"
-        return name
-
-    @staticmethod
-    def _get_type_string(data_type_name: str) -> str:
-        """Gets the string representation of a data type.
-
-        Args:
-            data_type_name: Name of the data type.
-        Returns:
-            String representation of the data type.
-        """
-        return Config.standard_data_types.get(data_type_name, data_type_name)
@@ -0,0 +1,157 @@
+import json
+import re
+import tomllib
+from pathlib import Path
+
+from project_generator.Config import Config
+from project_generator.exceptions import InvalidTypeMapping
+
+
+class TypeMapping:
+    """Module responsible for mapping model type names to Python type annotations.
+
+    Plain entries map a name ("Boolean": "bool"). Generic entries declare parameters in
+    angle brackets ("Map<K, V>": "dict[K, V]"), the arguments of a model type like
+    "Map<String, List<Item>>" are mapped recursively and substituted into the template.
+    Names without an entry are kept, they are classes of the model. Results are memoized
+    per type name, so each distinct name is resolved only once.
+
+    A mapping file (JSON or TOML) holds a "types" table with entries overriding the defaults
+    from Config.standard_data_types:
+
+        [types]
+        Boolean = "bool"
+        "List<T>" = "list[T]"
+    """
+
+    _generic = re.compile(r"^\s*([^<>\s]+)\s*<(.*)>\s*$")
+
+    def __init__(self, mappings: dict[str, str] | None = None) -> None:
+        """
+        Args:
+            mappings: Entries added to (or overriding) Config.standard_data_types.
+        """
+        self._plain: dict[str, str] = {}
+        # Generic name -> (parameter pattern, parameters, template)
+        self._generics: dict[str, tuple[re.Pattern, list[str], str]] = {}
+        for name, python_type in {**Config.standard_data_types, **(mappings or {})}.items():
+            if not isinstance(name, str) or not isinstance(python_type, str):
+                raise InvalidTypeMapping(f"Type mapping entry {name!r} must map a name to a string.")
+            if (generic := self._generic.match(name)) is None:
+                self._plain[name.strip()] = python_type
+                continue
+            parameters = self._split_arguments(generic.group(2))
+            if not all(parameter.isidentifier() for parameter in parameters):
+                raise InvalidTypeMapping(f"Generic type mapping {name!r} has invalid parameters.")
+            pattern = re.compile(r"\b(" + "|".join(map(re.escape, parameters)) + r")\b")
+            self._generics[generic.group(1)] = (pattern, parameters, python_type)
+        self._builtins = set(self._plain.values())
+        self._python_types: dict[str, str] = {}
+        self._referenced_classes: dict[str, tuple[str, ...]] = {}
+
+    @classmethod
+    def load(cls, mapping_path: Path) -> "TypeMapping":
+        """Loads a type mapping from a JSON or TOML file.
+
+        Args:
+            mapping_path: Path to the file, TOML if its suffix is ".toml".
+        Returns:
+            Type mapping with the file entries on top of the defaults.
+        """
+        try:
+            if mapping_path.suffix == ".toml":
+                with open(mapping_path, "rb") as f:
+                    content = tomllib.load(f)
+            else:
+                content = json.loads(mapping_path.read_text())
+        except (tomllib.TOMLDecodeError, json.JSONDecodeError) as error:
+            raise InvalidTypeMapping(f"Type mapping {mapping_path} is not valid: {error}.") from error
+        if not isinstance(content, dict) or not isinstance(content.get("types", {}), dict):
+            raise InvalidTypeMapping(f"Type mapping {mapping_path} must contain a \"types\" table.")
+        return cls(content.get("types", {}))
+
+    def python_type(self, type_name: str) -> str:
+        """Gets the Python annotation of a model type.
+
+        Args:
+            type_name: Name of the model type, possibly generic.
+        Returns:
+            Python type annotation.
+        """
+        if (python_type := self._python_types.get(type_name)) is None:
+            python_type = self._python_types[type_name] = self._map(type_name)
+        return python_type
+
+    def referenced_classes(self, type_name: str) -> tuple[str, ...]:
+        """Gets names of model classes a type refers to, which have to be imported.
+
+        Args:
+            type_name: Name of the model type, possibly generic.
+        Returns:
+            Tuple of class names, empty for mapped types.
+        """
+        if (classes := self._referenced_classes.get(type_name)) is None:
+            classes = self._referenced_classes[type_name] = tuple(dict.fromkeys(self._classes(type_name)))
+        return classes
+
+    def _map(self, type_name: str) -> str:
+        """Maps a model type without memoization.
+
+        Args:
+            type_name: Name of the model type.
+        Returns:
+            Python type annotation.
+        """
+        if (python_type := self._plain.get(type_name)) is not None:
+            return python_type
+        if (generic := self._generic.match(type_name)) is None:
+            return type_name.strip()
+        name, arguments = generic.group(1), self._split_arguments(generic.group(2))
+        if name not in self._generics:
+            return f"{name}[{', '.join(map(self.python_type, arguments))}]"
+        pattern, parameters, template = self._generics[name]
+        if len(arguments) != len(parameters):
+            raise InvalidTypeMapping(f"Type {type_name} does not match generic mapping of {name}.")
+        substitutions = dict(zip(parameters, map(self.python_type, arguments)))
+        return pattern.sub(lambda match: substitutions[match.group(1)], template)
+
+    def _classes(self, type_name: str) -> list[str]:
+        """Collects model classes of a type without memoization.
+
+        Args:
+            type_name: Name of the model type.
+        Returns:
+            List of class names, possibly with duplicates.
+        """
+        if not type_name.strip() or type_name in self._plain or type_name in self._builtins:
+            return []
+        if (generic := self._generic.match(type_name)) is None:
+            return [type_name.strip()]
+        name = generic.group(1)
+        classes = [] if name in self._generics else [name]
+        for argument in self._split_arguments(generic.group(2)):
+            classes += self.referenced_classes(argument)
+        return classes
+
+    @staticmethod
+    def _split_arguments(arguments: str) -> list[str]:
+        """Splits generic arguments at top-level commas.
+
+        Args:
+            arguments: Text between the outer angle brackets.
+        Returns:
+            List of stripped arguments.
+        """
+        parts: list[str] = []
+        depth = 0
+        start = 0
+        for position, character in enumerate(arguments):
+            if character == "<":
+                depth += 1
+            elif character == ">":
+                depth -= 1
+            elif character == "," and depth == 0:
+                parts.append(arguments[start:position].strip())
+                start = position + 1
+        parts.append(arguments[start:].strip())
+        return parts
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import (
+    Iterator,
     Literal,
     overload
 )
@@ -48,6 +49,20 @@ class XmiElement:
                 return attribute
         raise NoAttribute(f"Attribute {key} not found in element {self._element.tag}.")
 
+    def has(self, key: str, force_namespace: bool = False) -> bool:
+        """Checks whether the element has an attribute with the given key.
+
+        Args:
+            key: Key of the attribute to check.
+            force_namespace: Force searching with namespaces.
+        Returns:
+            True if the attribute exists.
+        """
+        return any(
+            f"{namespace}{key}" in self._element.attrib
+            for namespace in ([""] if not force_namespace else []) + self.namespaces
+        )
+
     @overload
     def find(self, name: str, all: Literal[False] = False, force_namespace: bool = False) -> XmiElement: ...
 
@@ -69,3 +84,14 @@ class XmiElement:
             if (result := find_func(f"{namespace}{name}")) is not None:
                 return list(map(XmiElement, result)) if all else XmiElement(result)  # type: ignore
         raise NoElement(f"Element {name} not found in element {self._element.tag}.")
+
+    def iter(self, name: str) -> Iterator[XmiElement]:
+        """Iterates over descendant elements with the given name, at any depth.
+
+        Args:
+            name: Name of the elements to find, with or without a namespace.
+        Returns:
+            Iterator of found elements in document order for each namespace.
+        """
+        for namespace in [""] + self.namespaces:
+            yield from map(XmiElement, self._element.iter(f"{namespace}{name}"))
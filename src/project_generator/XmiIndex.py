@@ -0,0 +1,183 @@
+import hashlib
+import marshal
+import mmap
+from pathlib import Path
+
+from project_generator.Config import Config
+from project_generator.exceptions import (
+    InvalidXmiIndex,
+    NoElement,
+    UnindexableXmi
+)
+from project_generator.XmiScanner import (
+    ElementSpan,
+    XmiScanner
+)
+from project_generator.XmiSource import XmiSource
+
+
+class XmiIndex:
+    """Module responsible for random access to elements of large XMI files by their xmi:id.
+
+    The index records the byte range of every element and the index of its parent, so a
+    single element can be cut out of a memory mapping together with the start tags of its
+    ancestors (see XmiScanner.extract) and parsed without reading the rest of the document.
+
+    The index is stored beside the XMI file with the index_suffix. It is valid while the
+    file size and modification time match; if only the modification time changed, the
+    content hash decides and the index is kept when the content is the same. Compressed
+    files cannot be indexed, their byte offsets are not seekable.
+    """
+
+    magic = b"PGXIDX\x00\x00"
+    version = 1
+    index_suffix = ".pgidx"
+
+    # Keys of the id attribute in the order XmiElement.get tries them
+    _id_keys = [f"{namespace}id" for namespace in ["", Config.uml_namespace, Config.xmi_namespace]]
+
+    def __init__(
+        self,
+        size: int,
+        mtime_ns: int,
+        digest: str,
+        ids: list[str | None],
+        parents: list[int],
+        ranges: list[tuple[int, int, int]],
+    ) -> None:
+        """
+        Args:
+            size: Size of the indexed file.
+            mtime_ns: Modification time of the indexed file.
+            digest: SHA-256 hex digest of the indexed file.
+            ids: Id of every element in document order, None for elements without id.
+            parents: Index of the parent of every element, -1 for the root.
+            ranges: (start, start tag end, end) byte offsets of every element.
+        """
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.digest = digest
+        self._ids = ids
+        self._parents = parents
+        self._ranges = ranges
+        self._positions = {element_id: position for position, element_id in enumerate(ids) if element_id is not None}
+
+    @classmethod
+    def index_path(cls, xmi_path: Path) -> Path:
+        """Gets the path of the index stored beside an XMI file.
+
+        Args:
+            xmi_path: Path to the XMI file.
+        Returns:
+            Path to the index file.
+        """
+        return xmi_path.with_name(xmi_path.name + cls.index_suffix)
+
+    @classmethod
+    def load(cls, xmi_path: Path, index_path: Path | None = None) -> "XmiIndex":
+        """Loads the index of an XMI file, it is rebuilt and stored again when stale.
+
+        Args:
+            xmi_path: Path to the XMI file.
+            index_path: Path to the index file, beside the XMI file if None.
+        Returns:
+            Index valid for the current content of the file.
+        """
+        index_path = index_path or cls.index_path(xmi_path)
+        stat = xmi_path.stat()
+        try:
+            index: XmiIndex | None = cls.read(index_path)
+        except (FileNotFoundError, InvalidXmiIndex):
+            index = None
+        if index is not None and index.size == stat.st_size and index.mtime_ns == stat.st_mtime_ns:
+            return index
+
+        with XmiSource.map(xmi_path) as mapping:
+            digest = hashlib.sha256(mapping).hexdigest()
+            if index is None or index.size != stat.st_size or index.digest != digest:
+                index = cls.build(mapping, stat.st_mtime_ns, digest)
+        # Touched but unchanged files keep their index, only its modification time is updated
+        index.mtime_ns = stat.st_mtime_ns
+        try:
+            index.dump(index_path)
+        except OSError:
+            # The index is still usable for this process if its directory is read-only
+            pass
+        return index
+
+    @classmethod
+    def build(cls, data: mmap.mmap | bytes, mtime_ns: int = 0, digest: str | None = None) -> "XmiIndex":
+        """Builds the index of an uncompressed XMI document.
+
+        Args:
+            data: XMI document.
+            mtime_ns: Modification time of the indexed file.
+            digest: SHA-256 hex digest of the document, computed if None.
+        Returns:
+            Index of all elements of the document.
+        """
+        if XmiSource.compression(data[:8]) is not None:
+            raise UnindexableXmi("Compressed XMI files cannot be indexed.")
+        spans = XmiScanner.scan(data)
+        return cls(
+            len(data),
+            mtime_ns,
+            digest or hashlib.sha256(data).hexdigest(),
+            [next((span.attributes[key] for key in cls._id_keys if key in span.attributes), None) for span in spans],
+            [span.parent for span in spans],
+            [(span.start, span.start_tag_end, span.end) for span in spans],
+        )
+
+    @classmethod
+    def read(cls, index_path: Path) -> "XmiIndex":
+        """Reads an index file.
+
+        Args:
+            index_path: Path to the index file.
+        Returns:
+            Stored index, possibly stale.
+        """
+        data = index_path.read_bytes()
+        if data[:len(cls.magic)] != cls.magic:
+            raise InvalidXmiIndex(f"File {index_path} is not an XMI index.")
+        try:
+            version, size, mtime_ns, digest, ids, parents, ranges = marshal.loads(data[len(cls.magic):])
+        except (EOFError, ValueError, TypeError) as error:
+            raise InvalidXmiIndex(f"XMI index {index_path} is corrupted: {error}.") from error
+        if version != cls.version:
+            raise InvalidXmiIndex(f"XMI index version {version} is not supported (expected {cls.version}).")
+        return cls(size, mtime_ns, digest, ids, parents, ranges)
+
+    def dump(self, index_path: Path) -> None:
+        """Writes the index file.
+
+        Args:
+            index_path: Path to the index file.
+        """
+        index_path.write_bytes(self.magic + marshal.dumps((
+            self.version, self.size, self.mtime_ns, self.digest, self._ids, self._parents, self._ranges
+        )))
+
+    def __contains__(self, element_id: str) -> bool:
+        return element_id in self._positions
+
+    def extract(self, data: mmap.mmap | bytes, element_id: str) -> tuple[bytes, int]:
+        """Cuts an element out of the indexed document.
+
+        Args:
+            data: Indexed XMI document, usually a memory mapping of the file.
+            element_id: Id of the element.
+        Returns:
+            Tuple of (standalone document with the element and the start tags of its
+            ancestors, depth of the element in it).
+        """
+        if (position := self._positions.get(element_id)) is None:
+            raise NoElement(f"Element with id {element_id} not found in the index.")
+        chain = [position]
+        while self._parents[chain[0]] != -1:
+            chain.insert(0, self._parents[chain[0]])
+        spans = [
+            ElementSpan("", {}, depth, depth - 1, *self._ranges[chain_position])
+            for depth, chain_position in enumerate(chain)
+        ]
+        return XmiScanner.extract(data, spans, len(spans) - 1), len(spans) - 1
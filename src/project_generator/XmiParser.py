@@ -1,11 +1,13 @@
+import mmap
 from functools import partial
 from pathlib import Path
 from typing import (
+    BinaryIO,
     Callable,
     TypeVar
 )
-from xml.etree import ElementTree as ET
 
+from project_generator.exceptions import NoElement
 from project_generator.syntax import (
     AbstractSyntax,
     Class,
@@ -16,11 +18,14 @@ from project_generator.syntax import (
     ParameterDirection,
     Project,
     Property,
+    Reference,
     Relation,
     RelationType,
     Visibility
 )
 from project_generator.XmiElement import XmiElement
+from project_generator.XmiIndex import XmiIndex
+from project_generator.XmiSource import XmiSource
 
 
 class XmiParser:
@@ -28,24 +33,113 @@ class XmiParser:
 
     T = TypeVar("T", bound="AbstractSyntax")
 
+    type_element_types = ["uml:Class", "uml:DataType", "uml:PrimitiveType", "uml:Enumeration", "uml:Interface"]
+
     @classmethod
-    def parse(cls, xmi_path: Path) -> Project:
+    def parse(cls, xmi_path: Path | BinaryIO | mmap.mmap | bytes) -> Project:
         """Main parsing method to parse an XMI file into a Project syntax object.
 
         Args:
-            xmi_path: Path to the XMI file.
+            xmi_path: Path to the XMI file, binary file-like object, memory mapping or
+                bytes, plain or gzip/bz2/xz/zip compressed.
         Returns:
             Parsed Project syntax object.
         """
-        tree = ET.parse(xmi_path)
-        root = XmiElement(tree.getroot())
+        root = XmiElement(XmiSource.read_tree(xmi_path))
         model = root.find("Model")
 
         return Project(
             *model.syganture,
-            cls._parse_all(model, "packagedElement", "uml:Package", cls._parse_package)
+            cls._parse_all(model, "packagedElement", "uml:Package", cls._parse_package),
+            cls.parse_types(model),
+        )
+
+    @classmethod
+    def parse_fragment(cls, xmi_path: Path | BinaryIO | mmap.mmap | bytes) -> Project:
+        """Parses an XMI document referenced from other documents by href.
+
+        The document content (children of its Model, or of the root element if there is
+        no Model) is returned as a single package, so that every element can be found by id.
+
+        Args:
+            xmi_path: XMI input accepted by parse().
+        Returns:
+            Project syntax object with the package holding the document content and
+            the type resolution table of the document.
+        """
+        root = XmiElement(XmiSource.read_tree(xmi_path))
+        try:
+            container = root.find("Model")
+        except NoElement:
+            container = root
+        signature = (
+            container.get("id") if container.has("id", True) else "",
+            container.get("name") if container.has("name") else "",
+        )
+        return Project(
+            *signature,
+            [Package(*signature, *cls._parse_package_members(container))],
+            cls.parse_types(container),
         )
 
+    @classmethod
+    def parse_element(cls, xmi_path: Path, element_id: str, index: XmiIndex | None = None) -> AbstractSyntax:
+        """Parses a single element of a large XMI file using its byte-offset index.
+
+        Only the element and the start tags of its ancestors are read from a memory
+        mapping of the file. Types given by id are not resolved.
+
+        Args:
+            xmi_path: Path to the uncompressed XMI file.
+            element_id: Id of the package, class, relation, data type, property,
+                operation or parameter to parse.
+            index: Index of the file, loaded (or built) beside the file if None.
+        Returns:
+            Syntax object of the element.
+        """
+        index = index or XmiIndex.load(xmi_path)
+        with XmiSource.map(xmi_path) as mapping:
+            document, depth = index.extract(mapping, element_id)
+        element = XmiSource.read_tree(document)
+        for _ in range(depth):
+            # Every ancestor in the extracted document has the next one as its only child
+            element = element[0]
+        xmi_element = XmiElement(element)
+        if xmi_element.has("href"):
+            return cls._parse_reference(xmi_element)
+        element_type = xmi_element.get("type", True)
+        relation_types = {f"uml:{relation_type.value.capitalize()}": relation_type for relation_type in RelationType}
+        if element_type in relation_types:
+            return cls._parse_relation(relation_types[element_type].value, xmi_element)
+        parsers: dict[str, Callable[[XmiElement], AbstractSyntax]] = {
+            "uml:Package": cls._parse_package,
+            "uml:Class": cls._parse_class,
+            "uml:DataType": cls._parse_data_type,
+            "uml:Property": cls._parse_property,
+            "uml:Operation": cls._parse_operation,
+            "uml:Parameter": cls._parse_parameter,
+        }
+        if element_type not in parsers:
+            raise NoElement(f"Element {element_id} of type {element_type} is not a syntax element.")
+        return parsers[element_type](xmi_element)
+
+    @classmethod
+    def parse_types(cls, container: XmiElement) -> dict[str, str]:
+        """Builds the type resolution table of all type elements in the container.
+
+        Args:
+            container: XMI element to search within, at any depth.
+        Returns:
+            Map of type element id to its name.
+        """
+        return {
+            element.get("id", True): element.get("name")
+            for element in container.iter("packagedElement")
+            if element.get("type", True) in cls.type_element_types
+            and element.has("id", True)
+            and element.has("name")
+        }
+
     @classmethod
     def _parse_all(
         cls,
@@ -62,14 +156,27 @@ class XmiParser:
             uml_type: UML type to filter by.
             parser: Parser function to convert XmiElement to the desired syntax object.
         Returns:
-            List of parsed syntax objects.
+            List of parsed syntax objects, elements defined in other documents are
+            returned as Reference placeholders.
         """
         return [
-            parser(element)
+            cls._parse_reference(element) if element.has("href") else parser(element)
             for element in parent.find(element_name, True)
             if element.get("type", True) == uml_type
         ]
 
+    @classmethod
+    def _parse_reference(cls, element: XmiElement) -> Reference:
+        """Parses an element pointing to another document into a Reference placeholder.
+
+        Args:
+            element: XMI element with href attribute.
+        Returns:
+            Reference syntax object.
+        """
+        document, _, element_id = element.get("href").rpartition("#")
+        return Reference(element_id, "", document)
+
     @classmethod
     def _parse_package(cls, package_element: XmiElement) -> Package:
         """Parses a package element into a Package syntax object.
@@ -79,29 +186,50 @@ class XmiParser:
         Returns:
             Parsed Package syntax object.
         """
-        return Package(
-            *package_element.syganture,
+        return Package(*package_element.syganture, *cls._parse_package_members(package_element))
+
+    @classmethod
+    def _parse_package_members(cls, package_element: XmiElement) -> tuple[list, list, list, list]:
+        """Parses packaged elements of a package element.
+
+        Args:
+            package_element: XMI element representing the package.
+        Returns:
+            Tuple of (subpackages, classes, relations, data types).
+        """
+        return (
             cls._parse_all(package_element, "packagedElement", "uml:Package", cls._parse_package),
             cls._parse_all(package_element, "packagedElement", "uml:Class", cls._parse_class),
-            sum([
-                cls._parse_all(
-                    package_element,
-                    "packagedElement",
-                    f"uml:{relation.capitalize()}",
-                    partial(cls._parse_relation, relation)
-                )
-                for relation in [
-                    "association",
-                    "dependency",
-                    "aggregation",
-                    "composition",
-                    "realization",
-                    "generalization"
-                ]
-            ], []),
+            cls._parse_relations(package_element),
             cls._parse_all(package_element, "packagedElement", "uml:DataType", cls._parse_data_type),
         )
 
+    @classmethod
+    def _parse_relations(cls, package_element: XmiElement) -> list[Relation]:
+        """Parses relation elements of all relation types of a package element.
+
+        Args:
+            package_element: XMI element representing the package.
+        Returns:
+            List of Relation syntax objects.
+        """
+        return sum([
+            cls._parse_all(
+                package_element,
+                "packagedElement",
+                f"uml:{relation.capitalize()}",
+                partial(cls._parse_relation, relation)
+            )
+            for relation in [
+                "association",
+                "dependency",
+                "aggregation",
+                "composition",
+                "realization",
+                "generalization"
+            ]
+        ], [])
+
     @classmethod
     def _parse_relation(cls, name: str, relation_element: XmiElement) -> Relation:
         """Parses a relation element into a relation syntax object.
@@ -163,11 +291,14 @@ class XmiParser:
             # Filter out meta-types - if type equals "uml:Property", it's a meta-type, not actual type
             if prop_type == "uml:Property" or prop_type.startswith("uml:"):
                 prop_type = ""
+        elif (type_reference := cls._parse_type_element(property_element)) is not None:
+            prop_type = type_reference
 
         return Property(
             *property_element.syganture,
             prop_type,
-            Visibility(property_element.get("visibility"))
+            Visibility(property_element.get("visibility")),
+            cls._parse_type_document(property_element)
         )
 
     @classmethod
@@ -195,9 +326,51 @@ class XmiParser:
             Parameter syntax object.
         """
         direction = ParameterDirection(parameter_element.get("direction"))
+        if (type_reference := cls._parse_type_element(parameter_element)) is not None:
+            parameter_type = type_reference
+        else:
+            parameter_type = parameter_element.get("type")
         return Parameter(
             parameter_element.get("id"),
             "" if direction == ParameterDirection.RETURN else parameter_element.get("name"),
-            parameter_element.get("type"),
-            direction
+            parameter_type,
+            direction,
+            cls._parse_type_document(parameter_element)
         )
+
+    @classmethod
+    def _parse_type_element(cls, typed_element: XmiElement) -> str | None:
+        """Gets the type id from a nested <type href="document#id"/> or <type xmi:idref="id"/> element.
+
+        Args:
+            typed_element: XMI element of a property or parameter.
+        Returns:
+            Id of the referenced type or None if the type is not given as a nested element.
+        """
+        # Plain type attribute (not the xmi:type meta-attribute) takes precedence
+        if typed_element._element.get("type") is not None:
+            return None
+        try:
+            type_element = typed_element.find("type")
+        except NoElement:
+            return None
+        if type_element.has("href"):
+            return type_element.get("href").rpartition("#")[2]
+        return type_element.get("idref", True)
+
+    @classmethod
+    def _parse_type_document(cls, typed_element: XmiElement) -> str:
+        """Gets the document of a nested <type href="document#id"/> element.
+
+        Args:
+            typed_element: XMI element of a property or parameter.
+        Returns:
+            Document defining the type, empty if the type is not referenced by href.
+        """
+        if typed_element._element.get("type") is not None:
+            return ""
+        try:
+            type_element = typed_element.find("type")
+        except NoElement:
+            return ""
+        return type_element.get("href").rpartition("#")[0] if type_element.has("href") else ""
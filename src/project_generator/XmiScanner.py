@@ -0,0 +1,140 @@
+import mmap
+import re
+from dataclasses import dataclass
+from xml.parsers import expat
+
+
+@dataclass
+class ElementSpan:
+    """Location of an element in raw XMI bytes."""
+    tag: str
+    attributes: dict[str, str]
+    depth: int
+    parent: int
+    start: int
+    start_tag_end: int
+    end: int
+
+
+class XmiScanner:
+    """Module responsible for locating elements in raw XMI bytes without building a tree.
+
+    Tags and attribute names are expanded the same way as in ElementTree ("{namespace}name"),
+    offsets are byte offsets in the scanned document.
+    """
+
+    _start_tag = re.compile(rb"""<[^\s/>]+(?:\s+[^\s=/>]+\s*=\s*(?:"[^"]*"|'[^']*'))*\s*/?>""")
+
+    @classmethod
+    def scan(cls, data: mmap.mmap | bytes, max_depth: int | None = None) -> list[ElementSpan]:
+        """Scans the document and locates its elements.
+
+        Args:
+            data: Uncompressed XMI document.
+            max_depth: Depth of the deepest reported elements (root has depth 0), all if None.
+        Returns:
+            Spans of elements in document order, parent is the index of the parent span
+            (-1 for the root).
+        """
+        spans: list[ElementSpan] = []
+        open_spans: list[int] = []
+        # Depth of the innermost open element, also for elements deeper than max_depth.
+        depth = -1
+        parser = expat.ParserCreate(namespace_separator="}")
+
+        def start_element(tag: str, attributes: dict[str, str]) -> None:
+            nonlocal depth
+            depth += 1
+            if max_depth is not None and depth > max_depth:
+                return
+            start = parser.CurrentByteIndex
+            start_tag_end = cls._start_tag.match(data, start).end()  # type: ignore
+            spans.append(ElementSpan(
+                cls._expand(tag),
+                {cls._expand(name): value for name, value in attributes.items()},
+                depth,
+                open_spans[-1] if open_spans else -1,
+                start,
+                start_tag_end,
+                start_tag_end,
+            ))
+            open_spans.append(len(spans) - 1)
+
+        def end_element(tag: str) -> None:
+            nonlocal depth
+            depth -= 1
+            if max_depth is not None and depth + 1 > max_depth:
+                return
+            span = spans[open_spans.pop()]
+            if data[span.start_tag_end - 2:span.start_tag_end] != b"/>":
+                # Closing tag "</tag>", expat points at its beginning
+                span.end = data.find(b">", parser.CurrentByteIndex) + 1  # type: ignore
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.Parse(data, True)
+        return spans
+
+    @classmethod
+    def extract(cls, data: mmap.mmap | bytes, spans: list[ElementSpan], index: int) -> bytes:
+        """Builds a standalone document containing a single element and its ancestors' start tags.
+
+        Namespace declarations and the XML declaration of the original document stay in
+        scope, so the element parses exactly as it did in the full document.
+
+        Args:
+            data: Uncompressed XMI document.
+            spans: Spans returned by scan().
+            index: Index of the span of the element to extract.
+        Returns:
+            XMI document bytes.
+        """
+        header, footer = cls.enclosing(data, spans, index)
+        return b"".join([header, data[spans[index].start:spans[index].end], footer])
+
+    @classmethod
+    def enclosing(cls, data: mmap.mmap | bytes, spans: list[ElementSpan], index: int) -> tuple[bytes, bytes]:
+        """Gets the document parts enclosing an element.
+
+        Args:
+            data: Uncompressed XMI document.
+            spans: Spans returned by scan().
+            index: Index of the span of the element.
+        Returns:
+            Tuple of (document prolog with start tags of all ancestors, their closing tags).
+        """
+        ancestors: list[ElementSpan] = []
+        parent = spans[index].parent
+        while parent != -1:
+            ancestors.insert(0, spans[parent])
+            parent = spans[parent].parent
+        root_start = ancestors[0].start if ancestors else spans[index].start
+        header = b"".join([
+            data[:root_start],
+            *(data[ancestor.start:ancestor.start_tag_end] for ancestor in ancestors),
+        ])
+        footer = b"".join(b"</" + cls.raw_tag(data, ancestor) + b">" for ancestor in reversed(ancestors))
+        return header, footer
+
+    @staticmethod
+    def raw_tag(data: mmap.mmap | bytes, span: ElementSpan) -> bytes:
+        """Gets the tag name as written in the document (with its prefix).
+
+        Args:
+            data: Uncompressed XMI document.
+            span: Span of the element.
+        Returns:
+            Qualified tag name.
+        """
+        return re.match(rb"<([^\s/>]+)", data[span.start:span.start_tag_end]).group(1)  # type: ignore
+
+    @staticmethod
+    def _expand(name: str) -> str:
+        """Converts expat expanded name ("namespace}name") to ElementTree notation.
+
+        Args:
+            name: Name reported by expat.
+        Returns:
+            Name in "{namespace}name" notation.
+        """
+        return f"{{{name}" if "}" in name else name
@@ -0,0 +1,193 @@
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import zipfile
+from contextlib import (
+    ExitStack,
+    contextmanager
+)
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Iterator
+)
+from xml.etree import ElementTree as ET
+
+from project_generator.exceptions import NoXmiInArchive
+
+
+class XmiSource:
+    """Module responsible for reading (possibly compressed or memory-mapped) XMI inputs."""
+
+    archive_member_suffixes = [".xmi", ".uml", ".xml"]
+
+    _gzip_magic = b"\x1f\x8b"
+    _bz2_magic = b"BZh"
+    _xz_magic = b"\xfd7zXZ\x00"
+    _zip_magic = b"PK\x03\x04"
+
+    @classmethod
+    @contextmanager
+    def map(cls, xmi_path: Path) -> Iterator[mmap.mmap | bytes]:
+        """Maps an XMI file into memory read-only.
+
+        The mapping can be passed to hashing, sniffing and parsing in turn, all of them
+        read the page cache directly instead of copying the file into process buffers.
+
+        Args:
+            xmi_path: Path to the XMI file.
+        Returns:
+            Context manager yielding the mapping (empty bytes for empty files, which
+            cannot be mapped).
+        """
+        with open(xmi_path, "rb") as f:
+            if f.seek(0, io.SEEK_END) == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                yield mapping
+
+    @classmethod
+    def read_tree(cls, source: Path | BinaryIO | mmap.mmap | bytes, member: str | None = None) -> ET.Element:
+        """Parses an XMI input into an element tree.
+
+        Uncompressed in-memory inputs (mappings and bytes) are fed to the parser in one
+        call without copying; everything else is streamed through open().
+
+        Args:
+            source: XMI input accepted by open(), a memory mapping or bytes.
+            member: Name of the archive member to read from zip inputs.
+        Returns:
+            Root element of the parsed document.
+        """
+        if isinstance(source, (mmap.mmap, bytes)) and cls.compression(source[:len(cls._xz_magic)]) is None:
+            parser = ET.XMLParser()
+            parser.feed(source)
+            return parser.close()
+        with cls.open(source, member) as stream:
+            return ET.parse(stream).getroot()
+
+    @classmethod
+    def compression(cls, head: bytes) -> str | None:
+        """Detects the compression format from the first bytes of an input.
+
+        Args:
+            head: First bytes of the input.
+        Returns:
+            One of "gzip", "bz2", "xz", "zip" or None for uncompressed inputs.
+        """
+        for name, magic in [
+            ("gzip", cls._gzip_magic),
+            ("bz2", cls._bz2_magic),
+            ("xz", cls._xz_magic),
+            ("zip", cls._zip_magic),
+        ]:
+            if head.startswith(magic):
+                return name
+        return None
+
+    @classmethod
+    @contextmanager
+    def open(cls, source: Path | BinaryIO | mmap.mmap | bytes, member: str | None = None) -> Iterator[BinaryIO]:
+        """Opens an XMI input as a stream of uncompressed XMI bytes.
+
+        Gzip, bzip2, xz and zip inputs are detected by their magic bytes and decompressed
+        on the fly while the stream is read, so the uncompressed document is never
+        materialized as a whole.
+
+        Args:
+            source: Path to the XMI file, binary file-like object, memory mapping or bytes
+                with its content.
+            member: Name of the archive member to read from zip inputs. Defaults to
+                the first member with an XMI-like suffix.
+        Returns:
+            Context manager yielding a binary stream with the XMI document.
+        """
+        with ExitStack() as stack:
+            if isinstance(source, Path):
+                stream = cls._peekable(stack.enter_context(open(source, "rb")))
+            elif isinstance(source, (mmap.mmap, bytes)):
+                # Mappings already expose read/seek/tell and are read straight from the page cache.
+                stream = source if isinstance(source, mmap.mmap) else io.BytesIO(source)
+                stream.seek(0)
+            else:
+                stream = cls._peekable(source)
+            if isinstance(source, (mmap.mmap, bytes)):
+                head = source[:len(cls._xz_magic)]
+            else:
+                head = stream.peek(len(cls._xz_magic))
+
+            compression = cls.compression(head[:len(cls._xz_magic)])
+            if compression == "gzip":
+                stream = stack.enter_context(gzip.GzipFile(fileobj=stream, mode="rb"))
+            elif compression == "bz2":
+                stream = stack.enter_context(bz2.BZ2File(stream, mode="rb"))
+            elif compression == "xz":
+                stream = stack.enter_context(lzma.LZMAFile(stream, mode="rb"))
+            elif compression == "zip":
+                archive = stack.enter_context(zipfile.ZipFile(stream))
+                stream = stack.enter_context(archive.open(member or cls._find_archive_member(archive)))
+            yield stream
+
+    @classmethod
+    def _find_archive_member(cls, archive: zipfile.ZipFile) -> str:
+        """Finds the XMI document inside a zip archive.
+
+        Args:
+            archive: Opened zip archive.
+        Returns:
+            Name of the first member with an XMI-like suffix, in suffix preference order.
+        """
+        names = [info.filename for info in archive.infolist() if not info.is_dir()]
+        for suffix in cls.archive_member_suffixes:
+            for name in names:
+                if name.lower().endswith(suffix):
+                    return name
+        raise NoXmiInArchive(f"Archive {archive.filename or '<stream>'} does not contain an XMI document.")
+
+    @staticmethod
+    def _peekable(stream: BinaryIO) -> BinaryIO:
+        """Ensures the stream allows looking at its first bytes without consuming them.
+
+        Args:
+            stream: Binary stream.
+        Returns:
+            Stream supporting peek().
+        """
+        if hasattr(stream, "peek"):
+            return stream
+        if stream.seekable():
+            return _SeekPeekStream(stream)
+        return io.BufferedReader(stream)  # type: ignore
+
+
+class _SeekPeekStream(io.RawIOBase):
+    """Seekable stream wrapper adding peek() implemented with read and seek."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+
+    def peek(self, size: int = 1) -> bytes:
+        position = self._stream.tell()
+        data = self._stream.read(size)
+        self._stream.seek(position)
+        return data
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
@@ -20,3 +20,43 @@ class ImportMapperException(CustomException):
 
 class NonMappedClass(ImportMapperException):
     """Exception raised when a class name is not mapped to any import path."""
+
+
+class SerializerException(CustomException):
+    """Base class for project model serialization related exceptions."""
+
+
+class InvalidModelFile(SerializerException):
+    """Exception raised when a file is not a valid serialized project model."""
+
+
+class UnsupportedModelVersion(SerializerException):
+    """Exception raised when a serialized project model has an unsupported format version."""
+
+
+class NoXmiInArchive(XmiParserException):
+    """Exception raised when an archive does not contain an XMI document."""
+
+
+class UnresolvedReference(XmiParserException):
+    """Exception raised when an element referenced from another XMI document does not exist."""
+
+
+class TypeMappingException(CustomException):
+    """Base class for type mapping related exceptions."""
+
+
+class InvalidTypeMapping(TypeMappingException):
+    """Exception raised when a type mapping file or entry is not valid."""
+
+
+class XmiIndexException(XmiParserException):
+    """Base class for XMI byte-offset index related exceptions."""
+
+
+class InvalidXmiIndex(XmiIndexException):
+    """Exception raised when a file is not a valid XMI index."""
+
+
+class UnindexableXmi(XmiIndexException):
+    """Exception raised when an XMI input cannot be indexed, e.g. because it is compressed."""
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class FieldKind(Enum):
+    """Enum representing how an attribute of a generated class is initialized."""
+
+    PROPERTY = "property"  # Required constructor parameter
+    ASSOCIATION = "association"  # Optional constructor parameter, None by default
+    AGGREGATION = "aggregation"  # Optional list constructor parameter, empty list by default
+    COMPOSITION = "composition"  # Instance created in the constructor, no parameter
+    LAZY_COMPOSITION = "lazy_composition"  # Instance created on first access, no parameter
+
+
+@dataclass(frozen=True)
+class FieldIR:
+    """Attribute of a generated class, assigned in its constructor."""
+    name: str
+    # Constructor parameter the attribute is assigned from, empty for compositions
+    parameter: str
+    # Python annotation of a single value, aggregations hold a list of them
+    type: str
+    kind: FieldKind
+
+
+@dataclass(frozen=True)
+class ParameterIR:
+    """Parameter of a generated method."""
+    name: str
+    type: str
+
+
+@dataclass(frozen=True)
+class MethodIR:
+    """Method of a generated class."""
+    name: str
+    parameters: tuple[ParameterIR, ...]
+    return_type: str
+
+
+@dataclass(frozen=True)
+class ClassIR:
+    """Generated class with all names and types resolved, rendering it is pure formatting.
+
+    Fields are in constructor order, the constructor parameters are the parameters of the
+    fields which are not compositions. Imports are sorted (module, class name) pairs with
+    modules relative to the output root. Slots are the attribute names declared in
+    __slots__, without the slots of the bases, None if the class keeps a __dict__ only.
+    Lazy compositions of slotted classes keep their instance in the "<name>_value" slot.
+    Type checking imports are the imports used only in annotations, not by the bases or
+    compositions, which modules with postponed annotations import for type checkers only.
+    """
+    name: str
+    bases: tuple[str, ...]
+    imports: tuple[tuple[str, str], ...]
+    fields: tuple[FieldIR, ...]
+    methods: tuple[MethodIR, ...]
+    slots: tuple[str, ...] | None = None
+    type_checking_imports: tuple[tuple[str, str], ...] = ()
@@ -1,18 +1,307 @@
+import asyncio
+import hashlib
+from concurrent.futures import Executor
+from contextlib import nullcontext
 from pathlib import Path
-from pprint import pprint
 
+from project_generator.AsyncProjectGenerator import AsyncProjectGenerator
+from project_generator.exceptions import SerializerException
+from project_generator.ExpatXmiParser import ExpatXmiParser
+from project_generator.FragmentLoader import FragmentLoader
+from project_generator.ImportMapping import ModuleLayout
+from project_generator.Metrics import MetricsCollector
+from project_generator.ParallelXmiParser import ParallelXmiParser
+from project_generator.Profiler import Profiler
 from project_generator.ProjectGenerator import ProjectGenerator
+from project_generator.ProjectSerializer import ProjectSerializer
+from project_generator.StructuralHasher import (
+    StructuralChange,
+    StructuralHasher
+)
+from project_generator.syntax import Project
+from project_generator.TemplateManager import (
+    Emitter,
+    PackageInit
+)
+from project_generator.TypeMapping import TypeMapping
 from project_generator.XmiParser import XmiParser
+from project_generator.XmiSource import XmiSource
 
 
-def generate_project(xmi_path: Path, output_dir: Path) -> None:
+def generate_project(
+    xmi_path: Path,
+    output_dir: Path,
+    model_cache: Path | None = None,
+    use_mmap: bool = False,
+    profiler: Profiler | None = None,
+    metrics: MetricsCollector | None = None,
+    fragment_cache: Path | None = None,
+    workers: int | None = None,
+    parallel: bool = False,
+    type_mapping: TypeMapping | None = None,
+    package_init: PackageInit = PackageInit.NONE,
+    expat: bool = False,
+    targets: dict[Emitter, Path] | None = None,
+    slots: bool = False,
+    lazy_compositions: bool = False,
+    layout: ModuleLayout = ModuleLayout.CLASS,
+    skip_unchanged: bool = False,
+) -> None:
     """Main function to generate a project from an XMI file.
 
     Args:
-        xmi_path: Path to the XMI file.
+        xmi_path: Path to the (possibly compressed) XMI file or to a serialized model.
         output_dir: Path to the output directory where the project will be generated.
+        model_cache: Path to the serialized model cache of the XMI file.
+        use_mmap: Read the input through a single memory mapping.
+        profiler: Profiler measuring the pipeline.
+        metrics: Collector of run statistics, its report is written at the end.
+        fragment_cache: Directory of parsed caches of referenced XMI documents.
+        workers: Number of processes parsing referenced XMI documents and top-level packages.
+        parallel: Parse top-level packages of the XMI file in separate processes.
+        type_mapping: Mapping of model types to Python annotations.
+        package_init: Content of generated package __init__.py files.
+        expat: Parse the XMI file with ExpatXmiParser instead of building an element tree.
+        targets: Root directories of additional outputs (stubs, dataclass DTOs) by emitter.
+        slots: Generate classes declaring their fields as __slots__.
+        lazy_compositions: Generate compositions created on first access instead of in constructors.
+        layout: Grouping of generated classes into modules.
+        skip_unchanged: Leave output files whose content did not change untouched.
     """
-    print(xmi_path.read_text())
-    parsed_project = XmiParser.parse(xmi_path)
-    pprint(parsed_project)
-    ProjectGenerator(parsed_project, output_dir)
+    if metrics is not None:
+        # Phase durations come from profiler measurements, a plain Profiler only times them.
+        profiler = profiler or Profiler()
+        profiler.add_hook(metrics.record_measurement)
+
+    with profiler.profile() if profiler else nullcontext():
+        parsed_project = load_project(
+            xmi_path, model_cache, use_mmap, profiler, fragment_cache, workers, parallel, expat
+        )
+        ProjectGenerator(
+            parsed_project,
+            output_dir,
+            profiler,
+            metrics,
+            type_mapping,
+            package_init,
+            targets,
+            slots,
+            lazy_compositions,
+            layout,
+            skip_unchanged,
+        )
+
+    if metrics is not None:
+        metrics.count_project(parsed_project)
+        metrics.write_report()
+
+
+async def generate_project_async(
+    xmi_path: Path,
+    output_dir: Path,
+    model_cache: Path | None = None,
+    use_mmap: bool = False,
+    metrics: MetricsCollector | None = None,
+    fragment_cache: Path | None = None,
+    workers: int | None = None,
+    parallel: bool = False,
+    executor: Executor | None = None,
+    queue_size: int = 16,
+    type_mapping: TypeMapping | None = None,
+    package_init: PackageInit = PackageInit.NONE,
+    expat: bool = False,
+    targets: dict[Emitter, Path] | None = None,
+    slots: bool = False,
+    lazy_compositions: bool = False,
+    layout: ModuleLayout = ModuleLayout.CLASS,
+    skip_unchanged: bool = False,
+) -> None:
+    """Generates a project from an XMI file without blocking the event loop.
+
+    Loading runs in the executor, generation is an AsyncProjectGenerator pipeline.
+    Concurrent calls sharing the executor are bounded by its number of threads.
+
+    Args:
+        xmi_path: Path to the (possibly compressed) XMI file or to a serialized model.
+        output_dir: Path to the output directory where the project will be generated.
+        model_cache: Path to the serialized model cache of the XMI file.
+        use_mmap: Read the input through a single memory mapping.
+        metrics: Collector of run statistics, its report is written at the end.
+        fragment_cache: Directory of parsed caches of referenced XMI documents.
+        workers: Number of processes parsing referenced XMI documents and top-level packages.
+        parallel: Parse top-level packages of the XMI file in separate processes.
+        executor: Thread pool running blocking work, the loop default executor if None.
+        queue_size: Capacity of each queue between the generation stages.
+        type_mapping: Mapping of model types to Python annotations.
+        package_init: Content of generated package __init__.py files.
+        expat: Parse the XMI file with ExpatXmiParser instead of building an element tree.
+        targets: Root directories of additional outputs (stubs, dataclass DTOs) by emitter.
+        slots: Generate classes declaring their fields as __slots__.
+        lazy_compositions: Generate compositions created on first access instead of in constructors.
+        layout: Grouping of generated classes into modules.
+        skip_unchanged: Leave output files whose content did not change untouched.
+    """
+    loop = asyncio.get_running_loop()
+    parsed_project = await loop.run_in_executor(
+        executor,
+        load_project,
+        xmi_path, model_cache, use_mmap, None, fragment_cache, workers, parallel, expat,
+    )
+    await AsyncProjectGenerator(
+        parsed_project,
+        output_dir,
+        executor,
+        queue_size,
+        metrics=metrics,
+        type_mapping=type_mapping,
+        package_init=package_init,
+        targets=targets,
+        slots=slots,
+        lazy_compositions=lazy_compositions,
+        layout=layout,
+        skip_unchanged=skip_unchanged,
+    ).generate()
+
+    if metrics is not None:
+        metrics.count_project(parsed_project)
+        await loop.run_in_executor(executor, metrics.write_report)
+
+
+def diff_projects(
+    old_path: Path,
+    new_path: Path,
+    fragment_cache: Path | None = None,
+    workers: int | None = None,
+    parallel: bool = False,
+    expat: bool = False,
+    type_mapping: TypeMapping | None = None,
+    layout: ModuleLayout = ModuleLayout.CLASS,
+) -> tuple[list[StructuralChange], list[Path]]:
+    """Compares two versions of a model by their structural hashes.
+
+    Args:
+        old_path: Path to the old XMI file or serialized model.
+        new_path: Path to the new XMI file or serialized model.
+        fragment_cache: Directory of parsed caches of referenced XMI documents.
+        workers: Number of processes parsing referenced XMI documents and top-level packages.
+        parallel: Parse top-level packages of the XMI files in separate processes.
+        expat: Parse the XMI files with ExpatXmiParser instead of building an element tree.
+        type_mapping: Mapping of model types to Python annotations, used to find dependent classes.
+        layout: Grouping of generated classes into modules.
+    Returns:
+        Changes and the affected generated class files relative to the output directory.
+    """
+    old_project = load_project(old_path, None, False, None, fragment_cache, workers, parallel, expat)
+    new_project = load_project(new_path, None, False, None, fragment_cache, workers, parallel, expat)
+    changes = StructuralHasher.diff(
+        StructuralHasher.hash_project(old_project), StructuralHasher.hash_project(new_project)
+    )
+    return changes, ProjectGenerator.affected_files(old_project, new_project, changes, Path(), type_mapping, layout)
+
+
+def load_project(
+    xmi_path: Path,
+    model_cache: Path | None = None,
+    use_mmap: bool = False,
+    profiler: Profiler | None = None,
+    fragment_cache: Path | None = None,
+    workers: int | None = None,
+    parallel: bool = False,
+    expat: bool = False,
+) -> Project:
+    """Loads a project from an XMI file or a serialized model.
+
+    Serialized models are loaded directly. XMI files are parsed unless the model cache
+    was written for the same version of the file, the cache is refreshed after parsing.
+    The file version is identified by its size and modification time, or by the content
+    hash in mmap mode, where sniffing, hashing and parsing share one mapping of the file.
+    The model cache holds only the given document, elements of referenced documents
+    are resolved afterwards with their own caches.
+
+    Args:
+        xmi_path: Path to the XMI file or to a serialized model.
+        model_cache: Path to the serialized model cache of the XMI file.
+        use_mmap: Read the input through a single memory mapping.
+        profiler: Profiler measuring XMI parsing.
+        fragment_cache: Directory of parsed caches of referenced XMI documents.
+        workers: Number of processes parsing referenced XMI documents and top-level packages.
+        parallel: Parse top-level packages of the XMI file in separate processes.
+        expat: Parse the XMI file with ExpatXmiParser instead of building an element tree.
+    Returns:
+        Project syntax object.
+    """
+    project = _load_document(xmi_path, model_cache, use_mmap, profiler, workers, parallel, expat)
+    with profiler.phase("resolve_fragments") if profiler else nullcontext():
+        return FragmentLoader(fragment_cache, workers).resolve(project, xmi_path.resolve().parent)
+
+
+def _load_document(
+    xmi_path: Path,
+    model_cache: Path | None,
+    use_mmap: bool,
+    profiler: Profiler | None,
+    workers: int | None,
+    parallel: bool,
+    expat: bool,
+) -> Project:
+    """Loads a single XMI document or serialized model, using the model cache.
+
+    Args:
+        xmi_path: Path to the XMI file or to a serialized model.
+        model_cache: Path to the serialized model cache of the XMI file.
+        use_mmap: Read the input through a single memory mapping.
+        profiler: Profiler measuring XMI parsing.
+        workers: Number of processes parsing top-level packages.
+        parallel: Parse top-level packages in separate processes.
+        expat: Parse with ExpatXmiParser, ignored with parallel parsing.
+    Returns:
+        Project syntax object, possibly with Reference placeholders.
+    """
+    if use_mmap:
+        with XmiSource.map(xmi_path) as mapping:
+            if mapping[:len(ProjectSerializer.magic)] == ProjectSerializer.magic:
+                return ProjectSerializer.loads(mapping)
+            source_key = f"sha256:{hashlib.sha256(mapping).hexdigest()}"
+            if (cached := _load_model_cache(model_cache, source_key)) is not None:
+                return cached
+            with profiler.phase("parse") if profiler else nullcontext():
+                if parallel:
+                    project = ParallelXmiParser.parse(xmi_path, workers, mapping)
+                else:
+                    project = (ExpatXmiParser if expat else XmiParser).parse(mapping)
+    else:
+        if ProjectSerializer.is_model_file(xmi_path):
+            return ProjectSerializer.load(xmi_path)
+        stat = xmi_path.stat()
+        source_key = f"{stat.st_size}:{stat.st_mtime_ns}"
+        if (cached := _load_model_cache(model_cache, source_key)) is not None:
+            return cached
+        with profiler.phase("parse") if profiler else nullcontext():
+            if parallel:
+                project = ParallelXmiParser.parse(xmi_path, workers)
+            else:
+                project = (ExpatXmiParser if expat else XmiParser).parse(xmi_path)
+
+    if model_cache is not None:
+        ProjectSerializer.dump(project, model_cache, source_key)
+    return project
+
+
+def _load_model_cache(model_cache: Path | None, source_key: str) -> Project | None:
+    """Loads the cached project if the cache was written for the given source.
+
+    Args:
+        model_cache: Path to the serialized model cache.
+        source_key: Key identifying the current version of the source.
+    Returns:
+        Cached Project syntax object or None if there is no valid cache.
+    """
+    if model_cache is None or not model_cache.is_file():
+        return None
+    try:
+        if ProjectSerializer.read_source_key(model_cache) == source_key:
+            return ProjectSerializer.load(model_cache)
+    except SerializerException:
+        # Caches from other format versions are rebuilt
+        pass
+    return None
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    field
+)
 from enum import Enum
 
 
@@ -49,6 +52,8 @@ class Property(AbstractSyntax):
     """Property syntax element."""
     type: str
     visibility: Visibility
+    # Document defining the type if it is referenced by href, empty for types of the same document
+    type_document: str = ""
 
 
 @dataclass
@@ -56,6 +61,8 @@ class Parameter(AbstractSyntax):
     """Parameter syntax element."""
     type: str
     direction: ParameterDirection
+    # Document defining the type if it is referenced by href, empty for types of the same document
+    type_document: str = ""
 
 
 @dataclass
@@ -80,6 +87,12 @@ class Relation(AbstractSyntax):
     supplier: str
 
 
+@dataclass
+class Reference(AbstractSyntax):
+    """Placeholder for an element defined in another XMI document (href="document#id")."""
+    document: str
+
+
 @dataclass
 class Package(AbstractSyntax):
     """Package syntax element."""
@@ -91,5 +104,11 @@ class Package(AbstractSyntax):
 
 @dataclass
 class Project(AbstractSyntax):
-    """Project syntax element."""
+    """Project syntax element.
+
+    Types maps ids of all type elements of the model (classes, data types, primitive
+    types, enumerations and interfaces) to their names, so that ids stored as property,
+    parameter and relation types can be resolved.
+    """
     packages: list[Package]
+    types: dict[str, str] = field(default_factory=dict)
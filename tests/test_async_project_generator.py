@@ -0,0 +1,109 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.AsyncProjectGenerator import AsyncProjectGenerator
+from project_generator.main import generate_project_async
+from project_generator.Metrics import MetricsCollector
+from project_generator.ProjectGenerator import ProjectGenerator
+from project_generator.syntax import (
+    Class,
+    Package,
+    Project,
+)
+from project_generator.TemplateManager import Emitter
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="{name}">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Shop">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order"/>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>
+      <packagedElement xmi:type="uml:Association" xmi:id="r1" name="items" client="Order" supplier="Item"/>
+      <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Billing">
+        <packagedElement xmi:type="uml:Class" xmi:id="c3" name="Invoice"/>
+      </packagedElement>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+def make_project(name: str, packages: int) -> Project:
+    return Project(
+        id="p1",
+        name=name,
+        packages=[
+            Package(
+                id=f"pkg{index}",
+                name=f"Package{index}",
+                subpackages=[],
+                classes=[Class(id=f"c{index}", name=f"Class{index}", properties=[], operations=[])],
+                dependencies=[],
+                data_types=[],
+            )
+            for index in range(packages)
+        ],
+    )
+
+
+def read_tree(root: Path) -> dict[str, bytes]:
+    return {str(path.relative_to(root)): path.read_bytes() for path in sorted(root.rglob("*.py"))}
+
+
+class TestAsyncProjectGenerator:
+    def test_output_equals_sync_generator(self):
+        project = make_project("Async", 20)
+        with TemporaryDirectory() as tmpdir:
+            ProjectGenerator(project, Path(tmpdir) / "sync")
+            asyncio.run(AsyncProjectGenerator(project, Path(tmpdir) / "async", queue_size=2).generate())
+            expected = read_tree(Path(tmpdir) / "sync")
+            assert len(expected) == 20
+            assert read_tree(Path(tmpdir) / "async") == expected
+
+    def test_concurrent_generations_share_executor(self):
+        with TemporaryDirectory() as tmpdir, ThreadPoolExecutor(2) as executor:
+            metrics = [MetricsCollector() for _ in range(3)]
+
+            async def generate_all() -> None:
+                await asyncio.gather(*(
+                    AsyncProjectGenerator(
+                        make_project(f"Project{index}", 5), Path(tmpdir), executor, metrics=metrics[index]
+                    ).generate()
+                    for index in range(3)
+                ))
+
+            asyncio.run(generate_all())
+            for index in range(3):
+                assert len(list((Path(tmpdir) / f"Project{index}").rglob("*.py"))) == 5
+                assert metrics[index].files_written == 5
+
+    def test_render_error_is_raised(self):
+        project = make_project("Broken", 3)
+        project.packages[1].classes[0].operations = None
+        with TemporaryDirectory() as tmpdir:
+            with pytest.raises(ExceptionGroup):
+                asyncio.run(AsyncProjectGenerator(project, Path(tmpdir)).generate())
+
+    def test_generate_project_async(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi"
+            xmi_path.write_text(XMI.format(name="Shop"))
+            metrics = MetricsCollector(Path(tmpdir) / "metrics.json")
+            asyncio.run(generate_project_async(xmi_path, Path(tmpdir) / "out", metrics=metrics))
+            generated = read_tree(Path(tmpdir) / "out")
+            assert sorted(generated) == ["Shop/Shop/Billing/Invoice.py", "Shop/Shop/Item.py", "Shop/Shop/Order.py"]
+            assert metrics.counts["classes"] == 3
+            assert (Path(tmpdir) / "metrics.json").is_file()
+
+    def test_additional_targets_equal_sync_generator(self):
+        project = make_project("Targets", 4)
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            ProjectGenerator(project, root / "sync", targets={Emitter.DATACLASS: root / "sync_dto"})
+            generator = AsyncProjectGenerator(project, root / "async", targets={Emitter.DATACLASS: root / "async_dto"})
+            asyncio.run(generator.generate())
+            assert read_tree(root / "async_dto") == read_tree(root / "sync_dto")
+            assert len(read_tree(root / "async_dto")) == 4
@@ -0,0 +1,131 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.ClassIRBuilder import ClassIRBuilder
+from project_generator.ClassIRSerializer import ClassIRSerializer
+from project_generator.exceptions import (
+    InvalidModelFile,
+    UnsupportedModelVersion,
+)
+from project_generator.ir import (
+    FieldIR,
+    FieldKind,
+    MethodIR,
+    ParameterIR,
+)
+from project_generator.ProjectGenerator import ProjectGenerator
+from project_generator.syntax import (
+    Class,
+    Operation,
+    Property,
+    Relation,
+    RelationType,
+    Visibility,
+)
+from project_generator.TemplateManager import TemplateManager
+from project_generator.XmiParser import XmiParser
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="Shop">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Sales">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="item" visibility="private" type="c2"/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="count" visibility="public"/>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="total" visibility="private">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" name="tax" direction="in" type="Real"/>
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par2" direction="return" type="Integer"/>
+        </ownedOperation>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>
+      <packagedElement xmi:type="uml:Class" xmi:id="c3" name="Base"/>
+      <packagedElement xmi:type="uml:Association" xmi:id="r1" name="a" client="c1" supplier="c2"/>
+      <packagedElement xmi:type="uml:Aggregation" xmi:id="r2" name="b" client="c1" supplier="c2"/>
+      <packagedElement xmi:type="uml:Composition" xmi:id="r3" name="c" client="c1" supplier="c2"/>
+      <packagedElement xmi:type="uml:Generalization" xmi:id="r4" name="d" client="c1" supplier="c3"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestClassIRBuilder:
+    def test_build_resolves_fields_methods_and_imports(self):
+        project = XmiParser.parse(XMI.encode())
+        builder = ClassIRBuilder(project)
+        classes = builder.build_project(project, ProjectGenerator.index_relations(project))
+        order = classes["c1"]
+        assert list(classes) == ["c1", "c2", "c3"]
+        assert order.bases == ("Base",)
+        assert order.imports == (("Shop.Sales.Base", "Base"), ("Shop.Sales.Item", "Item"))
+        # Item is composed as well, so it is needed at runtime
+        assert order.type_checking_imports == ()
+        assert order.fields == (
+            FieldIR("_item", "item", "Item", FieldKind.PROPERTY),
+            FieldIR("count", "count", "int", FieldKind.PROPERTY),
+            FieldIR("_item1", "item1", "Item", FieldKind.ASSOCIATION),
+            FieldIR("_item2s", "item2s", "Item", FieldKind.AGGREGATION),
+            FieldIR("_item31", "", "Item", FieldKind.COMPOSITION),
+        )
+        assert order.methods == (MethodIR("_total", (ParameterIR("tax", "float"),), "int"),)
+
+    def test_rendering_from_ir_equals_generated_class(self):
+        project = XmiParser.parse(XMI.encode())
+        manager = TemplateManager(project, Path("out"))
+        relations_by_client = ProjectGenerator.index_relations(project)
+        classes = ClassIRBuilder(project).build_project(project, relations_by_client)
+        for class_syntax in project.packages[0].classes:
+            assert manager.render_class(classes[class_syntax.id]) == manager.generate_class(
+                class_syntax, relations_by_client.get(class_syntax.name, [])
+            )
+
+    def test_serializer_round_trip(self):
+        project = XmiParser.parse(XMI.encode())
+        classes = ClassIRBuilder(project).build_project(project, ProjectGenerator.index_relations(project))
+        with TemporaryDirectory() as tmpdir:
+            ir_path = Path(tmpdir) / "classes.pgir"
+            ClassIRSerializer.dump(classes, ir_path)
+            assert ClassIRSerializer.load(ir_path) == classes
+
+        data = ClassIRSerializer.dumps(classes)
+        with pytest.raises(InvalidModelFile):
+            ClassIRSerializer.loads(b"not a file")
+        with pytest.raises(InvalidModelFile):
+            ClassIRSerializer.loads(data[:-5])
+        with pytest.raises(UnsupportedModelVersion):
+            ClassIRSerializer.loads(ClassIRSerializer.magic + b"\x00\x09" + data[10:])
+
+    def test_slots_leave_out_inherited_slots_and_secondary_bases(self):
+        project = XmiParser.parse(XMI.encode())
+        project.packages[0].dependencies.append(
+            Relation(id="r5", name="e", type=RelationType.REALIZATION, client="c1", supplier="c2")
+        )
+        project.packages[0].classes[1].properties.append(
+            Property(id="p3", name="count", type="Integer", visibility=Visibility.PUBLIC)
+        )
+        classes = ClassIRBuilder(project, slots=True).build_project(project, ProjectGenerator.index_relations(project))
+        assert classes["c1"].bases == ("Base", "Item")
+        assert classes["c1"].slots == ("_item", "count", "_item1", "_item2s", "_item31")
+        assert classes["c2"].slots is None
+        assert classes["c3"].slots == ()
+        assert ClassIRSerializer.loads(ClassIRSerializer.dumps(classes)) == classes
+
+    def test_slots_clashing_with_methods(self):
+        project = XmiParser.parse(XMI.encode())
+        project.packages[0].classes.append(
+            Class(
+                id="c4",
+                name="Box",
+                properties=[Property(id="p3", name="size", type="Integer", visibility=Visibility.PRIVATE)],
+                operations=[Operation(id="o2", name="size", parameters=[], visibility=Visibility.PRIVATE)],
+            )
+        )
+        relations_by_client = ProjectGenerator.index_relations(project)
+        classes = ClassIRBuilder(project, slots=True).build_project(project, relations_by_client)
+        assert classes["c4"].slots is None
+        assert classes["c3"].slots == ()
+
+        namespace: dict = {}
+        exec(TemplateManager(project, Path("out"), slots=True).render_class(classes["c4"]), namespace)
+        assert namespace["Box"](3)._size == 3
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from project_generator.DependencyIndex import DependencyIndex
+from project_generator.ProjectGenerator import ProjectGenerator
+from project_generator.StructuralHasher import StructuralHasher
+from project_generator.XmiParser import XmiParser
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="Shop">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Sales">
+      <packagedElement xmi:type="uml:Generalization" xmi:id="r1" name="gen" client="c4" supplier="c1"/>
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="items" visibility="private" type="List&lt;Item&gt;"/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="total" visibility="public" type="d1"/>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item">
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="price" visibility="public">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" name="invoice" direction="in" type="c3"/>
+        </ownedOperation>
+      </packagedElement>
+      <packagedElement xmi:type="uml:DataType" xmi:id="d1" name="Money"/>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Billing">
+      <packagedElement xmi:type="uml:Composition" xmi:id="r2" name="comp" client="Invoice" supplier="Order"/>
+      <packagedElement xmi:type="uml:Class" xmi:id="c3" name="Invoice"/>
+      <packagedElement xmi:type="uml:Class" xmi:id="c4" name="RushOrder"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestDependencyIndex:
+    def test_dependents(self):
+        index = DependencyIndex(XmiParser.parse(XMI.encode()))
+        assert [class_syntax.id for class_syntax in index.dependents("Order")] == ["c4", "c3"]
+        assert [class_syntax.id for class_syntax in index.dependents("Item")] == ["c1"]
+        assert [class_syntax.id for class_syntax in index.dependents("Money")] == ["c1"]
+        assert [class_syntax.id for class_syntax in index.dependents("Invoice")] == ["c2"]
+        assert index.dependents("RushOrder") == []
+        assert index.dependents("List") == []
+        assert sorted(class_syntax.id for class_syntax in index.dependents("Item", transitive=True)) == [
+            "c1",
+            "c3",
+            "c4",
+        ]
+
+    def test_affected_files_include_dependents(self):
+        old_project = XmiParser.parse(XMI.encode())
+        new_project = XmiParser.parse(XMI.replace('name="Item"', 'name="Article"').encode())
+        changes = StructuralHasher.diff(
+            StructuralHasher.hash_project(old_project),
+            StructuralHasher.hash_project(new_project),
+        )
+        assert ProjectGenerator.affected_files(old_project, new_project, changes, Path("out")) == [
+            Path("out/Shop/Sales/Article.py"),
+            Path("out/Shop/Sales/Item.py"),
+            Path("out/Shop/Sales/Order.py"),
+        ]
+
+    def test_affected_files_of_member_change(self):
+        old_project = XmiParser.parse(XMI.encode())
+        new_project = XmiParser.parse(
+            XMI.replace(
+                '<ownedAttribute xmi:type="uml:Property" xmi:id="p2"',
+                '<ownedAttribute xmi:type="uml:Property" xmi:id="p3" name="note" visibility="public" type="String"/>\n'
+                '        <ownedAttribute xmi:type="uml:Property" xmi:id="p2"',
+            ).encode()
+        )
+        changes = StructuralHasher.diff(
+            StructuralHasher.hash_project(old_project),
+            StructuralHasher.hash_project(new_project),
+        )
+        assert ("modified", "class", "c1") in [(change.change, change.kind, change.id) for change in changes]
+        assert ProjectGenerator.affected_files(old_project, new_project, changes, Path("out")) == [
+            Path("out/Shop/Sales/Order.py"),
+        ]
@@ -0,0 +1,82 @@
+import gzip
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.exceptions import (
+    NoAttribute,
+    NoElement
+)
+from project_generator.ExpatXmiParser import ExpatXmiParser
+from project_generator.XmiParser import XmiParser
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <xmi:Documentation exporter="test"/>
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="Shop">
+    <packagedElement xmi:type="uml:Class" xmi:id="c0" name="Ignored"/>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Sales">
+      <packagedElement xmi:type="uml:Generalization" xmi:id="r1" name="gen" client="c1" supplier="c2"/>
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="items" visibility="private" type=" Item "/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="meta" visibility="public" type="uml:Property"/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p3" name="total" visibility="public">
+          <type xmi:type="uml:PrimitiveType" href="types.xmi#money"/>
+        </ownedAttribute>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p4" name="owner" visibility="public">
+          <uml:type xmi:idref="c3"/>
+          <type xmi:idref="c2"/>
+        </ownedAttribute>
+        <ownedAttribute xmi:type="uml:Property" href="shared.xmi#p5"/>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="add" visibility="public">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" name="item" direction="in">
+            <type xmi:idref="c2"/>
+          </ownedParameter>
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par2" name="count" direction="in"/>
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par3" direction="return" type="Integer"/>
+        </ownedOperation>
+        <ownedComment xmi:type="uml:Comment" xmi:id="com1" body="x"/>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Association" xmi:id="r2" name="assoc" client="c1" supplier="c2"/>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>
+      <packagedElement xmi:type="uml:Class" href="items.xmi#c4"/>
+      <packagedElement xmi:type="uml:DataType" xmi:id="d1" name="Money"/>
+      <packagedElement xmi:type="uml:Interface" xmi:id="i1" name="Priced">
+        <packagedElement xmi:type="uml:Enumeration" xmi:id="e1" name="Currency"/>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Billing">
+        <packagedElement xmi:type="uml:Class" xmi:id="c3" name="Invoice"/>
+      </packagedElement>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Package" href="shared.xmi#pkg3"/>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestExpatXmiParser:
+    def test_parse_equals_xmi_parser(self):
+        project = ExpatXmiParser.parse(XMI.encode())
+        assert project == XmiParser.parse(XMI.encode())
+
+        order = project.packages[0].classes[0]
+        assert [prop.type for prop in order.properties[:4]] == ["Item", "", "money", "c2"]
+        assert [parameter.type for parameter in order.operations[0].parameters] == ["c2", "uml:Parameter", "Integer"]
+        assert [relation.id for relation in project.packages[0].dependencies] == ["r2", "r1"]
+        assert project.types["e1"] == "Currency"
+
+    def test_parse_compressed_file(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi.gz"
+            xmi_path.write_bytes(gzip.compress(XMI.encode()))
+            assert ExpatXmiParser.parse(xmi_path) == XmiParser.parse(XMI.encode())
+
+    def test_parse_errors(self):
+        with pytest.raises(NoElement):
+            ExpatXmiParser.parse(XMI.replace("uml:Model", "uml:Diagram").encode())
+        with pytest.raises(NoAttribute):
+            ExpatXmiParser.parse(XMI.replace(' xmi:id="c2"', "").encode())
+        with pytest.raises(NoAttribute):
+            ExpatXmiParser.parse(XMI.replace('<type xmi:idref="c2"/>', "<type/>").encode())
+        with pytest.raises(ValueError):
+            ExpatXmiParser.parse(XMI.replace('visibility="private"', 'visibility="secret"').encode())
@@ -0,0 +1,79 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import pytest
+
+from project_generator.FileWriter import FileWriter
+
+
+class TestFileWriter:
+    def test_create_directories(self):
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir) / "project"
+            writer = FileWriter()
+            with patch("project_generator.FileWriter.os.mkdir", wraps=os.mkdir) as mkdir:
+                writer.create_directories([root / "a" / "b", root / "a", root / "c"])
+                writer.create_directories([root / "a" / "b"])
+            assert (root / "a" / "b").is_dir()
+            assert (root / "c").is_dir()
+            assert mkdir.call_count == 4
+
+    def test_write(self):
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            records = []
+            writer = FileWriter(on_file=records.append)
+            writer.write(root / "a.py", b"a")
+            writer.write(root / "b.py", b"bb")
+            writer.write(root / "a.py", b"a")
+            assert records == [1, 2, 1]
+            assert (root / "b.py").read_bytes() == b"bb"
+            assert not list(root.glob(f"*{FileWriter.temp_suffix}"))
+
+    def test_filesystem_calls_per_file(self):
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_bytes(b"old")
+            writer = FileWriter()
+            with (
+                patch("project_generator.FileWriter.os.open", wraps=os.open) as os_open,
+                patch("project_generator.FileWriter.os.write", wraps=os.write) as os_write,
+                patch("project_generator.FileWriter.os.close", wraps=os.close) as os_close,
+                patch("project_generator.FileWriter.os.replace", wraps=os.replace) as os_replace,
+                patch("project_generator.FileWriter.os.stat", wraps=os.stat) as os_stat,
+                patch("project_generator.FileWriter.os.fstat", wraps=os.fstat) as os_fstat,
+                patch("builtins.open", wraps=open) as builtin_open,
+            ):
+                for name in ["a.py", "b.py", "c.py"]:
+                    writer.write(root / name, b"content")
+            # One open, write, close and rename per file, nothing is stat'ed or read back
+            assert [os_open.call_count, os_write.call_count, os_close.call_count, os_replace.call_count] == [3] * 4
+            assert [os_stat.call_count, os_fstat.call_count, builtin_open.call_count] == [0] * 3
+            assert (root / "a.py").read_bytes() == b"content"
+
+    def test_skip_unchanged(self):
+        with TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "a.py"
+            file_path.write_bytes(b"a")
+            os.utime(file_path, ns=(0, 0))
+            written, skipped = [], []
+            writer = FileWriter(skip_unchanged=True, on_file=written.append, on_skip=skipped.append)
+            writer.write(file_path, b"a")
+            writer.write(Path(tmpdir) / "b.py", b"bb")
+            assert (written, skipped) == ([2], [1])
+            assert file_path.stat().st_mtime_ns == 0
+
+            FileWriter().write(file_path, b"a")
+            assert file_path.stat().st_mtime_ns != 0
+
+    def test_failed_write_keeps_previous_content(self):
+        with TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "a.py"
+            file_path.write_bytes(b"old")
+            with patch("project_generator.FileWriter.os.replace", side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    FileWriter().write(file_path, b"new content")
+            assert file_path.read_bytes() == b"old"
+            assert os.listdir(tmpdir) == ["a.py"]
@@ -0,0 +1,176 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.exceptions import UnresolvedReference
+from project_generator.FragmentLoader import FragmentLoader
+from project_generator.main import load_project
+from project_generator.ProjectGenerator import ProjectGenerator
+from project_generator.syntax import Reference
+from project_generator.XmiParser import XmiParser
+
+HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">"""
+
+ROOT_XMI = HEADER + """
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Local">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="LocalClass">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="prop1" name="item" visibility="private">
+          <type xmi:type="uml:Class" href="fragments/items.xmi#c3"/>
+        </ownedAttribute>
+      </packagedElement>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Package" href="fragments/shared.xmi#pkg2"/>
+  </uml:Model>
+</xmi:XMI>"""
+
+SHARED_XMI = HEADER + """
+  <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Shared">
+    <packagedElement xmi:type="uml:Class" xmi:id="c2" name="SharedClass"/>
+    <packagedElement xmi:type="uml:Class" href="items.xmi#c3"/>
+  </packagedElement>
+</xmi:XMI>"""
+
+ITEMS_XMI = HEADER + """
+  <uml:Model xmi:type="uml:Model" xmi:id="model_2" name="Items">
+    <packagedElement xmi:type="uml:Class" xmi:id="c3" name="{name}"/>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+def write_model(temp_dir: str, item_name: str = "Item") -> Path:
+    root_path = Path(temp_dir) / "root.xmi"
+    root_path.write_text(ROOT_XMI)
+    (Path(temp_dir) / "fragments").mkdir(exist_ok=True)
+    (Path(temp_dir) / "fragments" / "shared.xmi").write_text(SHARED_XMI)
+    (Path(temp_dir) / "fragments" / "items.xmi").write_text(ITEMS_XMI.format(name=item_name))
+    return root_path
+
+
+class TestFragmentLoader:
+    def test_parse_keeps_references(self):
+        with TemporaryDirectory() as temp_dir:
+            project = XmiParser.parse(write_model(temp_dir))
+
+        assert project.packages[1] == Reference("pkg2", "", "fragments/shared.xmi")
+        assert project.packages[0].classes[0].properties[0].type == "c3"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_resolve_fragments(self, workers):
+        with TemporaryDirectory() as temp_dir:
+            root_path = write_model(temp_dir)
+            loader = FragmentLoader(workers=workers)
+            project = loader.resolve(XmiParser.parse(root_path), root_path.parent)
+
+        shared = project.packages[1]
+        assert shared.name == "Shared"
+        assert [class_syntax.name for class_syntax in shared.classes] == ["SharedClass", "Item"]
+        assert loader.index["c3"].name == "Item"
+        assert loader.index["c1"].name == "LocalClass"
+
+    def test_fragments_are_cached_independently(self):
+        with TemporaryDirectory() as temp_dir:
+            root_path = write_model(temp_dir)
+            cache_dir = Path(temp_dir) / "cache"
+            load_project(root_path, fragment_cache=cache_dir, workers=1)
+            caches = {path.name.split(".")[0]: path for path in cache_dir.iterdir()}
+            for cache_path in caches.values():
+                os.utime(cache_path, ns=(0, 0))
+
+            items_path = Path(temp_dir) / "fragments" / "items.xmi"
+            items_path.write_text(ITEMS_XMI.format(name="RenamedItem"))
+            project = load_project(root_path, fragment_cache=cache_dir, workers=1)
+
+            assert caches["shared"].stat().st_mtime_ns == 0
+            assert caches["items"].stat().st_mtime_ns != 0
+        assert project.packages[1].classes[1].name == "RenamedItem"
+
+    def test_unresolved_reference(self):
+        with TemporaryDirectory() as temp_dir:
+            root_path = write_model(temp_dir)
+            (Path(temp_dir) / "fragments" / "shared.xmi").write_text(SHARED_XMI.replace("pkg2", "pkg3"))
+
+            with pytest.raises(UnresolvedReference):
+                FragmentLoader(workers=1).resolve(XmiParser.parse(root_path), root_path.parent)
+
+    @pytest.mark.parametrize("expat", [False, True], ids=["tree", "expat"])
+    def test_resolve_class_members(self, expat):
+        root_xmi = HEADER + """
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Local">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="LocalClass">
+        <ownedAttribute xmi:type="uml:Property" href="members.xmi#p9"/>
+        <ownedOperation xmi:type="uml:Operation" href="members.xmi#o9"/>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="run" visibility="public">
+          <ownedParameter xmi:type="uml:Parameter" href="members.xmi#par9"/>
+        </ownedOperation>
+      </packagedElement>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+        members_xmi = HEADER + """
+  <packagedElement xmi:type="uml:Class" xmi:id="c9" name="Shared">
+    <ownedAttribute xmi:type="uml:Property" xmi:id="p9" name="count" visibility="public" type="Integer"/>
+    <ownedOperation xmi:type="uml:Operation" xmi:id="o9" name="stop" visibility="public">
+      <ownedParameter xmi:type="uml:Parameter" xmi:id="par9" name="force" direction="in" type="Boolean"/>
+    </ownedOperation>
+  </packagedElement>
+</xmi:XMI>"""
+
+        with TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir) / "root.xmi"
+            root_path.write_text(root_xmi)
+            (Path(temp_dir) / "members.xmi").write_text(members_xmi)
+            project = load_project(root_path, workers=1, expat=expat)
+            ProjectGenerator(project, Path(temp_dir) / "out")
+            generated = (Path(temp_dir) / "out" / "TestProject" / "Local" / "LocalClass.py").read_text()
+
+        local_class = project.packages[0].classes[0]
+        assert [prop.name for prop in local_class.properties] == ["count"]
+        assert [operation.name for operation in local_class.operations] == ["stop", "run"]
+        assert local_class.operations[1].parameters[0].name == "force"
+        assert "def __init__(self, count: int):" in generated
+        assert "def run(self, force: bool) -> None:" in generated
+
+    @pytest.mark.parametrize("expat", [False, True], ids=["tree", "expat"])
+    def test_resolve_type_library(self, expat):
+        root_xmi = HEADER + """
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Local">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Car">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="owner" visibility="public">
+          <type xmi:type="uml:Class" href="library/types.xmi#cP"/>
+        </ownedAttribute>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="label" visibility="public">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" name="text" direction="in">
+            <type xmi:type="uml:PrimitiveType" href="library/types.xmi#tS"/>
+          </ownedParameter>
+        </ownedOperation>
+      </packagedElement>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+        types_xmi = HEADER + """
+  <uml:Model xmi:type="uml:Model" xmi:id="model_2" name="Library">
+    <packagedElement xmi:type="uml:Class" xmi:id="cP" name="Person"/>
+    <packagedElement xmi:type="uml:PrimitiveType" xmi:id="tS" name="String"/>
+  </uml:Model>
+</xmi:XMI>"""
+
+        with TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir) / "root.xmi"
+            root_path.write_text(root_xmi)
+            (Path(temp_dir) / "library").mkdir()
+            (Path(temp_dir) / "library" / "types.xmi").write_text(types_xmi)
+            project = load_project(root_path, fragment_cache=Path(temp_dir) / "cache", workers=1, expat=expat)
+            ProjectGenerator(project, Path(temp_dir) / "out")
+            generated = (Path(temp_dir) / "out" / "TestProject" / "Local" / "Car.py").read_text()
+
+        assert project.packages[0].classes[0].properties[0].type_document == "library/types.xmi"
+        assert project.types["cP"] == "Person"
+        assert project.types["tS"] == "String"
+        assert "def __init__(self, owner: Person):" in generated
+        assert "def label(self, text: str) -> None:" in generated
@@ -3,7 +3,10 @@ from tempfile import TemporaryDirectory
 
 import pytest
 
-from project_generator.ImportMapping import ImportMapping
+from project_generator.ImportMapping import (
+    ImportMapping,
+    ModuleLayout,
+)
 from project_generator.exceptions import NonMappedClass
 from project_generator.syntax import (
     Class,
@@ -237,3 +240,33 @@ class TestImportMappingExtended:
             path = import_mapping.get_import_path("RootClass")
             assert path == "output.TestProject.Root.RootClass"
 
+
+    def test_import_mapping_package_layout(self):
+        project = Project(
+            id="p1",
+            name="TestProject",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Root",
+                    subpackages=[
+                        Package(
+                            id="pkg2",
+                            name="Sub",
+                            subpackages=[],
+                            classes=[Class(id="c2", name="SubClass", properties=[], operations=[])],
+                            dependencies=[],
+                            data_types=[],
+                        )
+                    ],
+                    classes=[Class(id="c1", name="RootClass", properties=[], operations=[])],
+                    dependencies=[],
+                    data_types=[],
+                )
+            ],
+        )
+
+        import_mapping = ImportMapping(project, Path("output"), ModuleLayout.PACKAGE)
+
+        assert import_mapping.get_import_path("RootClass") == "output.TestProject.Root"
+        assert import_mapping.get_import_path("SubClass") == "output.TestProject.Root.Sub"
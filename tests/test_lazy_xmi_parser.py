@@ -0,0 +1,94 @@
+import copy
+import dataclasses
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.exceptions import NoAttribute
+from project_generator.LazyList import LazyList
+from project_generator.LazyXmiParser import LazyXmiParser
+from project_generator.ProjectSerializer import ProjectSerializer
+from project_generator.XmiParser import XmiParser
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="First">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="A">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="b" visibility="private" type="c2"/>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="run" visibility="public">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" name="count" type="int" direction="in"/>
+        </ownedOperation>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Association" xmi:id="r1" name="assoc" client="c1" supplier="c2"/>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Second">
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="B"/>
+      <packagedElement xmi:type="uml:DataType" xmi:id="d1" name="Money"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestLazyXmiParser:
+    def test_parse_equals_eager_parse(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi"
+            xmi_path.write_text(XMI)
+            assert LazyXmiParser.parse(xmi_path) == XmiParser.parse(xmi_path)
+
+    def test_lists_are_loaded_on_access(self):
+        project = LazyXmiParser.parse(XMI.encode())
+        assert not project.packages.is_loaded
+
+        first = project.packages[0]
+        assert project.packages.is_loaded
+        assert not first.classes.is_loaded
+        assert not first.dependencies.is_loaded
+
+        operation = first.classes[0].operations[0]
+        assert operation.parameters[0].name == "count"
+        assert not first.classes[0].properties.is_loaded
+        assert not project.packages[1].classes.is_loaded
+
+    def test_serialize_and_pickle(self):
+        expected = XmiParser.parse(XMI.encode())
+        assert ProjectSerializer.loads(ProjectSerializer.dumps(LazyXmiParser.parse(XMI.encode()))) == expected
+
+        restored = pickle.loads(pickle.dumps(LazyXmiParser.parse(XMI.encode())))
+        assert type(restored.packages) is list
+        assert restored == expected
+
+    def test_asdict_and_deepcopy(self):
+        expected = XmiParser.parse(XMI.encode())
+        assert dataclasses.asdict(LazyXmiParser.parse(XMI.encode())) == dataclasses.asdict(expected)
+
+        restored = copy.deepcopy(LazyXmiParser.parse(XMI.encode()))
+        assert type(restored.packages) is list
+        assert restored == expected
+
+    def test_errors_are_raised_on_access(self):
+        project = LazyXmiParser.parse(XMI.replace(' visibility="private"', "").encode())
+        classes = project.packages[0].classes
+        with pytest.raises(NoAttribute):
+            classes[0].properties[0]
+
+
+class TestLazyList:
+    def test_list_operations(self):
+        calls = []
+        items = LazyList(loader=lambda: calls.append(1) or [3, 1, 2])
+        assert calls == []
+        assert len(items) == 3
+        assert [] + items == [3, 1, 2]
+        assert items + [4] == [3, 1, 2, 4]
+        items.sort()
+        assert items == [1, 2, 3]
+        assert copy.copy(items) == [1, 2, 3]
+        assert calls == [1]
+
+    def test_compare_two_lazy_lists(self):
+        assert LazyList(loader=lambda: [1]) == LazyList(loader=lambda: [1])
+        assert LazyList(loader=lambda: [1]) != LazyList(loader=lambda: [2])
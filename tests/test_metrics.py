@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from project_generator.main import generate_project
+from project_generator.Metrics import MetricsCollector
+
+XMI_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Test">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Class1">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="prop1" name="value" visibility="private" type="String"/>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Class2"/>
+      <packagedElement xmi:type="uml:Association" xmi:id="r1" name="assoc" client="Class1" supplier="Class2"/>
+      <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Inner"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestMetrics:
+    def test_json_report(self):
+        with TemporaryDirectory() as temp_dir:
+            xmi_path = Path(temp_dir) / "model.xmi"
+            xmi_path.write_text(XMI_CONTENT)
+            report_path = Path(temp_dir) / "metrics.json"
+            output_dir = Path(temp_dir) / "output"
+
+            generate_project(xmi_path, output_dir, metrics=MetricsCollector(report_path))
+            first = json.loads(report_path.read_text())
+            generate_project(xmi_path, output_dir, metrics=MetricsCollector(report_path))
+            second = json.loads(report_path.read_text())
+            generate_project(xmi_path, output_dir, metrics=MetricsCollector(report_path), skip_unchanged=True)
+            third = json.loads(report_path.read_text())
+
+        assert first["counts"]["packages"] == 2
+        assert first["counts"]["classes"] == 2
+        assert first["counts"]["relations"] == 1
+        assert first["counts"]["properties"] == 1
+        assert first["counts"]["classes_rendered"] == 2
+        assert {"parse", "import_mapping", "generate"} <= set(first["phase_seconds"])
+        assert first["files"]["written"] == 2
+        assert first["files"]["skipped"] == 0
+        assert first["files"]["bytes_written"] > 0
+        assert second["files"] == first["files"]
+        assert third["files"] == {"written": 0, "skipped": 2, "bytes_written": 0}
+        assert first["render_cache"] == {"hits": 0, "misses": 2}
+
+    def test_openmetrics_report(self):
+        metrics = MetricsCollector()
+        metrics.record_measurement("phase", "parse", 0.5)
+        metrics.record_file(10)
+
+        with TemporaryDirectory() as temp_dir:
+            report_path = Path(temp_dir) / "metrics.prom"
+            metrics.write_report(report_path)
+            text = report_path.read_text()
+
+        assert 'project_generator_phase_seconds{phase="parse"} 0.5' in text
+        assert "project_generator_written_bytes 10" in text
+        assert text.endswith("# EOF\n")
@@ -0,0 +1,77 @@
+import gzip
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from project_generator.ModelValidator import (
+    ModelValidator,
+    ValidationProblem,
+)
+
+VALID_XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="shop">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="total" visibility="private" type="Float"/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="item" visibility="private">
+          <type xmi:idref="c2"/>
+        </ownedAttribute>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="pay" visibility="public">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" name="amount" type="Money" direction="in"/>
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par2" type="Integer" direction="return"/>
+        </ownedOperation>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>
+      <packagedElement xmi:type="uml:DataType" xmi:id="d1" name="Money"/>
+      <packagedElement xmi:type="uml:Association" xmi:id="r1" name="items" client="Order" supplier="c2"/>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="billing">
+      <packagedElement xmi:type="uml:Class" xmi:id="c3" name="Order"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+INVALID_XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="my-package">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="class" visibility="private" type="Missing"/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="item" visibility="secret">
+          <type xmi:idref="c404"/>
+        </ownedAttribute>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="pay">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" type="Float" direction="in"/>
+        </ownedOperation>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Order"/>
+      <packagedElement xmi:type="uml:Dependency" xmi:id="r1" name="uses" client="Order" supplier="Ghost"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestModelValidator:
+    def test_valid_model(self):
+        assert ModelValidator.validate(VALID_XMI.encode()) == []
+
+    def test_reports_all_problems(self):
+        problems = ModelValidator.validate(INVALID_XMI.encode())
+        assert problems == [
+            ValidationProblem("pkg1", "Package name 'my-package' is not a valid Python identifier."),
+            ValidationProblem("p1", "Property name 'class' is not a valid Python identifier."),
+            ValidationProblem("p2", "Invalid visibility 'secret'."),
+            ValidationProblem("o1", "Attribute visibility is missing."),
+            ValidationProblem("par1", "Parameter has no name."),
+            ValidationProblem("c2", "Duplicate class name Order, also used by c1."),
+            ValidationProblem("r1", "Relation supplier Ghost does not exist."),
+            ValidationProblem("p1", "Property type Missing cannot be resolved."),
+            ValidationProblem("p2", "Property type c404 cannot be resolved."),
+        ]
+        assert str(problems[-1]) == "p2: Property type c404 cannot be resolved."
+
+    def test_compressed_file(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi.gz"
+            xmi_path.write_bytes(gzip.compress(INVALID_XMI.encode()))
+            assert len(ModelValidator.validate(xmi_path)) == 9
@@ -0,0 +1,87 @@
+import gzip
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from project_generator.main import load_project
+from project_generator.ParallelXmiParser import ParallelXmiParser
+from project_generator.XmiParser import XmiParser
+from project_generator.XmiScanner import XmiScanner
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="First">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="A">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="b" visibility="private" type="c2"/>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Package" xmi:id="pkg1_1" name="Nested">
+        <packagedElement xmi:type="uml:Class" xmi:id="c3" name="C"/>
+      </packagedElement>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Class" xmi:id="c0" name="TopLevel"/>
+    <packagedElement xmi:type="uml:PrimitiveType" xmi:id="prim1" name="String"/>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Second">
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="B"/>
+      <packagedElement xmi:type="uml:Realization" xmi:id="r1" name="real" client="c2" supplier="c1"/>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg3" name="Empty"/>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestParallelXmiParser:
+    def test_parse_equals_serial_parse(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi"
+            xmi_path.write_text(XMI)
+            project = ParallelXmiParser.parse(xmi_path, workers=2)
+            assert project == XmiParser.parse(xmi_path)
+            assert [package.name for package in project.packages] == ["First", "Second", "Empty"]
+            assert project.types["prim1"] == "String"
+
+    def test_single_package_batches(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi"
+            xmi_path.write_text(XMI)
+            ParallelXmiParser.batches_per_worker = 100
+            try:
+                assert ParallelXmiParser.parse(xmi_path, workers=2) == XmiParser.parse(xmi_path)
+            finally:
+                ParallelXmiParser.batches_per_worker = 4
+
+    def test_compressed_input_falls_back(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi.gz"
+            xmi_path.write_bytes(gzip.compress(XMI.encode()))
+            assert ParallelXmiParser.parse(xmi_path, workers=2) == XmiParser.parse(xmi_path)
+
+    def test_load_project_parallel(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi"
+            xmi_path.write_text(XMI)
+            expected = XmiParser.parse(xmi_path)
+            assert load_project(xmi_path, workers=2, parallel=True) == expected
+            assert load_project(xmi_path, use_mmap=True, workers=2, parallel=True) == expected
+
+
+class TestXmiScanner:
+    def test_scan_spans(self):
+        data = XMI.encode()
+        spans = XmiScanner.scan(data, max_depth=2)
+        assert [span.depth for span in spans] == [0, 1, 2, 2, 2, 2, 2]
+        assert spans[1].tag == "{http://schema.omg.org/spec/UML/2.1}Model"
+        for span in spans[2:]:
+            element = data[span.start:span.end]
+            assert element.startswith(b"<packagedElement")
+            assert element.endswith(b"</packagedElement>") or element.endswith(b"/>")
+            assert span.parent == 1
+
+    def test_extract(self):
+        data = XMI.encode()
+        spans = XmiScanner.scan(data)
+        index = next(index for index, span in enumerate(spans) if span.attributes.get("name") == "Nested")
+        document = XmiScanner.extract(data, spans, index)
+        project = XmiParser.parse(document)
+        assert [package.name for package in project.packages] == ["First"]
+        assert project.packages[0].classes == []
+        assert project.packages[0].subpackages[0].name == "Nested"
@@ -0,0 +1,81 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from project_generator.Profiler import Profiler
+from project_generator.ProjectGenerator import ProjectGenerator
+from project_generator.syntax import (
+    Class,
+    Package,
+    Project,
+)
+
+
+class TestProfiler:
+    def test_generation_is_measured(self):
+        project = Project(
+            id="p1",
+            name="ProfiledProject",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Outer",
+                    subpackages=[
+                        Package(
+                            id="pkg2",
+                            name="Inner",
+                            subpackages=[],
+                            classes=[
+                                Class(
+                                    id="c1",
+                                    name="InnerClass",
+                                    properties=[],
+                                    operations=[],
+                                )
+                            ],
+                            dependencies=[],
+                            data_types=[],
+                        )
+                    ],
+                    classes=[
+                        Class(
+                            id="c2",
+                            name="OuterClass",
+                            properties=[],
+                            operations=[],
+                        )
+                    ],
+                    dependencies=[],
+                    data_types=[],
+                )
+            ],
+        )
+        events = []
+        profiler = Profiler()
+        profiler.add_hook(lambda kind, name, duration: events.append((kind, name)))
+
+        with TemporaryDirectory() as temp_dir:
+            ProjectGenerator(project, Path(temp_dir) / "output", profiler)
+
+        assert ("phase", "import_mapping") in events
+        assert ("phase", "generate") in events
+        assert ("render", "InnerClass") in events
+        assert ("class", "Outer.Inner.InnerClass") in events
+        assert {name for name, _ in profiler.slowest_classes(10)} == {"Outer.OuterClass", "Outer.Inner.InnerClass"}
+        assert {name for name, _ in profiler.slowest_packages(10)} == {"Outer", "Outer.Inner"}
+
+    def test_slowest_packages_sum_class_durations(self):
+        profiler = Profiler()
+        profiler.durations["class"].update({"a.A": 1.0, "a.B": 2.0, "b.C": 2.5})
+
+        assert profiler.slowest_classes(1) == [("b.C", 2.5)]
+        assert profiler.slowest_packages(2) == [("a", 3.0), ("b", 2.5)]
+
+    def test_dump_cprofile_stats(self):
+        profiler = Profiler(cprofile=True)
+        with profiler.profile():
+            sum(range(100))
+
+        with TemporaryDirectory() as temp_dir:
+            stats_path = Path(temp_dir) / "run.stats"
+            profiler.dump_stats(stats_path)
+            assert stats_path.stat().st_size > 0
@@ -1,11 +1,22 @@
+import subprocess
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from project_generator.ImportMapping import ModuleLayout
 from project_generator.ProjectGenerator import ProjectGenerator
 from project_generator.syntax import (
     Class,
     Package,
     Project,
+    Property,
+    Relation,
+    RelationType,
+    Visibility,
+)
+from project_generator.TemplateManager import (
+    Emitter,
+    PackageInit,
 )
 
 
@@ -293,3 +304,423 @@ class TestProjectGeneratorExtended:
             assert (output_path / project.name / "A").exists()
             assert (output_path / project.name / "A" / "B").exists()
             assert (output_path / project.name / "A" / "B" / "C").exists()
+
+    def test_generate_package_inits(self):
+        project = Project(
+            id="p1",
+            name="Shop",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Sales",
+                    subpackages=[
+                        Package(
+                            id="pkg2",
+                            name="Billing",
+                            subpackages=[],
+                            classes=[Class(id="c2", name="Invoice", properties=[], operations=[])],
+                            dependencies=[],
+                            data_types=[],
+                        )
+                    ],
+                    classes=[
+                        Class(
+                            id="c1",
+                            name="Order",
+                            properties=[Property(id="p1", name="invoice", type="Invoice", visibility=Visibility.PUBLIC)],
+                            operations=[],
+                        )
+                    ],
+                    dependencies=[],
+                    data_types=[],
+                )
+            ],
+        )
+        check = (
+            "import output.Shop.Sales.Order\n"
+            "from output.Shop import Sales\n"
+            "from output.Shop.Sales import Billing, Order\n"
+            "assert isinstance(Order, type) and Order.__name__ == 'Order'\n"
+            "assert Billing.Invoice.__name__ == 'Invoice'\n"
+            "assert Sales.__all__ == ['Billing', 'Order']\n"
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "output"
+            ProjectGenerator(project, output_path)
+            assert not (output_path / "Shop" / "__init__.py").exists()
+
+            ProjectGenerator(project, output_path, package_init=PackageInit.EMPTY)
+            assert (output_path / "Shop" / "Sales" / "Billing" / "__init__.py").read_text() == ""
+
+            for package_init in [PackageInit.EAGER, PackageInit.LAZY]:
+                ProjectGenerator(project, output_path, package_init=package_init)
+                assert (output_path / "Shop" / "__init__.py").exists()
+                subprocess.run([sys.executable, "-c", check], cwd=temp_dir, check=True)
+
+    def test_generate_additional_targets(self):
+        project = Project(
+            id="p1",
+            name="Shop",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Sales",
+                    subpackages=[],
+                    classes=[
+                        Class(
+                            id="c1",
+                            name="Order",
+                            properties=[Property(id="p1", name="total", type="Integer", visibility=Visibility.PRIVATE)],
+                            operations=[],
+                        ),
+                        Class(id="c2", name="Item", properties=[], operations=[]),
+                    ],
+                    dependencies=[
+                        Relation(id="r1", name="items", type=RelationType.AGGREGATION, client="Order", supplier="Item"),
+                        Relation(
+                            id="r2", name="base", type=RelationType.GENERALIZATION, client="Order", supplier="Item"
+                        ),
+                    ],
+                    data_types=[],
+                )
+            ],
+        )
+        check = (
+            "from dto.Shop.Sales.Order import Order\n"
+            "from dto.Shop.Sales.Item import Item\n"
+            "order = Order(total=3, items=[Item()])\n"
+            "assert order.items[0] == Item() and order.total == 3 and isinstance(order, Item)\n"
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "out"
+            ProjectGenerator(
+                project,
+                output_path,
+                package_init=PackageInit.LAZY,
+                targets={Emitter.STUB: Path(temp_dir) / "stubs", Emitter.DATACLASS: Path(temp_dir) / "dto"},
+            )
+            assert sorted(str(path.relative_to(temp_dir)) for path in Path(temp_dir).rglob("Order.py*")) == [
+                "dto/Shop/Sales/Order.py",
+                "out/Shop/Sales/Order.py",
+                "stubs/Shop/Sales/Order.pyi",
+            ]
+            assert (Path(temp_dir) / "stubs" / "Shop" / "Sales" / "Order.pyi").read_text() == (
+                "from stubs.Shop.Sales.Item import Item\n"
+                "\n\n"
+                "class Order(Item):\n"
+                "    _total: int\n"
+                "    _items: list[Item]\n"
+                "\n"
+                "    def __init__(self, total: int, items: list[Item] | None = None) -> None: ...\n"
+            )
+            assert (Path(temp_dir) / "stubs" / "Shop" / "Sales" / "__init__.pyi").read_text().startswith(
+                "from .Item import Item\n"
+            )
+            subprocess.run([sys.executable, "-c", check], cwd=temp_dir, check=True)
+
+    def test_generate_slotted_classes(self):
+        project = Project(
+            id="p1",
+            name="Shop",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Sales",
+                    subpackages=[],
+                    classes=[
+                        Class(
+                            id="c1",
+                            name="Named",
+                            properties=[Property(id="p1", name="name", type="String", visibility=Visibility.PUBLIC)],
+                            operations=[],
+                        ),
+                        Class(
+                            id="c2",
+                            name="Order",
+                            properties=[
+                                Property(id="p2", name="name", type="String", visibility=Visibility.PUBLIC),
+                                Property(id="p3", name="total", type="Integer", visibility=Visibility.PRIVATE),
+                            ],
+                            operations=[],
+                        ),
+                        Class(
+                            id="c3",
+                            name="Tagged",
+                            properties=[Property(id="p4", name="tag", type="String", visibility=Visibility.PUBLIC)],
+                            operations=[],
+                        ),
+                        Class(id="c4", name="Item", properties=[], operations=[]),
+                    ],
+                    dependencies=[
+                        Relation(
+                            id="r1", name="base", type=RelationType.GENERALIZATION, client="Order", supplier="Named"
+                        ),
+                        Relation(
+                            id="r2", name="base", type=RelationType.GENERALIZATION, client="Item", supplier="Named"
+                        ),
+                        Relation(
+                            id="r3", name="mixin", type=RelationType.GENERALIZATION, client="Item", supplier="Tagged"
+                        ),
+                    ],
+                    data_types=[],
+                )
+            ],
+        )
+        check = (
+            "from out.Shop.Sales.Order import Order\n"
+            "from out.Shop.Sales.Item import Item\n"
+            "from dto.Shop.Sales.Order import Order as OrderDto\n"
+            "from dto.Shop.Sales.Item import Item as ItemDto\n"
+            "order = Order('a', 3)\n"
+            "assert not hasattr(order, '__dict__') and order.name == 'a' and order._total == 3\n"
+            "assert not hasattr(OrderDto(name='a', total=3), '__dict__')\n"
+            "assert hasattr(Item('a'), '__dict__') and hasattr(ItemDto(name='a', tag='b'), '__dict__')\n"
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "out"
+            ProjectGenerator(project, output_path, targets={Emitter.DATACLASS: Path(temp_dir) / "dto"}, slots=True)
+            assert (output_path / "Shop" / "Sales" / "Order.py").read_text() == (
+                "from out.Shop.Sales.Named import Named\n"
+                "\n\n"
+                "class Order(Named):\n"
+                '    __slots__ = ("_total",)\n'
+                "\n"
+                "    def __init__(self, name: str, total: int):\n"
+                "        self.name = name\n"
+                "        self._total = total\n"
+            )
+            assert (output_path / "Shop" / "Sales" / "Tagged.py").read_text().startswith("class Tagged:\n    def")
+            subprocess.run([sys.executable, "-c", check], cwd=temp_dir, check=True)
+
+    def test_generate_lazy_compositions(self):
+        project = Project(
+            id="p1",
+            name="Shop",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Sales",
+                    subpackages=[],
+                    classes=[
+                        Class(
+                            id="c1",
+                            name="Order",
+                            properties=[Property(id="p1", name="total", type="Integer", visibility=Visibility.PUBLIC)],
+                            operations=[],
+                        ),
+                        Class(id="c2", name="Item", properties=[], operations=[]),
+                    ],
+                    dependencies=[
+                        Relation(id="r1", name="items", type=RelationType.COMPOSITION, client="Order", supplier="Item"),
+                    ],
+                    data_types=[],
+                )
+            ],
+        )
+        check = (
+            "from {root}.Shop.Sales.Order import Order\n"
+            "order = Order(3)\n"
+            "assert '_item1' not in getattr(order, '__dict__', ()) and not hasattr(order, '_item1_value')\n"
+            "item = order._item1\n"
+            "assert type(item).__name__ == 'Item' and order._item1 is item\n"
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            for root, slots in [("lazy", False), ("slotted", True)]:
+                ProjectGenerator(project, Path(temp_dir) / root, slots=slots, lazy_compositions=True)
+                subprocess.run([sys.executable, "-c", check.format(root=root)], cwd=temp_dir, check=True)
+            assert (Path(temp_dir) / "lazy" / "Shop" / "Sales" / "Order.py").read_text() == (
+                "import functools\n"
+                "\n"
+                "from lazy.Shop.Sales.Item import Item\n"
+                "\n\n"
+                "class Order:\n"
+                "    def __init__(self, total: int):\n"
+                "        self.total = total\n"
+                "\n"
+                "    @functools.cached_property\n"
+                "    def _item1(self) -> Item:\n"
+                "        return Item()\n"
+            )
+            assert (Path(temp_dir) / "slotted" / "Shop" / "Sales" / "Order.py").read_text().startswith(
+                "from slotted.Shop.Sales.Item import Item\n"
+                "\n\n"
+                "class Order:\n"
+                '    __slots__ = ("total", "_item1_value")\n'
+            )
+
+    def test_generate_package_modules(self):
+        project = Project(
+            id="p1",
+            name="Shop",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Sales",
+                    subpackages=[
+                        Package(
+                            id="pkg2",
+                            name="Billing",
+                            subpackages=[],
+                            classes=[
+                                Class(
+                                    id="c3",
+                                    name="Invoice",
+                                    properties=[
+                                        Property(id="p2", name="order", type="Order", visibility=Visibility.PUBLIC)
+                                    ],
+                                    operations=[],
+                                )
+                            ],
+                            dependencies=[],
+                            data_types=[],
+                        )
+                    ],
+                    classes=[
+                        Class(
+                            id="c1",
+                            name="Order",
+                            properties=[Property(id="p1", name="total", type="Integer", visibility=Visibility.PUBLIC)],
+                            operations=[],
+                        ),
+                        Class(id="c2", name="Item", properties=[], operations=[]),
+                    ],
+                    dependencies=[
+                        Relation(
+                            id="r1", name="base", type=RelationType.GENERALIZATION, client="Order", supplier="Item"
+                        ),
+                        Relation(id="r2", name="items", type=RelationType.AGGREGATION, client="Item", supplier="Order"),
+                    ],
+                    data_types=[],
+                )
+            ],
+        )
+        check = (
+            "from out.Shop.Sales import Item, Order\n"
+            "from out.Shop.Sales.Billing import Invoice\n"
+            "assert Invoice(Order(3)).order.total == 3 and issubclass(Order, Item)\n"
+            "from dto.Shop.Sales.Billing import Invoice\n"
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "out"
+            ProjectGenerator(
+                project,
+                output_path,
+                package_init=PackageInit.EAGER,
+                targets={Emitter.DATACLASS: Path(temp_dir) / "dto"},
+                layout=ModuleLayout.PACKAGE,
+            )
+            assert sorted(str(path.relative_to(output_path)) for path in output_path.rglob("*.py")) == [
+                "Shop/Sales/Billing/__init__.py",
+                "Shop/Sales/__init__.py",
+                "Shop/__init__.py",
+            ]
+            assert (output_path / "Shop" / "Sales" / "__init__.py").read_text() == (
+                "from __future__ import annotations\n"
+                "\n\n"
+                "class Item:\n"
+                "    def __init__(self, orders: list[Order] | None = None):\n"
+                "        self._orders = orders or []\n"
+                "\n\n"
+                "class Order(Item):\n"
+                "    def __init__(self, total: int):\n"
+                "        self.total = total\n"
+            )
+            assert (output_path / "Shop" / "Sales" / "Billing" / "__init__.py").read_text().startswith(
+                "from __future__ import annotations\n"
+                "\n"
+                "from typing import TYPE_CHECKING\n"
+                "\n"
+                "if TYPE_CHECKING:\n"
+                "    from out.Shop.Sales import Order\n"
+            )
+            subprocess.run([sys.executable, "-c", check], cwd=temp_dir, check=True)
+
+    def test_generate_mutually_referencing_package_modules(self):
+        project = Project(
+            id="p1",
+            name="Fleet",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="core",
+                    subpackages=[],
+                    classes=[
+                        Class(id="c1", name="Building", properties=[], operations=[]),
+                        Class(id="c2", name="Car", properties=[], operations=[]),
+                        Class(
+                            id="c3",
+                            name="Engine",
+                            properties=[Property(id="p1", name="home", type="Garage", visibility=Visibility.PUBLIC)],
+                            operations=[],
+                        ),
+                    ],
+                    dependencies=[
+                        Relation(
+                            id="r1", name="engine", type=RelationType.COMPOSITION, client="Car", supplier="Engine"
+                        ),
+                        Relation(
+                            id="r2", name="garage", type=RelationType.ASSOCIATION, client="Car", supplier="Garage"
+                        ),
+                    ],
+                    data_types=[],
+                ),
+                Package(
+                    id="pkg2",
+                    name="other",
+                    subpackages=[],
+                    classes=[
+                        Class(
+                            id="c4",
+                            name="Garage",
+                            properties=[
+                                Property(id="p2", name="car", type="Car", visibility=Visibility.PUBLIC),
+                                Property(id="p3", name="engine", type="Engine", visibility=Visibility.PUBLIC),
+                            ],
+                            operations=[],
+                        ),
+                    ],
+                    dependencies=[
+                        Relation(
+                            id="r3", name="base", type=RelationType.GENERALIZATION, client="Garage", supplier="Building"
+                        ),
+                    ],
+                    data_types=[],
+                ),
+            ],
+        )
+        check = (
+            "import importlib, pathlib\n"
+            "for root in ('out', 'dto'):\n"
+            "    for path in sorted(pathlib.Path(root).rglob('__init__.py')):\n"
+            "        importlib.import_module('.'.join(path.parent.parts))\n"
+            "from out.Fleet.core import Building, Engine\n"
+            "from out.Fleet.other import Garage\n"
+            "assert issubclass(Garage, Building) and Garage(None, Engine(None)).engine.home is None\n"
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "out"
+            ProjectGenerator(
+                project,
+                output_path,
+                package_init=PackageInit.EAGER,
+                targets={Emitter.DATACLASS: Path(temp_dir) / "dto"},
+                layout=ModuleLayout.PACKAGE,
+            )
+            assert (output_path / "Fleet" / "other" / "__init__.py").read_text().startswith(
+                "from __future__ import annotations\n"
+                "\n"
+                "from typing import TYPE_CHECKING\n"
+                "\n"
+                "from out.Fleet.core import Building\n"
+                "\n"
+                "if TYPE_CHECKING:\n"
+                "    from out.Fleet.core import Car\n"
+                "    from out.Fleet.core import Engine\n"
+            )
+            subprocess.run([sys.executable, "-c", check], cwd=temp_dir, check=True)
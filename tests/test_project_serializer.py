@@ -0,0 +1,173 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.exceptions import (
+    InvalidModelFile,
+    UnsupportedModelVersion,
+)
+from project_generator.main import load_project
+from project_generator.ProjectSerializer import ProjectSerializer
+from project_generator.syntax import (
+    Class,
+    DataType,
+    Operation,
+    Package,
+    Parameter,
+    ParameterDirection,
+    Project,
+    Property,
+    Relation,
+    RelationType,
+    Visibility,
+)
+
+
+def build_project() -> Project:
+    return Project(
+        id="p1",
+        name="TestProject",
+        packages=[
+            Package(
+                id="pkg1",
+                name="Outer",
+                subpackages=[
+                    Package(
+                        id="pkg2",
+                        name="Inner",
+                        subpackages=[],
+                        classes=[
+                            Class(
+                                id="c2",
+                                name="Service",
+                                properties=[],
+                                operations=[
+                                    Operation(
+                                        id="o1",
+                                        name="run",
+                                        parameters=[
+                                            Parameter(
+                                                id="par1",
+                                                name="value",
+                                                type="String",
+                                                direction=ParameterDirection.IN,
+                                            ),
+                                            Parameter(
+                                                id="par2",
+                                                name="",
+                                                type="Integer",
+                                                direction=ParameterDirection.RETURN,
+                                            ),
+                                        ],
+                                        visibility=Visibility.PROTECTED,
+                                    )
+                                ],
+                            )
+                        ],
+                        dependencies=[],
+                        data_types=[],
+                    )
+                ],
+                classes=[
+                    Class(
+                        id="c1",
+                        name="Client",
+                        properties=[
+                            Property(
+                                id="prop1",
+                                name="name",
+                                type="String",
+                                visibility=Visibility.PRIVATE,
+                            )
+                        ],
+                        operations=[],
+                    )
+                ],
+                dependencies=[
+                    Relation(
+                        id="r1",
+                        name="uses",
+                        type=RelationType.COMPOSITION,
+                        client="Client",
+                        supplier="Service",
+                    )
+                ],
+                data_types=[DataType(id="dt1", name="String")],
+            )
+        ],
+        types={"c1": "Client", "c2": "Service", "dt1": "String"},
+    )
+
+
+XMI_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Test">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Class1"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestProjectSerializer:
+    def test_round_trip(self):
+        project = build_project()
+
+        assert ProjectSerializer.loads(ProjectSerializer.dumps(project)) == project
+
+    def test_round_trip_file(self):
+        project = build_project()
+
+        with TemporaryDirectory() as temp_dir:
+            model_path = Path(temp_dir) / "model.pgm"
+            ProjectSerializer.dump(project, model_path, "source-key")
+
+            assert ProjectSerializer.is_model_file(model_path)
+            assert ProjectSerializer.read_source_key(model_path) == "source-key"
+            assert ProjectSerializer.load(model_path) == project
+
+    def test_repeated_strings_are_stored_once(self):
+        project = build_project()
+        data = ProjectSerializer.dumps(project)
+
+        assert data.count(b"String") == 1
+
+    def test_invalid_model_file(self):
+        with pytest.raises(InvalidModelFile):
+            ProjectSerializer.loads(b"<?xml version='1.0'?>")
+
+    def test_unsupported_version(self):
+        data = bytearray(ProjectSerializer.dumps(build_project()))
+        data[len(ProjectSerializer.magic) + 1] += 1
+
+        with pytest.raises(UnsupportedModelVersion):
+            ProjectSerializer.loads(bytes(data))
+
+    def test_load_project_uses_cache(self):
+        with TemporaryDirectory() as temp_dir:
+            xmi_path = Path(temp_dir) / "model.xmi"
+            xmi_path.write_text(XMI_CONTENT)
+            cache_path = Path(temp_dir) / "model.pgm"
+
+            project = load_project(xmi_path, cache_path)
+            assert cache_path.exists()
+
+            cached = build_project()
+            ProjectSerializer.dump(cached, cache_path, ProjectSerializer.read_source_key(cache_path))
+            assert load_project(xmi_path, cache_path) == cached
+
+            assert load_project(cache_path) == cached
+            assert project.packages[0].classes[0].name == "Class1"
+
+    def test_load_project_mmap_uses_content_hash(self):
+        with TemporaryDirectory() as temp_dir:
+            xmi_path = Path(temp_dir) / "model.xmi"
+            xmi_path.write_text(XMI_CONTENT)
+            cache_path = Path(temp_dir) / "model.pgm"
+
+            project = load_project(xmi_path, cache_path, use_mmap=True)
+
+            assert ProjectSerializer.read_source_key(cache_path).startswith("sha256:")
+            assert load_project(xmi_path, cache_path, use_mmap=True) == project
+            assert load_project(cache_path, use_mmap=True) == project
@@ -0,0 +1,100 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from project_generator.main import diff_projects
+from project_generator.StructuralHasher import StructuralHasher
+from project_generator.XmiParser import XmiParser
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="Shop">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Sales">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="items" visibility="private" type="c2"/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="total" visibility="public" type="Integer"/>
+        <ownedOperation xmi:type="uml:Operation" xmi:id="o1" name="add" visibility="public">
+          <ownedParameter xmi:type="uml:Parameter" xmi:id="par1" name="item" direction="in" type="c2"/>
+        </ownedOperation>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>
+      <packagedElement xmi:type="uml:Association" xmi:id="r1" name="items" client="c1" supplier="c2"/>
+    </packagedElement>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Billing">
+      <packagedElement xmi:type="uml:Class" xmi:id="c3" name="Invoice"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+def hash_xmi(xmi: str):
+    return StructuralHasher.hash_project(XmiParser.parse(xmi.encode()))
+
+
+class TestStructuralHasher:
+    def test_hash_ignores_formatting_and_package_order(self):
+        reformatted = XMI.replace(
+            '<packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>',
+            '<packagedElement  name="Item"\n        xmi:id="c2" xmi:type="uml:Class"></packagedElement>',
+        )
+        pkg1 = '    <packagedElement xmi:type="uml:Package" xmi:id="pkg1"'
+        pkg2 = '    <packagedElement xmi:type="uml:Package" xmi:id="pkg2"'
+        billing = XMI[XMI.index(pkg2):XMI.index("  </uml:Model>")]
+        reordered = XMI.replace(billing, "").replace(pkg1, billing + pkg1)
+        assert hash_xmi(reformatted).digest == hash_xmi(XMI).digest
+        assert hash_xmi(reordered).digest == hash_xmi(XMI).digest
+        swapped = XMI.replace('xmi:id="p1" name="items"', 'xmi:id="p1" name="entries"')
+        assert hash_xmi(swapped).digest != hash_xmi(XMI).digest
+
+    def test_diff_reports_changed_elements(self):
+        changed = (
+            XMI.replace('type="Integer"', 'type="Real"')
+            .replace('<packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>', "")
+            .replace(
+                '<packagedElement xmi:type="uml:Class" xmi:id="c3" name="Invoice"/>',
+                '<packagedElement xmi:type="uml:Class" xmi:id="c3" name="Bill"/>'
+                '<packagedElement xmi:type="uml:Class" xmi:id="c4" name="Payment"/>',
+            )
+        )
+        changes = [str(change) for change in StructuralHasher.diff(hash_xmi(XMI), hash_xmi(changed))]
+        assert changes == [
+            "modified project model_1 (Shop)",
+            "modified property p2 (Shop.Sales.Order.total)",
+            "removed class c2 (Shop.Sales.Item)",
+            "modified class c3 (Shop.Billing.Bill)",
+            "added class c4 (Shop.Billing.Payment)",
+        ]
+        assert StructuralHasher.diff(hash_xmi(XMI), hash_xmi(XMI)) == []
+
+    def test_member_order_changes_class(self):
+        reordered = XMI.replace(
+            '<ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="items" visibility="private" type="c2"/>\n'
+            '        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="total" visibility="public" type="Integer"/>',
+            '<ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="total" visibility="public" type="Integer"/>\n'
+            '        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="items" visibility="private" type="c2"/>',
+        )
+        changes = StructuralHasher.diff(hash_xmi(XMI), hash_xmi(reordered))
+        assert [(change.change, change.kind, change.id) for change in changes] == [("modified", "class", "c1")]
+
+    def test_diff_projects_lists_affected_files(self):
+        changed = (
+            XMI.replace('name="add"', 'name="append"')
+            .replace('supplier="c2"', 'supplier="c1"')
+            .replace('xmi:id="pkg2" name="Billing"', 'xmi:id="pkg2" name="Invoicing"')
+        )
+        with TemporaryDirectory() as tmpdir:
+            old_path = Path(tmpdir) / "old.xmi"
+            new_path = Path(tmpdir) / "new.xmi"
+            old_path.write_text(XMI)
+            new_path.write_text(changed)
+            changes, affected_files = diff_projects(old_path, new_path)
+            assert [(change.change, change.kind, change.id) for change in changes] == [
+                ("modified", "operation", "o1"),
+                ("modified", "relation", "r1"),
+                ("modified", "package", "pkg2"),
+            ]
+            assert affected_files == [
+                Path("Shop/Billing/Invoice.py"),
+                Path("Shop/Invoicing/Invoice.py"),
+                Path("Shop/Sales/Order.py"),
+            ]
+            assert diff_projects(old_path, old_path) == ([], [])
@@ -630,3 +630,85 @@ class TestTemplateManager:
             assert "service1: Service | None = None" in code
             assert "self._service = service" in code
             assert "self._service1 = service1" in code
+
+    def test_generate_class_with_types_given_by_id(self):
+        project = Project(
+            id="p1",
+            name="TestProject",
+            packages=[
+                Package(
+                    id="pkg1",
+                    name="Test",
+                    subpackages=[],
+                    classes=[
+                        Class(
+                            id="c1",
+                            name="Order",
+                            properties=[
+                                Property(id="p1", name="item", type="c2", visibility=Visibility.PUBLIC),
+                                Property(id="p2", name="label", type="prim1", visibility=Visibility.PUBLIC),
+                            ],
+                            operations=[
+                                Operation(
+                                    id="o1",
+                                    name="total",
+                                    parameters=[
+                                        Parameter(id="par1", name="", type="prim2", direction=ParameterDirection.RETURN),
+                                    ],
+                                    visibility=Visibility.PUBLIC,
+                                )
+                            ],
+                        ),
+                        Class(id="c2", name="Item", properties=[], operations=[]),
+                        Class(id="c3", name="Entity", properties=[], operations=[]),
+                    ],
+                    dependencies=[],
+                    data_types=[],
+                )
+            ],
+            types={"c1": "Order", "c2": "Item", "c3": "Entity", "prim1": "String", "prim2": "Float"},
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir) / "output"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            manager = TemplateManager(project, output_dir)
+
+            relations = [Relation(id="r1", name="gen", type=RelationType.GENERALIZATION, client="c1", supplier="c3")]
+            code = manager.generate_class(project.packages[0].classes[0], relations)
+
+            assert "class Order(Entity):" in code
+            assert "def __init__(self, item: Item, label: str):" in code
+            assert "def total(self) -> float:" in code
+            assert "from output.TestProject.Test.Item import Item" in code
+            assert "from output.TestProject.Test.Entity import Entity" in code
+
+    def test_render_cache_reuses_same_shaped_classes(self):
+        def make_class(class_id: str, name: str, property_type: str = "String") -> Class:
+            return Class(
+                id=class_id,
+                name=name,
+                properties=[Property(id=f"{class_id}p", name="value", type=property_type, visibility=Visibility.PUBLIC)],
+                operations=[],
+            )
+
+        classes = [make_class("c1", "First"), make_class("c2", "Second"), make_class("c3", "Third", "Integer")]
+        project = Project(
+            id="p1",
+            name="TestProject",
+            packages=[Package(id="pkg1", name="Test", subpackages=[], classes=classes, dependencies=[], data_types=[])],
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            manager = TemplateManager(project, Path(temp_dir), render_cache_size=1)
+            first, second, third = (manager.generate_class(class_syntax, []) for class_syntax in classes)
+            assert manager.cache_stats() == {"hits": 1, "misses": 2, "size": 1}
+            assert second == first.replace("class First:", "class Second:")
+            assert "value: int" in third
+
+            manager.generate_class(classes[0], [])
+            assert manager.cache_stats() == {"hits": 1, "misses": 3, "size": 1}
+
+            uncached = TemplateManager(project, Path(temp_dir), render_cache_size=0)
+            assert uncached.generate_class(classes[1], []) == second
+            assert uncached.cache_stats() == {"hits": 0, "misses": 0, "size": 0}
@@ -0,0 +1,70 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.exceptions import InvalidTypeMapping
+from project_generator.ModelValidator import ModelValidator
+from project_generator.TypeMapping import TypeMapping
+
+
+class TestTypeMapping:
+    def test_plain_types(self):
+        type_mapping = TypeMapping()
+        assert type_mapping.python_type("Integer") == "int"
+        assert type_mapping.python_type("Boolean") == "bool"
+        assert type_mapping.python_type("Real") == "float"
+        assert type_mapping.python_type("Item") == "Item"
+        assert type_mapping.referenced_classes("Integer") == ()
+        assert type_mapping.referenced_classes("int") == ()
+        assert type_mapping.referenced_classes("Item") == ("Item",)
+
+    def test_generic_types(self):
+        type_mapping = TypeMapping()
+        assert type_mapping.python_type("List<Item>") == "list[Item]"
+        assert type_mapping.python_type("Map<String, List<Item>>") == "dict[str, list[Item]]"
+        assert type_mapping.python_type("Box<Integer>") == "Box[int]"
+        assert type_mapping.referenced_classes("Map<Item, List<Item>>") == ("Item",)
+        assert type_mapping.referenced_classes("Box<Item>") == ("Box", "Item")
+        with pytest.raises(InvalidTypeMapping):
+            type_mapping.python_type("Map<String>")
+
+    def test_custom_mappings(self):
+        type_mapping = TypeMapping({"Integer": "numpy.int64", "Optional<T>": "T | None"})
+        assert type_mapping.python_type("Optional<Integer>") == "numpy.int64 | None"
+        assert type_mapping.python_type("String") == "str"
+        with pytest.raises(InvalidTypeMapping):
+            TypeMapping({"Pair<1>": "tuple"})
+
+    def test_load(self):
+        with TemporaryDirectory() as tmpdir:
+            toml_path = Path(tmpdir) / "types.toml"
+            toml_path.write_text('[types]\nMoney = "decimal.Decimal"\n"Seq<T>" = "tuple[T, ...]"\n')
+            type_mapping = TypeMapping.load(toml_path)
+            assert type_mapping.python_type("Seq<Money>") == "tuple[decimal.Decimal, ...]"
+
+            json_path = Path(tmpdir) / "types.json"
+            json_path.write_text('{"types": {"Money": "int"}}')
+            assert TypeMapping.load(json_path).python_type("Money") == "int"
+
+            json_path.write_text('{"types": ["Money"]}')
+            with pytest.raises(InvalidTypeMapping):
+                TypeMapping.load(json_path)
+            toml_path.write_text("[types\n")
+            with pytest.raises(InvalidTypeMapping):
+                TypeMapping.load(toml_path)
+
+    def test_validator_resolves_mapped_types(self):
+        xmi = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Main">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="items" visibility="private" type="List&lt;Order&gt;"/>
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p2" name="total" visibility="private" type="Money"/>
+      </packagedElement>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>""".encode()
+        assert [problem.element_id for problem in ModelValidator.validate(xmi)] == ["p2"]
+        assert ModelValidator.validate(xmi, TypeMapping({"Money": "int"})) == []
@@ -0,0 +1,73 @@
+import gzip
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.exceptions import (
+    NoElement,
+    UnindexableXmi
+)
+from project_generator.syntax import (
+    Class,
+    Relation,
+    RelationType
+)
+from project_generator.XmiIndex import XmiIndex
+from project_generator.XmiParser import XmiParser
+
+XMI = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="Shop">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Sales">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="item" visibility="private">
+          <type xmi:idref="c2"/>
+        </ownedAttribute>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Class" xmi:id="c2" name="Item"/>
+      <packagedElement xmi:type="uml:Association" xmi:id="r1" name="assoc" client="c1" supplier="c2"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+class TestXmiIndex:
+    def test_parse_element(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi"
+            xmi_path.write_text(XMI)
+            package = XmiParser.parse(xmi_path).packages[0]
+
+            assert XmiParser.parse_element(xmi_path, "pkg1") == package
+            assert XmiParser.parse_element(xmi_path, "c2") == Class("c2", "Item", [], [])
+            assert XmiParser.parse_element(xmi_path, "p1") == package.classes[0].properties[0]
+            assert XmiParser.parse_element(xmi_path, "r1") == Relation("r1", "assoc", RelationType.ASSOCIATION, "c1", "c2")
+            assert XmiIndex.index_path(xmi_path).exists()
+            with pytest.raises(NoElement):
+                XmiParser.parse_element(xmi_path, "missing")
+
+    def test_stale_index_is_rebuilt(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi"
+            xmi_path.write_text(XMI)
+            index = XmiIndex.load(xmi_path)
+            assert "c1" in index and "model_1" in index
+
+            # Same content with a new modification time keeps the stored ranges
+            os.utime(xmi_path, ns=(0, 1))
+            assert XmiIndex.load(xmi_path).mtime_ns == 1
+            assert XmiIndex.read(XmiIndex.index_path(xmi_path)).mtime_ns == 1
+
+            # Same size, different content
+            xmi_path.write_text(XMI.replace('"c2"', '"c9"'))
+            os.utime(xmi_path, ns=(0, 2))
+            assert XmiParser.parse_element(xmi_path, "c9").name == "Item"
+
+    def test_compressed_file_cannot_be_indexed(self):
+        with TemporaryDirectory() as tmpdir:
+            xmi_path = Path(tmpdir) / "model.xmi.gz"
+            xmi_path.write_bytes(gzip.compress(XMI.encode()))
+            with pytest.raises(UnindexableXmi):
+                XmiIndex.load(xmi_path)
@@ -206,3 +206,25 @@ class TestXmiParserExtended:
             assert "Class1" in class_names
             assert "Class2" in class_names
             assert "Class3" in class_names
+
+    def test_parse_type_table(self):
+        xmi_content = """<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:PrimitiveType" xmi:id="prim1" name="String"/>
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Test">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Order">
+        <ownedAttribute xmi:type="uml:Property" xmi:id="p1" name="label" visibility="public" type="prim1"/>
+      </packagedElement>
+      <packagedElement xmi:type="uml:Package" xmi:id="pkg2" name="Nested">
+        <packagedElement xmi:type="uml:DataType" xmi:id="d1" name="Money"/>
+        <packagedElement xmi:type="uml:Enumeration" xmi:id="e1" name="Status"/>
+      </packagedElement>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+        project = XmiParser.parse(xmi_content.encode())
+
+        assert project.types == {"prim1": "String", "c1": "Order", "d1": "Money", "e1": "Status"}
+        assert project.packages[0].classes[0].properties[0].type == "prim1"
@@ -0,0 +1,94 @@
+import bz2
+import gzip
+import io
+import lzma
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from project_generator.exceptions import NoXmiInArchive
+from project_generator.XmiParser import XmiParser
+from project_generator.XmiSource import XmiSource
+
+XMI_CONTENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<xmi:XMI xmi:version="2.1" xmlns:uml="http://schema.omg.org/spec/UML/2.1" xmlns:xmi="http://schema.omg.org/spec/XMI/2.1">
+  <uml:Model xmi:type="uml:Model" xmi:id="model_1" name="TestProject">
+    <packagedElement xmi:type="uml:Package" xmi:id="pkg1" name="Test">
+      <packagedElement xmi:type="uml:Class" xmi:id="c1" name="Class1"/>
+    </packagedElement>
+  </uml:Model>
+</xmi:XMI>"""
+
+
+def zip_bytes(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class TestXmiSource:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            XMI_CONTENT,
+            gzip.compress(XMI_CONTENT),
+            bz2.compress(XMI_CONTENT),
+            lzma.compress(XMI_CONTENT),
+            zip_bytes({"readme.txt": b"", "export/model.xmi": XMI_CONTENT}),
+        ],
+        ids=["plain", "gzip", "bz2", "xz", "zip"],
+    )
+    def test_parse_compressed_file(self, content):
+        with TemporaryDirectory() as temp_dir:
+            xmi_path = Path(temp_dir) / "model.bin"
+            xmi_path.write_bytes(content)
+
+            project = XmiParser.parse(xmi_path)
+
+            assert project.name == "TestProject"
+            assert project.packages[0].classes[0].name == "Class1"
+
+    def test_parse_file_like_object(self):
+        project = XmiParser.parse(io.BytesIO(gzip.compress(XMI_CONTENT)))
+
+        assert project.packages[0].classes[0].name == "Class1"
+
+    def test_open_zip_member(self):
+        archive = zip_bytes({"a.xmi": b"first", "b.xmi": XMI_CONTENT})
+
+        with XmiSource.open(io.BytesIO(archive), member="b.xmi") as stream:
+            assert stream.read() == XMI_CONTENT
+
+    def test_zip_without_xmi(self):
+        with pytest.raises(NoXmiInArchive):
+            with XmiSource.open(io.BytesIO(zip_bytes({"readme.txt": b""}))):
+                pass
+
+    @pytest.mark.parametrize("compress", [lambda data: data, gzip.compress], ids=["plain", "gzip"])
+    def test_parse_mapping(self, compress):
+        with TemporaryDirectory() as temp_dir:
+            xmi_path = Path(temp_dir) / "model.xmi"
+            xmi_path.write_bytes(compress(XMI_CONTENT))
+
+            with XmiSource.map(xmi_path) as mapping:
+                project = XmiParser.parse(mapping)
+
+            assert project.packages[0].classes[0].name == "Class1"
+
+    def test_map_empty_file(self):
+        with TemporaryDirectory() as temp_dir:
+            xmi_path = Path(temp_dir) / "empty.xmi"
+            xmi_path.write_bytes(b"")
+
+            with XmiSource.map(xmi_path) as mapping:
+                assert mapping == b""
+
+    @pytest.mark.parametrize("compress", [lambda data: data, gzip.compress], ids=["plain", "gzip"])
+    def test_parse_bytes(self, compress):
+        project = XmiParser.parse(compress(XMI_CONTENT))
+
+        assert project.packages[0].classes[0].name == "Class1"